@@ -0,0 +1,54 @@
+import argparse
+import json
+import time
+from pathlib import Path
+
+from src.backtest.data import load_csv_dir, load_history
+from src.backtest.engine import BacktestEngine
+from src.config.trading_config import TradingConfig
+from src.strategies.base import TradingStrategy
+from src.utils.logger import setup_logger
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="저장된 캔들로 전략 백테스트")
+    parser.add_argument('--strategy', default=TradingStrategy.HEIKIN_ASHI.value,
+                        choices=[s.value for s in TradingStrategy])
+    parser.add_argument('--data-dir', default='data', help="{티커}_{간격}.csv 파일 위치")
+    parser.add_argument('--history-dir', help="download.py로 받은 캔들 저장소 (지정하면 CSV 대신 사용)")
+    parser.add_argument('--interval', default='minute1', help="기준봉 간격")
+    parser.add_argument('--tickers', nargs='*', help="대상 티커 (기본: config.yaml 전체)")
+    parser.add_argument('--initial-krw', type=float, default=4000000)
+    parser.add_argument('--output', default='logs/backtest', help="결과 저장 디렉터리")
+    return parser.parse_args()
+
+def main():
+    """백테스트 실행"""
+    args = parse_args()
+    setup_logger('logs/backtest.log')
+    config = TradingConfig()
+    tickers = args.tickers or config.get_ticker_list()
+
+    if args.history_dir:
+        data = load_history(Path(args.history_dir), tickers, args.interval)
+    else:
+        data = load_csv_dir(Path(args.data_dir), tickers, args.interval)
+    if not data:
+        print(f"캔들 데이터가 없습니다: {args.history_dir or args.data_dir}")
+        return
+
+    engine = BacktestEngine(config.trade_settings, config.coin_settings,
+                            TradingStrategy(args.strategy), initial_krw=args.initial_krw)
+    started = time.perf_counter()
+    result = engine.run(data)
+    elapsed = time.perf_counter() - started
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    result.trades_frame().to_csv(output / 'trades.csv', index=False)
+    result.equity_frame().to_csv(output / 'equity.csv')
+    summary = dict(result.summary(), elapsed_sec=elapsed, bars=sum(len(s) for s in data.values()))
+    (output / 'summary.json').write_text(json.dumps(summary, indent=2, ensure_ascii=False))
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from src.benchmark.suite import compare, run_suite
+from src.strategies.base import TradingStrategy
+from src.utils.logger import setup_logger
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="거래 사이클/지표 계산 벤치마크 (모의 업비트 사용)")
+    parser.add_argument('--strategy', default=TradingStrategy.COMBINED.value,
+                        choices=[s.value for s in TradingStrategy])
+    parser.add_argument('--mode', default='sync', choices=['sync', 'async'])
+    parser.add_argument('--coins', type=int, nargs='+', default=[3, 30, 200],
+                        help="측정할 코인 수")
+    parser.add_argument('--cycles', type=int, default=5, help="코인 수별 측정 사이클 수")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: benchmarks/<revision>.json)")
+    parser.add_argument('--compare', metavar='BASE_JSON', help="비교할 이전 결과")
+    parser.add_argument('--threshold', type=float, default=0.1, help="회귀 판단 변화율")
+    return parser.parse_args()
+
+def main():
+    """벤치마크 실행 후 결과 저장, 이전 결과와 비교"""
+    args = parse_args()
+    setup_logger('logs/benchmark.log')
+    result = run_suite(TradingStrategy(args.strategy), args.coins, args.cycles, args.mode)
+
+    output = Path(args.output or f"benchmarks/{result['meta']['revision'] or 'latest'}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+
+    for count, r in result['cycles'].items():
+        print(f"코인 {count:>4}개 - 사이클 {r['cycle']['mean_ms']:8.1f}ms "
+              f"(첫 사이클 {r['cold_cycle_ms']:8.1f}ms), API {r['api_calls_per_cycle']:5.1f}회/사이클, "
+              f"요청 한도 하한 {r['rate_limit_floor_ms']:7.0f}ms, "
+              f"티커당 메모리 {r['memory_per_ticker_bytes'] / 1024:6.1f}KB")
+    for name, value in {**result['indicators'], **result['strategy']}.items():
+        print(f"{name}: {value:,.0f}")
+    print(f"결과 저장 -> {output}")
+
+    if args.compare:
+        base = json.loads(Path(args.compare).read_text())
+        rows = compare(base, result, args.threshold)
+        regressions = [r for r in rows if r['regression']]
+        for r in rows:
+            mark = " <- 회귀" if r['regression'] else ""
+            print(f"{r['metric']}: {r['base']:.4g} -> {r['current']:.4g} ({r['change']:+.1%}){mark}")
+        print(f"회귀 {len(regressions)}건 (기준 {args.threshold:.0%}, 비교 대상 {base['meta'].get('revision')})")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
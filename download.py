@@ -0,0 +1,39 @@
+import argparse
+import time
+
+from src.config.trading_config import TradingConfig
+from src.data.candle_store import now_kst
+from src.data.history import HistoryDownloader, HistoryStore
+from src.exchange.upbit import UpbitExchange
+from src.utils.logger import setup_logger
+
+def parse_args(config: TradingConfig) -> argparse.Namespace:
+    settings = config.history_settings
+    parser = argparse.ArgumentParser(description="업비트 과거 캔들 일괄 수집 (중단 후 재실행하면 이어서 수집)")
+    parser.add_argument('--tickers', nargs='*', help="대상 티커 (기본: config.yaml 전체)")
+    parser.add_argument('--intervals', nargs='+', default=list(settings.intervals))
+    parser.add_argument('--days', type=int, default=settings.days, help="수집 기간 (일)")
+    parser.add_argument('--workers', type=int, default=settings.workers, help="동시 수집 작업 수")
+    parser.add_argument('--output', default=settings.path or 'data/history', help="저장 디렉터리")
+    return parser.parse_args()
+
+def main():
+    """설정된 티커/간격의 과거 캔들 수집"""
+    config = TradingConfig()
+    args = parse_args(config)
+    setup_logger('logs/download.log')
+    tickers = args.tickers or config.get_ticker_list()
+
+    store = HistoryStore(args.output)
+    downloader = HistoryDownloader(UpbitExchange(), store, workers=args.workers)
+    started = time.perf_counter()
+    added = downloader.download(tickers, args.intervals, now_kst() - args.days * 86400)
+    elapsed = time.perf_counter() - started
+
+    for (ticker, interval), count in added.items():
+        meta = store.meta(ticker, interval)
+        print(f"{ticker:12s} {interval:10s} +{count:>9,}봉  (총 {meta['rows']:,}봉)")
+    print(f"완료 - {sum(added.values()):,}봉, {elapsed:.1f}초 -> {args.output}")
+
+if __name__ == "__main__":
+    main()
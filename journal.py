@@ -0,0 +1,52 @@
+import argparse
+from datetime import date
+
+from src.config.trading_config import TradingConfig
+from src.utils.journal import load_events
+
+def parse_args(config: TradingConfig) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="이벤트 기록(신호/주문/체결/사이클) 하루치 요약")
+    parser.add_argument('--day', type=date.fromisoformat, default=date.today(),
+                        help="조회 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument('--path', default=config.journal_settings.path or 'logs/journal',
+                        help="이벤트 기록 디렉터리")
+    parser.add_argument('--source', help="파일 이름 접두사 (live, paper, paper_w0 ...)")
+    parser.add_argument('--kind', nargs='*', help="이벤트 종류 (기본: 전체)")
+    parser.add_argument('--csv', help="조회한 이벤트를 CSV로 저장")
+    return parser.parse_args()
+
+def main():
+    """하루치 이벤트를 읽어 종류별 요약 출력"""
+    args = parse_args(TradingConfig())
+    df = load_events(args.path, args.day, args.kind, args.source)
+    if df.empty:
+        print(f"{args.day} 이벤트 없음 ({args.path})")
+        return
+
+    print(f"{args.day} 이벤트 {len(df):,}건")
+    print(df.groupby(['source', 'kind']).size().to_string())
+
+    cycles = df[df['kind'] == 'cycle']
+    if not cycles.empty:
+        print("\n사이클 소요 시간 (ms)")
+        milliseconds = cycles['seconds'] * 1000
+        print(milliseconds.groupby(cycles['mode']).describe(percentiles=[0.5, 0.95, 0.99])
+              .round(1).to_string())
+    orders = df[df['kind'] == 'order']
+    if not orders.empty:
+        print("\n주문")
+        summary = orders.groupby(['side', 'ok']).agg(count=('seconds', 'size'),
+                                                     mean_ms=('seconds', 'mean'))
+        summary['mean_ms'] = (summary['mean_ms'] * 1000).round(1)
+        print(summary.to_string())
+    fills = df[df['kind'] == 'fill']
+    if not fills.empty:
+        print("\n체결")
+        print(fills.groupby(['ticker', 'side'])[['volume', 'funds', 'fee']].sum().to_string())
+
+    if args.csv:
+        df.to_csv(args.csv)
+        print(f"\n저장 -> {args.csv}")
+
+if __name__ == "__main__":
+    main()
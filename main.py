@@ -1,10 +1,45 @@
+import argparse
+
 from src.strategies.base import TradingStrategy
 from src.trading.bot import TradingBot
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="업비트 자동매매 봇")
+    parser.add_argument('--strategy', default=TradingStrategy.HEIKIN_ASHI.value,
+                        choices=[s.value for s in TradingStrategy])
+    parser.add_argument('--mode', default='sync', choices=['sync', 'async', 'stream', 'supervisor'],
+                        help="sync: 기존 순차 루프, async: asyncio 동시 평가 루프, "
+                             "stream: WebSocket 실시간 시세 기반 평가, "
+                             "supervisor: 티커를 나눠 여러 워커 프로세스로 실행")
+    parser.add_argument('--ws-url', help="stream 모드 WebSocket 주소 (재생 서버 테스트용, --paper와 함께 쓸 수 없음)")
+    parser.add_argument('--paper', action='store_true',
+                        help="모의 거래소로 실행 (config.yaml의 paper 설정 사용)")
+    parser.add_argument('--workers', type=int,
+                        help="supervisor 모드 워커 프로세스 수 (기본: config.yaml의 supervisor.workers)")
+    args = parser.parse_args()
+    if args.paper and args.ws_url:
+        # 모의 체결은 모의 거래소 시세로 하므로 외부 시세와 섞이면 판단 가격과 체결 가격이 어긋남
+        parser.error("--paper는 모의 거래소 시세로 구동하므로 --ws-url을 지정할 수 없습니다 "
+                     "(녹화 시세는 config.yaml의 paper.replay 사용)")
+    return args
+
 def main():
     """프로그램 시작점"""
-    strategy = TradingStrategy.HEIKIN_ASHI
-    bot = TradingBot(strategy)
+    args = parse_args()
+    strategy = TradingStrategy(args.strategy)
+    if args.mode == 'stream':
+        from src.data.stream import UPBIT_WEBSOCKET_URL
+        from src.trading.stream_bot import StreamingTradingBot
+        bot = StreamingTradingBot(strategy, url=args.ws_url or UPBIT_WEBSOCKET_URL,
+                                  paper=args.paper)
+    elif args.mode == 'supervisor':
+        from src.trading.supervisor import Supervisor
+        bot = Supervisor(strategy, paper=args.paper, workers=args.workers)
+    elif args.mode == 'async':
+        from src.trading.async_bot import AsyncTradingBot
+        bot = AsyncTradingBot(strategy, paper=args.paper)
+    else:
+        bot = TradingBot(strategy, paper=args.paper)
     bot.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+import argparse
+import time
+from pathlib import Path
+
+from src.backtest.data import load_csv_dir, load_history
+from src.backtest.optimizer import COIN_PARAMS, ParameterSweep, build_grid, check_params, parse_values
+from src.config.trading_config import TradingConfig
+from src.strategies.base import TradingStrategy
+from src.strategies.factory import strategy_class
+from src.utils.logger import setup_logger
+
+def parse_args() -> argparse.Namespace:
+    strategy_params = ' / '.join(f"{s.value}({', '.join(strategy_class(s).PARAMS)})"
+                                 for s in TradingStrategy)
+    parser = argparse.ArgumentParser(
+        description="코인 익절/손절 설정과 전략 파라미터 병렬 최적화",
+        epilog=f"코인 파라미터: {', '.join(COIN_PARAMS)} / 전략 파라미터: {strategy_params}")
+    parser.add_argument('--strategy', default=TradingStrategy.VOLATILITY.value,
+                        choices=[s.value for s in TradingStrategy])
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUES',
+                        help="예: take_profit=1.0:3.0:0.5, k=0.3,0.5,0.7")
+    parser.add_argument('--samples', type=int, help="랜덤 서치 조합 수 (기본: 전체 그리드)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--coins', nargs='*', help="설정을 바꿀 코인 (기본: 전체)")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--history-dir', help="download.py로 받은 캔들 저장소 (지정하면 CSV 대신 사용)")
+    parser.add_argument('--interval', default='minute1', help="기준봉 간격")
+    parser.add_argument('--initial-krw', type=float, default=4000000)
+    parser.add_argument('--metric', default='total_return', help="정렬 기준 지표")
+    parser.add_argument('--processes', type=int, help="워커 프로세스 수 (기본: 전체 코어)")
+    parser.add_argument('--output', default='logs/optimize_results.csv')
+    return parser.parse_args()
+
+def main():
+    """파라미터 스윕 실행"""
+    args = parse_args()
+    setup_logger('logs/optimize.log')
+    config = TradingConfig()
+
+    space = {}
+    for spec in args.param:
+        name, values = spec.split('=', 1)
+        space[name.strip()] = parse_values(values)
+    try:
+        check_params(space, TradingStrategy(args.strategy))
+    except ValueError as e:
+        print(e)
+        return
+    combos = build_grid(space, args.samples, args.seed)
+
+    if args.history_dir:
+        data = load_history(Path(args.history_dir), config.get_ticker_list(), args.interval)
+    else:
+        data = load_csv_dir(Path(args.data_dir), config.get_ticker_list(), args.interval)
+    if not data:
+        print(f"캔들 데이터가 없습니다: {args.history_dir or args.data_dir}")
+        return
+
+    sweep = ParameterSweep(config.trade_settings, config.coin_settings,
+                           TradingStrategy(args.strategy), initial_krw=args.initial_krw,
+                           coins=args.coins, processes=args.processes)
+    started = time.perf_counter()
+    results = sweep.run(data, combos, metric=args.metric)
+    elapsed = time.perf_counter() - started
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    results.to_csv(output, index=False)
+    print(f"{len(combos)}개 조합 완료 ({elapsed:.1f}초, 프로세스 {sweep.processes}개) -> {output}")
+    print(results.head(10).to_string())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pyupbit import request_api
+from pyupbit.errors import RemainingReqParsingError
+from src.api.transport import get_transport
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+# 업비트 요청 그룹별 초당 허용 횟수 (Remaining-Req 헤더의 group 이름 기준)
+RATE_LIMITS: Dict[str, float] = {
+    'market': 10,      # 시세 - 마켓 코드
+    'candles': 10,     # 시세 - 캔들
+    'crix-trades': 10, # 시세 - 체결
+    'ticker': 10,      # 시세 - 현재가
+    'orderbook': 10,   # 시세 - 호가
+    'default': 30,     # 거래 - 잔고/주문 조회
+    'order': 8,        # 거래 - 주문 생성
+}
+
+CALL_SECONDS = get_metrics().histogram('upbit_call_seconds', "게이트웨이 경유 업비트 호출 소요 시간 (대기/재시도 포함, 초)")
+WAIT_SECONDS = get_metrics().histogram('upbit_gateway_wait_seconds', "요청 한도 대기 시간 (초)")
+THROTTLED = get_metrics().counter('upbit_throttled_total', "429 응답 수")
+CALL_ERRORS = get_metrics().counter('upbit_call_errors_total', "예외로 끝난 업비트 호출 수")
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+    CRITICAL = 0  # 주문, 손절
+    NORMAL = 1    # 현재가, 호가, 잔고
+    LOW = 2       # 지표용 캔들 갱신
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 버킷 (capacity: 최대 연속 요청 수)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개 사용 - 사용했으면 0, 아니면 다음 토큰까지 대기 시간(초) 반환"""
+        if now < self.paused_until:
+            return self.paused_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def observe(self, remaining: int, now: float) -> None:
+        """서버가 알려준 남은 요청 수로 토큰 보정"""
+        self._refill(now)
+        self.tokens = min(self.tokens, remaining)
+        if remaining <= 0:
+            self.pause(1.0 / self.rate, now)
+
+    def pause(self, seconds: float, now: float) -> None:
+        """seconds초 동안 요청 중지"""
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = max(self.updated, self.paused_until)
+
+class _ObservedRequests:
+    """
+    pyupbit가 사용하는 requests 모듈 대리 객체
+    - 요청은 공용 HTTP 전송 계층(커넥션 풀)으로 보냄
+    - 모든 응답의 Remaining-Req 헤더와 429 여부를 게이트웨이에 전달
+    """
+
+    def __init__(self, gateway: 'RequestGateway', backend):
+        self.gateway = gateway
+        self.backend = backend
+
+    def get(self, url: str, **kwargs):
+        return self._observe(self.backend.get(url, **kwargs))
+
+    def post(self, url: str, **kwargs):
+        return self._observe(self.backend.post(url, **kwargs))
+
+    def delete(self, url: str, **kwargs):
+        return self._observe(self.backend.delete(url, **kwargs))
+
+    def _observe(self, resp):
+        self.gateway.observe(resp.status_code, resp.headers.get('Remaining-Req', ''))
+        return resp
+
+    def __getattr__(self, name: str):
+        return getattr(self.backend, name)
+
+class RequestGateway:
+    """
+    모든 업비트 REST 호출이 거쳐가는 요청 스케줄러
+    - 요청 그룹별 토큰 버킷으로 허용 한도까지 요청
+    - 응답의 Remaining-Req 헤더로 버킷을 보정
+    - 그룹 안에서는 우선순위가 높은 요청부터 토큰을 받음
+    - 429 응답 시 그룹 전체를 잠시 멈추고 지수 백오프로 재시도
+    """
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None,
+                 max_retries: int = 4, backoff: float = 0.25):
+        self.logger = get_logger(__name__)
+        self.buckets: Dict[str, TokenBucket] = {
+            group: TokenBucket(rate) for group, rate in (limits or RATE_LIMITS).items()
+        }
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats: Dict[str, Dict[str, float]] = {
+            group: {'calls': 0, 'throttled': 0, 'wait': 0.0} for group in self.buckets
+        }
+        self._cond = threading.Condition()
+        self._waiting: Dict[str, List[Tuple[int, int]]] = {group: [] for group in self.buckets}
+        self._seq = itertools.count()
+        self._local = threading.local()
+
+    def install(self) -> None:
+        """pyupbit의 HTTP 호출을 관찰하도록 연결"""
+        if not isinstance(request_api.requests, _ObservedRequests):
+            request_api.requests = _ObservedRequests(self, get_transport())
+
+    def share(self, processes: int) -> None:
+        """여러 프로세스가 같은 계정/IP 한도를 나눠 쓸 때 그룹별 초당 허용 횟수를 1/processes로 줄임"""
+        with self._cond:
+            for bucket in self.buckets.values():
+                bucket.rate /= processes
+
+    def call(self, group: str, func: Callable, *args: Any,
+             priority: Priority = Priority.NORMAL, **kwargs: Any) -> Any:
+        """
+        요청 한도 안에서 pyupbit 함수 실행
+        :param group: 요청 그룹 (RATE_LIMITS 키)
+        :param priority: 요청 우선순위
+        """
+        with CALL_SECONDS.time(group=group):
+            try:
+                return self._call(group, func, args, kwargs, priority)
+            except Exception:
+                CALL_ERRORS.inc(group=group)
+                raise
+
+    def _call(self, group: str, func: Callable, args, kwargs, priority: Priority) -> Any:
+        """429 응답이면 백오프 후 재시도"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire(group, priority)
+            self._local.throttled = False
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                if not self._local.throttled or attempt == self.max_retries:
+                    raise
+                result = None
+            if not self._local.throttled:
+                return result
+
+            delay = self.backoff * 2 ** attempt
+            with self._cond:
+                self.buckets[group].pause(delay, time.monotonic())
+                self.stats[group]['throttled'] += 1
+            THROTTLED.inc(group=group)
+            if attempt < self.max_retries:
+                self.logger.warning(f"요청 한도 초과(429) - {group}, {delay:.2f}초 후 재시도 "
+                                    f"({attempt + 1}/{self.max_retries})")
+        self.logger.error(f"요청 한도 초과 재시도 실패 - {group}")
+        return result
+
+    def acquire(self, group: str, priority: Priority = Priority.NORMAL) -> None:
+        """우선순위 순서대로 그룹 토큰 1개를 받을 때까지 대기"""
+        bucket = self.buckets[group]
+        waiting = self._waiting[group]
+        entry = (int(priority), next(self._seq))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(waiting, entry)
+            try:
+                while True:
+                    timeout = None
+                    if waiting[0] == entry:
+                        timeout = bucket.reserve(time.monotonic())
+                        if timeout <= 0:
+                            break
+                    self._cond.wait(timeout)
+            finally:
+                waiting.remove(entry)
+                heapq.heapify(waiting)
+                self.stats[group]['calls'] += 1
+                self.stats[group]['wait'] += time.monotonic() - started
+                WAIT_SECONDS.observe(time.monotonic() - started, group=group)
+                self._cond.notify_all()
+
+    def observe(self, status_code: int, remaining_req: str) -> None:
+        """HTTP 응답 1건의 요청 한도 정보 반영"""
+        if status_code == 429:
+            self._local.throttled = True
+        if not remaining_req:
+            return
+        try:
+            limit = request_api._parse(remaining_req)
+        except RemainingReqParsingError:
+            return
+        bucket = self.buckets.get(limit['group'])
+        if bucket is not None:
+            with self._cond:
+                bucket.observe(limit['sec'], time.monotonic())
+
+_gateway: Optional[RequestGateway] = None
+_gateway_lock = threading.Lock()
+
+def get_gateway() -> RequestGateway:
+    """
+    프로세스 공용 요청 게이트웨이 반환 (최초 호출 시 생성)
+    :return: 게이트웨이 인스턴스
+    """
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = RequestGateway()
+            _gateway.install()
+        return _gateway
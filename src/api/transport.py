@@ -0,0 +1,159 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from src.config.trading_config import HttpSettings
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)  # 지연 히스토그램 구간 상한 (ms)
+
+HTTP_SECONDS = get_metrics().histogram('upbit_http_request_seconds', "업비트 HTTP 요청 지연 (초)")
+HTTP_ERRORS = get_metrics().counter('upbit_http_errors_total', "업비트 HTTP 요청 실패 수")
+
+class LatencyHistogram:
+    """요청 지연 히스토그램 (구간별 건수)"""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위가 속한 구간의 상한 (ms, 마지막 구간은 inf)"""
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def format(self) -> str:
+        labels = [f"≤{b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return ", ".join(f"{label}: {count}" for label, count in zip(labels, self.counts) if count)
+
+class HttpTransport:
+    """
+    pyupbit 공용 HTTP 전송 계층
+    - keep-alive 커넥션 풀을 쓰는 requests.Session 하나를 모든 컴포넌트가 공유
+    - 모든 요청에 기본 타임아웃 적용
+    - 신규 연결 수와 요청 지연 히스토그램을 주기적으로 로그에 기록
+    """
+
+    def __init__(self, settings: Optional[HttpSettings] = None):
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self.session: Optional[requests.Session] = None
+        self.configure(settings or HttpSettings())
+
+    def configure(self, settings: HttpSettings) -> None:
+        """설정으로 세션과 커넥션 풀 재생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=settings.pool_connections,
+                              pool_maxsize=settings.pool_maxsize,
+                              max_retries=settings.max_retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        with self._lock:
+            old, self.session = self.session, session
+            self.settings = settings
+            self.adapter = adapter
+            self.histogram = LatencyHistogram()
+            self.by_path: Dict[str, LatencyHistogram] = {}
+            self.errors = 0
+            self._last_report = time.monotonic()
+        if old is not None:
+            old.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request('DELETE', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """세션으로 요청하고 지연 시간 기록"""
+        kwargs.setdefault('timeout', (self.settings.connect_timeout, self.settings.read_timeout))
+        path = url.split('?', 1)[0].split('/v1/', 1)[-1]
+        started = time.perf_counter()
+        try:
+            resp = self.session.request(method, url, **kwargs)
+            if resp.status_code >= 400:
+                HTTP_ERRORS.inc(path=path, status=resp.status_code)
+            return resp
+        except requests.RequestException as e:
+            with self._lock:
+                self.errors += 1
+            HTTP_ERRORS.inc(path=path, status=type(e).__name__)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_SECONDS.observe(elapsed, method=method, path=path)
+            self._record(path, elapsed * 1000)
+
+    def _record(self, path: str, ms: float) -> None:
+        with self._lock:
+            self.histogram.add(ms)
+            self.by_path.setdefault(path, LatencyHistogram()).add(ms)
+            due = time.monotonic() - self._last_report >= self.settings.report_interval
+            if due:
+                self._last_report = time.monotonic()
+        if due:
+            self.report()
+
+    def connection_stats(self) -> Dict[str, int]:
+        """커넥션 풀 통계 (신규 연결 수, 풀을 거친 요청 수)"""
+        container = self.adapter.poolmanager.pools
+        pools = [container[key] for key in container.keys()]
+        return {
+            'pools': len(pools),
+            'connections': sum(pool.num_connections for pool in pools),
+            'requests': sum(pool.num_requests for pool in pools),
+        }
+
+    def report(self) -> None:
+        """연결 수와 지연 히스토그램 로그 기록"""
+        with self._lock:
+            histogram = self.histogram
+            by_path = dict(self.by_path)
+            errors = self.errors
+        if not histogram.total:
+            return
+        stats = self.connection_stats()
+        self.logger.info(
+            f"HTTP 요청 {histogram.total}건 - 신규 연결 {stats['connections']}개 "
+            f"(풀 {stats['pools']}개), 실패 {errors}건, "
+            f"평균 {histogram.sum_ms / histogram.total:.1f}ms, "
+            f"p50≤{histogram.percentile(0.5)}ms, p99≤{histogram.percentile(0.99)}ms"
+        )
+        self.logger.info(f"HTTP 지연 분포(ms) - {histogram.format()}")
+        for path, h in sorted(by_path.items()):
+            self.logger.info(f"HTTP 지연 - {path}: {h.total}건, 평균 {h.sum_ms / h.total:.1f}ms")
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+def get_transport() -> HttpTransport:
+    """
+    프로세스 공용 HTTP 전송 계층 반환 (최초 호출 시 기본 설정으로 생성)
+    :return: 전송 계층 인스턴스
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.data.candle_store import (KST_OFFSET, INTERVAL_SECONDS, FIELDS,
+                                   OPEN, HIGH, LOW, CLOSE, VOLUME)
+from src.data.history import HistoryStore
+
+class BarSeries:
+    """백테스트용 단일 티커 기준봉 시계열"""
+
+    def __init__(self, ticker: str, interval: str, timestamps: np.ndarray, values: np.ndarray):
+        """
+        :param ticker: 코인 티커
+        :param interval: 기준봉 간격 (minute1 등)
+        :param timestamps: 캔들 시작 시각 (KST epoch 초, 오름차순)
+        :param values: (n, 5) OHLCV 배열
+        """
+        self.ticker = ticker
+        self.interval = interval
+        self.timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self._resampled: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._forming: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, ticker: str, interval: str, df: pd.DataFrame) -> 'BarSeries':
+        """pyupbit.get_ohlcv 형식의 DataFrame으로 생성"""
+        df = df.sort_index()
+        timestamps = pd.DatetimeIndex(df.index).values.astype('datetime64[s]').astype(np.int64)
+        return cls(ticker, interval, timestamps, df[list(FIELDS)].to_numpy(dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[:, CLOSE]
+
+    def bucket_keys(self, interval: str) -> np.ndarray:
+        """기준봉별 상위 봉 시작 시각 (업비트 KST 캔들 경계 기준)"""
+        seconds = INTERVAL_SECONDS[interval]
+        return (self.timestamps - KST_OFFSET) // seconds * seconds + KST_OFFSET
+
+    def resample(self, interval: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        상위 봉 간격으로 집계
+        :return: (상위 봉 시각, (m, 5) OHLCV, 기준봉별 상위 봉 번호)
+        """
+        if interval not in self._resampled:
+            keys = self.bucket_keys(interval)
+            boundary = np.r_[True, keys[1:] != keys[:-1]]
+            starts = np.flatnonzero(boundary)
+            ends = np.r_[starts[1:] - 1, len(keys) - 1]
+            values = np.empty((len(starts), len(FIELDS)), dtype=np.float64)
+            values[:, OPEN] = self.values[starts, OPEN]
+            values[:, HIGH] = np.maximum.reduceat(self.values[:, HIGH], starts)
+            values[:, LOW] = np.minimum.reduceat(self.values[:, LOW], starts)
+            values[:, CLOSE] = self.values[ends, CLOSE]
+            values[:, VOLUME] = np.add.reduceat(self.values[:, VOLUME], starts)
+            self._resampled[interval] = (keys[starts], values, np.cumsum(boundary) - 1)
+        return self._resampled[interval]
+
+    def forming(self, interval: str) -> np.ndarray:
+        """
+        기준봉 시점마다 진행 중인 상위 봉의 OHLCV
+        - 해당 시점까지의 기준봉만으로 집계하므로 미래 정보가 섞이지 않음
+        """
+        if interval not in self._forming:
+            _, resampled, bucket = self.resample(interval)
+            groups = pd.Series(bucket)
+            values = np.empty_like(self.values)
+            values[:, OPEN] = resampled[bucket, OPEN]
+            values[:, HIGH] = pd.Series(self.values[:, HIGH]).groupby(groups).cummax().to_numpy()
+            values[:, LOW] = pd.Series(self.values[:, LOW]).groupby(groups).cummin().to_numpy()
+            values[:, CLOSE] = self.values[:, CLOSE]
+            values[:, VOLUME] = pd.Series(self.values[:, VOLUME]).groupby(groups).cumsum().to_numpy()
+            self._forming[interval] = values
+        return self._forming[interval]
+
+    def candles_at(self, position: int, interval: str,
+                   count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """기준봉 position 시점에 보이는 최근 상위 봉 count개 (마지막은 진행 중인 봉)"""
+        keys, resampled, bucket = self.resample(interval)
+        b = bucket[position]
+        start = max(0, b - count + 1)
+        values = resampled[start:b + 1].copy()
+        values[-1] = self.forming(interval)[position]
+        return keys[start:b + 1], values
+
+def load_csv(path: Path, ticker: str, interval: str) -> BarSeries:
+    """pyupbit DataFrame을 to_csv로 저장한 파일 로드"""
+    df = pd.read_csv(path, index_col=0, parse_dates=True)
+    return BarSeries.from_frame(ticker, interval, df)
+
+def load_csv_dir(directory: Path, tickers: List[str], interval: str) -> Dict[str, BarSeries]:
+    """디렉터리에서 {티커}_{간격}.csv 파일들을 로드"""
+    data = {}
+    for ticker in tickers:
+        path = Path(directory) / f"{ticker}_{interval}.csv"
+        if path.exists():
+            data[ticker] = load_csv(path, ticker, interval)
+    return data
+
+def load_history(directory: Path, tickers: List[str], interval: str) -> Dict[str, BarSeries]:
+    """download.py로 받은 과거 캔들 저장소에서 로드 (파일 매핑 - 복사 없음)"""
+    store = HistoryStore(str(directory))
+    data = {}
+    for ticker in tickers:
+        stored = store.load(ticker, interval)
+        if stored is not None:
+            data[ticker] = BarSeries(ticker, interval, *stored)
+    return data
+
+class ReplayCandleStore:
+    """
+    백테스트에서 CandleStore 대신 쓰는 재생용 저장소
+    - seek로 지정한 기준봉 시점까지의 캔들만 반환
+    """
+
+    def __init__(self, data: Dict[str, BarSeries]):
+        self.data = data
+        self._position: Dict[str, int] = {}
+
+    def seek(self, ticker: str, position: int) -> None:
+        """티커의 현재 재생 위치 지정"""
+        self._position[ticker] = position
+
+    def get_candles(self, ticker: str, interval: str,
+                    count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        series = self.data.get(ticker)
+        position = self._position.get(ticker)
+        if series is None or position is None:
+            return None
+        return series.candles_at(position, interval, count)
@@ -0,0 +1,336 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+import numpy as np
+import pandas as pd
+from src.config.trading_config import CoinConfig, TradeSettings
+from src.strategies.base import Strategy, TradingStrategy
+from src.strategies.factory import create_strategy
+from src.trading.order import (ExitRecord, OrderManager, decide_exit, exit_cooldown_seconds,
+                               exit_cooling_down)
+from src.utils.logger import get_logger
+from .data import BarSeries, ReplayCandleStore
+
+DAY_SECONDS = 86400
+
+@dataclass
+class Trade:
+    timestamp: int     # 체결 시각 (KST epoch 초)
+    ticker: str
+    side: str          # buy / sell
+    reason: str        # signal / take_profit / stop_loss / partial_stop
+    price: float
+    volume: float
+    amount: float      # 체결 금액 (원, 수수료 제외)
+    fee: float
+    profit_krw: float  # 실현 손익 (매도만)
+
+@dataclass
+class BacktestResult:
+    initial_krw: float
+    trades: List[Trade]
+    timestamps: np.ndarray   # 자산 곡선 시각
+    equity: np.ndarray       # 시점별 평가 자산 (원)
+    metadata: Dict = field(default_factory=dict)
+
+    @property
+    def final_equity(self) -> float:
+        return float(self.equity[-1]) if len(self.equity) else self.initial_krw
+
+    @property
+    def total_return(self) -> float:
+        """총 수익률 (%)"""
+        return (self.final_equity / self.initial_krw - 1) * 100
+
+    @property
+    def max_drawdown(self) -> float:
+        """최대 낙폭 (%)"""
+        if len(self.equity) == 0:
+            return 0.0
+        peak = np.maximum.accumulate(self.equity)
+        return float(((self.equity - peak) / peak).min() * 100)
+
+    def summary(self) -> Dict:
+        """성과 요약"""
+        sells = [t for t in self.trades if t.side == 'sell']
+        wins = sum(1 for t in sells if t.profit_krw > 0)
+        return {
+            'initial_krw': self.initial_krw,
+            'final_equity': self.final_equity,
+            'total_return': self.total_return,
+            'max_drawdown': self.max_drawdown,
+            'trades': len(self.trades),
+            'buys': len(self.trades) - len(sells),
+            'sells': len(sells),
+            'win_rate': wins / len(sells) * 100 if sells else 0.0,
+            'realized_krw': sum(t.profit_krw for t in sells),
+            'fees_krw': sum(t.fee for t in self.trades),
+        }
+
+    def trades_frame(self) -> pd.DataFrame:
+        """거래 내역 DataFrame"""
+        df = pd.DataFrame([t.__dict__ for t in self.trades],
+                          columns=list(Trade.__dataclass_fields__))
+        df['time'] = pd.to_datetime(df['timestamp'], unit='s')
+        return df
+
+    def equity_frame(self) -> pd.DataFrame:
+        """자산 곡선 DataFrame"""
+        return pd.DataFrame({'equity': self.equity},
+                            index=pd.to_datetime(self.timestamps, unit='s'))
+
+class SimulatedAccount:
+    """백테스트용 계좌 - TradingAccount와 같은 투자금 산정 규칙에 수수료를 반영"""
+
+    def __init__(self, initial_krw: float, fee_rate: float = OrderManager.FEE_RATE):
+        self.krw = initial_krw
+        self.fee_rate = fee_rate
+        self.TOTAL_ASSETS = 4000000  # 총 자산 400만원
+        self.MIN_INVEST_RATIO = 0.015  # 최소 투자비율 1.5%
+        self.MAX_INVEST_RATIO = 0.05   # 최대 투자비율 5%
+        self.volume: Dict[str, float] = {}
+        self.avg_price: Dict[str, float] = {}
+
+    def calculate_invest_amount(self, krw_balance: float) -> float:
+        """투자금액 계산"""
+        min_investment = self.TOTAL_ASSETS * self.MIN_INVEST_RATIO
+        max_investment = self.TOTAL_ASSETS * self.MAX_INVEST_RATIO
+        return min(max(krw_balance, min_investment), max_investment)
+
+    def buy(self, timestamp: int, ticker: str, price: float) -> Optional[Trade]:
+        """시장가 매수 - 잔액 부족 시 None"""
+        invest_amount = self.calculate_invest_amount(self.krw)
+        if self.krw <= invest_amount:
+            return None
+        amount = invest_amount * (1 - OrderManager.FEE_RATE)
+        fee = amount * self.fee_rate
+        volume = amount / price
+        held = self.volume.get(ticker, 0.0)
+        self.avg_price[ticker] = (held * self.avg_price.get(ticker, 0.0) + amount) / (held + volume)
+        self.volume[ticker] = held + volume
+        self.krw -= amount + fee
+        return Trade(timestamp, ticker, 'buy', 'signal', price, volume, amount, fee, 0.0)
+
+    def sell(self, timestamp: int, ticker: str, price: float, volume: float, reason: str) -> Trade:
+        """시장가 매도"""
+        volume = min(volume, self.volume.get(ticker, 0.0))
+        amount = volume * price
+        fee = amount * self.fee_rate
+        profit_krw = (price - self.avg_price[ticker]) * volume - fee
+        self.volume[ticker] -= volume
+        self.krw += amount - fee
+        return Trade(timestamp, ticker, 'sell', reason, price, volume, amount, fee, profit_krw)
+
+class BacktestContext:
+    """백테스트에서 전략에 봇 대신 전달하는 객체"""
+
+    def __init__(self, config, data: Dict[str, BarSeries]):
+        self.config = config
+        self.candle_store = ReplayCandleStore(data)
+        self.logger = get_logger('backtest')
+
+class BacktestEngine:
+    """
+    과거 캔들을 전략 신호와 익절/손절 규칙으로 재생하는 이벤트 기반 백테스트
+    - 매수 신호는 전략의 generate_signals로 한 번에 계산
+    - 청산 조건은 보유 구간에서 벡터 연산으로 다음 발생 시점을 탐색
+    - 신호/청산이 일어나는 봉만 시간순으로 처리
+    - 청산은 실거래 포지션 감시와 같이 일일 거래 한도와 관계없이 실행하고 같은 재실행 제한 적용
+    """
+    SEARCH_CHUNK = 4096  # 청산 시점 탐색 단위 (봉)
+
+    def __init__(self, trade_settings: TradeSettings, coin_settings: Dict[str, CoinConfig],
+                 strategy_type: TradingStrategy, initial_krw: float = 4000000,
+                 fee_rate: float = OrderManager.FEE_RATE):
+        self.trade_settings = trade_settings
+        self.coin_settings = coin_settings
+        self.strategy_type = strategy_type
+        self.initial_krw = initial_krw
+        self.fee_rate = fee_rate
+        self.logger = get_logger(__name__)
+
+    def create_strategy(self, context: BacktestContext) -> Strategy:
+        """백테스트 문맥으로 전략 생성"""
+        return create_strategy(self.strategy_type, context)
+
+    def run(self, data: Dict[str, BarSeries],
+            signals: Optional[Dict[str, np.ndarray]] = None) -> BacktestResult:
+        """
+        백테스트 실행
+        :param data: 티커별 기준봉 시계열
+        :param signals: 미리 계산한 티커별 매수 신호 (없으면 전략으로 계산)
+        """
+        configs = {c.ticker: c for c in self.coin_settings.values() if c.ticker in data}
+        tickers = [t for t in data if t in configs]
+        if signals is None:
+            strategy = self.create_strategy(BacktestContext(self, data))
+            signals = {t: strategy.generate_signals(data[t]) for t in tickers}
+
+        account = SimulatedAccount(self.initial_krw, self.fee_rate)
+        signal_index = {t: np.flatnonzero(signals[t]) for t in tickers}
+        last_buy = {t: None for t in tickers}
+        last_exit: Dict[str, ExitRecord] = {}
+        exit_cooldown = exit_cooldown_seconds(self.trade_settings)
+        max_daily_trades = self.trade_settings.max_daily_trades
+        traded_bars: Dict[int, Set[int]] = {}  # 날짜 -> 거래가 있었던 봉 시각 (실거래의 거래 사이클)
+        trades: List[Trade] = []
+
+        events = []
+        for order, ticker in enumerate(tickers):
+            position = self._next_event(ticker, 0, data[ticker], configs[ticker],
+                                        signal_index[ticker], None, account, None, exit_cooldown)
+            if position is not None:
+                heapq.heappush(events, (data[ticker].timestamps[position], order, position))
+
+        while events:
+            timestamp, order, position = heapq.heappop(events)
+            ticker = tickers[order]
+            series, coin_config = data[ticker], configs[ticker]
+            price = float(series.close[position])
+            day = int(timestamp) // DAY_SECONDS
+            bars = traded_bars.setdefault(day, set())
+            # 실거래 _count_trade와 같이 거래가 있었던 사이클(봉) 수로 한도 적용 - 한도 전에 시작한 봉은 끝까지 거래
+            cycle_open = int(timestamp) in bars or len(bars) < max_daily_trades
+
+            # 일일 거래 한도는 매수만 막음 (청산은 실거래 포지션 감시처럼 계속 실행)
+            cooling = (last_buy[ticker] is not None and
+                       timestamp - last_buy[ticker] < OrderManager.BUY_COOLDOWN)
+            if signals[ticker][position] and not cooling and cycle_open:
+                trade = account.buy(int(timestamp), ticker, price)
+                if trade is not None:
+                    trades.append(trade)
+                    last_buy[ticker] = int(timestamp)
+                    last_exit.pop(ticker, None)
+                    bars.add(int(timestamp))
+
+            decision = decide_exit(coin_config, self.trade_settings,
+                                   account.volume.get(ticker, 0.0),
+                                   account.avg_price.get(ticker, 0.0), price)
+            if decision is not None and not exit_cooling_down(
+                    coin_config, decision, last_exit.get(ticker), timestamp, exit_cooldown):
+                trades.append(account.sell(int(timestamp), ticker, price,
+                                           decision.volume, decision.action))
+                if cycle_open:
+                    bars.add(int(timestamp))  # 한도 도달 후 청산은 포지션 감시 매도라 세지 않음
+                if decision.action == 'stop_loss':
+                    last_exit.pop(ticker, None)
+                else:
+                    last_exit[ticker] = (decision.action, int(timestamp), decision.profit_rate)
+
+            buy_after = (last_buy[ticker] + OrderManager.BUY_COOLDOWN
+                         if last_buy[ticker] is not None else None)
+            if len(bars) >= max_daily_trades:
+                # 일일 거래 한도 도달 - 매수는 다음 날부터 재개
+                buy_after = max(buy_after or 0, (day + 1) * DAY_SECONDS)
+            position = self._next_event(ticker, position + 1, series, coin_config,
+                                        signal_index[ticker], buy_after, account,
+                                        last_exit.get(ticker), exit_cooldown)
+            if position is not None:
+                heapq.heappush(events, (series.timestamps[position], order, position))
+
+        timeline, equity = self._equity_curve(data, tickers, trades)
+        return BacktestResult(self.initial_krw, trades, timeline, equity,
+                              {'strategy': self.strategy_type.value, 'tickers': tickers})
+
+    def _next_event(self, ticker: str, start: int, series: BarSeries, coin_config: CoinConfig,
+                    signal_index: np.ndarray, buy_after: Optional[int],
+                    account: SimulatedAccount, last_exit: Optional[ExitRecord],
+                    exit_cooldown: float) -> Optional[int]:
+        """
+        start 이후 매수 신호 또는 청산 조건이 처음 성립하는 봉 위치
+        :param buy_after: 매수 가능 시각 (재매수 제한/일일 거래 한도, 없으면 제한 없음)
+        :param last_exit: 마지막 익절/부분 손절 (재실행 제한 판단용)
+        """
+        n = len(series)
+        if start >= n:
+            return None
+
+        buy_start = start
+        if buy_after is not None:
+            buy_start = max(start, int(np.searchsorted(series.timestamps, buy_after)))
+        i = np.searchsorted(signal_index, buy_start)
+        next_buy = int(signal_index[i]) if i < len(signal_index) else n
+
+        next_exit = self._next_exit(start, next_buy, series, coin_config,
+                                    account.volume.get(ticker, 0.0),
+                                    account.avg_price.get(ticker, 0.0), last_exit, exit_cooldown)
+        position = min(next_buy, next_exit)
+        return position if position < n else None
+
+    def _next_exit(self, start: int, stop: int, series: BarSeries, coin_config: CoinConfig,
+                   volume: float, avg_price: float, last_exit: Optional[ExitRecord] = None,
+                   exit_cooldown: float = 0.0) -> int:
+        """
+        [start, stop) 구간에서 decide_exit가 매도를 반환하고 재실행 제한(exit_cooling_down)에
+        걸리지 않는 첫 봉 위치 (없으면 stop)
+        """
+        if volume <= coin_config.min_unit or avg_price == 0:
+            return stop
+
+        settings = self.trade_settings
+        chunk = self.SEARCH_CHUNK
+        position = start
+        while position < stop:
+            end = min(position + chunk, stop)
+            price = series.close[position:end]
+            profit_rate = (price - avg_price) / avg_price * 100
+            profit_krw = (price - avg_price) * volume
+            take_zone = profit_rate >= coin_config.take_profit
+            loss_ok = np.abs(profit_krw) >= settings.min_loss_krw
+
+            take = take_zone & (profit_krw >= settings.min_profit_krw)
+            if volume * coin_config.profit_sell < coin_config.min_unit:
+                take[:] = False
+            stop_hit = ~take_zone & (profit_rate <= coin_config.stop_loss) & loss_ok
+            partial = ~take_zone & ~stop_hit & (profit_rate <= coin_config.partial_stop) & loss_ok
+            if volume * coin_config.partial_sell < coin_config.min_unit:
+                partial[:] = False
+            if last_exit is not None:
+                action, fired_at, fired_rate = last_exit
+                cooling = series.timestamps[position:end] - fired_at < exit_cooldown
+                if action == 'partial_stop':
+                    partial &= ~(cooling & (profit_rate > fired_rate + coin_config.partial_stop))
+                elif action == 'take_profit':
+                    take &= ~(cooling & (profit_rate < fired_rate + coin_config.take_profit))
+            hit = take | stop_hit | partial
+
+            found = np.flatnonzero(hit)
+            if len(found):
+                return position + int(found[0])
+            position = end
+            chunk *= 4
+        return stop
+
+    def _equity_curve(self, data: Dict[str, BarSeries], tickers: List[str],
+                      trades: List[Trade]):
+        """전체 시각에 대한 평가 자산 계산 (보유량 계단 함수 x 직전 종가)"""
+        if not tickers:
+            return np.array([], dtype=np.int64), np.array([])
+        timeline = np.unique(np.concatenate([data[t].timestamps for t in tickers]))
+
+        trade_times = np.array([t.timestamp for t in trades], dtype=np.int64)
+        krw_delta = np.array([-(t.amount + t.fee) if t.side == 'buy' else t.amount - t.fee
+                              for t in trades], dtype=np.float64)
+        krw = self.initial_krw + self._step(timeline, trade_times, krw_delta)
+        equity = krw
+        for ticker in tickers:
+            series = data[ticker]
+            mask = np.array([t.ticker == ticker for t in trades], dtype=bool)
+            if not mask.any():
+                continue
+            volume_delta = np.array([t.volume if t.side == 'buy' else -t.volume
+                                     for t in trades if t.ticker == ticker])
+            volume = self._step(timeline, trade_times[mask], volume_delta)
+            idx = np.searchsorted(series.timestamps, timeline, side='right') - 1
+            price = np.where(idx >= 0, series.close[np.maximum(idx, 0)], 0.0)
+            equity = equity + volume * price
+        return timeline, equity
+
+    @staticmethod
+    def _step(timeline: np.ndarray, times: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+        """시각별 누적 변화량 (각 시각 이하에서 발생한 변화의 합)"""
+        if len(times) == 0:
+            return np.zeros(len(timeline))
+        order = np.argsort(times, kind='stable')
+        cumulative = np.r_[0.0, np.cumsum(deltas[order])]
+        return cumulative[np.searchsorted(times[order], timeline, side='right')]
@@ -0,0 +1,178 @@
+import itertools
+import os
+import random
+from dataclasses import fields, replace
+from multiprocessing import Pool, shared_memory
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.config.trading_config import CoinConfig, TradeSettings
+from src.strategies.base import TradingStrategy
+from src.strategies.factory import strategy_class
+from .data import BarSeries
+from .engine import BacktestContext, BacktestEngine
+
+# 스윕 가능한 코인 설정 필드
+COIN_PARAMS = tuple(f.name for f in fields(CoinConfig) if f.name not in ('ticker', 'min_unit'))
+
+def check_params(names: Iterable[str], strategy_type: TradingStrategy) -> None:
+    """스윕할 파라미터 이름 검증 (워커를 띄우기 전에 오타를 잡기 위함)"""
+    known = COIN_PARAMS + strategy_class(strategy_type).PARAMS
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"{strategy_type.value} 전략에서 스윕할 수 없는 파라미터입니다: "
+                         f"{', '.join(unknown)} (가능: {', '.join(known)})")
+
+def parse_values(spec: str) -> List[float]:
+    """
+    파라미터 값 목록 파싱
+    - "1.0,1.5,2.0": 나열
+    - "1.0:3.0:0.5": 시작:끝:간격 (끝 포함)
+    """
+    if ':' in spec:
+        start, stop, step = (float(x) for x in spec.split(':'))
+        return [round(v, 10) for v in np.arange(start, stop + step / 2, step)]
+    return [float(x) for x in spec.split(',')]
+
+def build_grid(space: Dict[str, List[float]], samples: Optional[int] = None,
+               seed: int = 0) -> List[Dict[str, float]]:
+    """
+    파라미터 조합 생성
+    :param space: 파라미터별 후보 값
+    :param samples: 지정하면 전체 조합 중 무작위 samples개 (랜덤 서치)
+    """
+    names = list(space)
+    total = int(np.prod([len(space[n]) for n in names])) if names else 1
+    if samples is None or samples >= total:
+        return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+    rng = random.Random(seed)
+    picked = rng.sample(range(total), samples)
+    sizes = [len(space[n]) for n in names]
+    combos = []
+    for index in picked:
+        combo = {}
+        for name, size in zip(reversed(names), reversed(sizes)):
+            index, i = divmod(index, size)
+            combo[name] = space[name][i]
+        combos.append({n: combo[n] for n in names})
+    return combos
+
+class SharedCandles:
+    """여러 티커의 캔들 배열을 하나의 공유 메모리 블록에 담아 워커에 전달"""
+
+    def __init__(self, data: Dict[str, BarSeries]):
+        self.layout: List[Tuple[str, str, int, int]] = []  # (티커, 간격, 시작 오프셋, 봉 수)
+        size = sum(len(s) * 8 * 6 for s in data.values())
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        offset = 0
+        for ticker, series in data.items():
+            n = len(series)
+            timestamps, values = self._views(self.shm.buf, offset, n)
+            timestamps[:] = series.timestamps
+            values[:] = series.values
+            self.layout.append((ticker, series.interval, offset, n))
+            offset += n * 8 * 6
+
+    @staticmethod
+    def _views(buf, offset: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """공유 메모리 위의 (타임스탬프, OHLCV) 배열 뷰"""
+        timestamps = np.ndarray((n,), dtype=np.int64, buffer=buf, offset=offset)
+        values = np.ndarray((n, 5), dtype=np.float64, buffer=buf, offset=offset + n * 8)
+        return timestamps, values
+
+    @classmethod
+    def attach(cls, name: str, layout: List[Tuple[str, str, int, int]]):
+        """워커에서 공유 메모리에 연결해 복사 없이 BarSeries 구성"""
+        shm = shared_memory.SharedMemory(name=name)
+        data = {}
+        for ticker, interval, offset, n in layout:
+            timestamps, values = cls._views(shm.buf, offset, n)
+            data[ticker] = BarSeries(ticker, interval, timestamps, values)
+        return shm, data
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+# 워커 프로세스 상태 (초기화 함수에서 설정)
+_worker = {}
+
+def _init_worker(shm_name: str, layout, trade_settings: TradeSettings,
+                 coin_settings: Dict[str, CoinConfig], strategy_type: TradingStrategy,
+                 initial_krw: float, coins: Optional[List[str]]) -> None:
+    shm, data = SharedCandles.attach(shm_name, layout)
+    _worker.update(shm=shm, data=data, trade_settings=trade_settings,
+                   coin_settings=coin_settings, strategy_type=strategy_type,
+                   initial_krw=initial_krw, coins=coins, signals={})
+
+def _signals_for(engine: BacktestEngine, strategy_params: Dict) -> Dict[str, np.ndarray]:
+    """전략 파라미터별 매수 신호 (워커 내 캐시)"""
+    key = tuple(sorted(strategy_params.items()))
+    cache = _worker['signals']
+    if key not in cache:
+        data = _worker['data']
+        context = BacktestContext(engine, data)
+        strategy = engine.create_strategy(context)
+        strategy.set_params(**strategy_params)
+        cache[key] = {t: strategy.generate_signals(s) for t, s in data.items()}
+    return cache[key]
+
+def _run_combo(params: Dict[str, float]) -> Dict:
+    """파라미터 조합 하나로 백테스트 실행"""
+    coin_params = {k: v for k, v in params.items() if k in COIN_PARAMS}
+    strategy_params = {k: _cast(v) for k, v in params.items() if k not in COIN_PARAMS}
+    coins = _worker['coins']
+    coin_settings = {
+        coin: replace(cfg, **coin_params) if coins is None or coin in coins else cfg
+        for coin, cfg in _worker['coin_settings'].items()
+    }
+    engine = BacktestEngine(_worker['trade_settings'], coin_settings,
+                            _worker['strategy_type'], initial_krw=_worker['initial_krw'])
+    result = engine.run(_worker['data'], _signals_for(engine, strategy_params))
+    return dict(params, **result.summary())
+
+def _cast(value: float):
+    """정수로 표현 가능한 전략 파라미터는 정수로 변환 (봉 수 등)"""
+    return int(value) if float(value).is_integer() else value
+
+class ParameterSweep:
+    """코인 익절/손절 설정과 전략 파라미터의 병렬 그리드/랜덤 서치"""
+
+    def __init__(self, trade_settings: TradeSettings, coin_settings: Dict[str, CoinConfig],
+                 strategy_type: TradingStrategy, initial_krw: float = 4000000,
+                 coins: Optional[List[str]] = None, processes: Optional[int] = None):
+        """
+        :param coins: 코인 설정을 바꿀 대상 코인 (기본: 전체)
+        :param processes: 워커 프로세스 수 (기본: CPU 코어 수)
+        """
+        self.trade_settings = trade_settings
+        self.coin_settings = coin_settings
+        self.strategy_type = strategy_type
+        self.initial_krw = initial_krw
+        self.coins = coins
+        self.processes = processes or os.cpu_count()
+
+    def run(self, data: Dict[str, BarSeries], combos: Iterable[Dict[str, float]],
+            metric: str = 'total_return') -> pd.DataFrame:
+        """
+        조합별 백테스트를 프로세스 풀에서 실행하고 metric 내림차순으로 정렬해 반환
+        """
+        combos = list(combos)
+        check_params({name for combo in combos for name in combo}, self.strategy_type)
+        # 같은 전략 파라미터끼리 모아 워커의 신호 캐시 적중률을 높임
+        combos.sort(key=lambda c: tuple(sorted((k, v) for k, v in c.items() if k not in COIN_PARAMS)))
+        candles = SharedCandles(data)
+        try:
+            initargs = (candles.shm.name, candles.layout, self.trade_settings, self.coin_settings,
+                        self.strategy_type, self.initial_krw, self.coins)
+            chunksize = max(1, len(combos) // (self.processes * 8))
+            with Pool(self.processes, initializer=_init_worker, initargs=initargs) as pool:
+                rows = list(pool.imap_unordered(_run_combo, combos, chunksize=chunksize))
+        finally:
+            candles.close()
+
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df
+        return df.sort_values(metric, ascending=False).reset_index(drop=True)
@@ -0,0 +1,112 @@
+import calendar
+import json
+import time
+import threading
+from collections import Counter
+from datetime import timedelta
+from typing import Dict, List
+from urllib.parse import urlparse
+from src.data.candle_store import KST_OFFSET
+from src.exchange.simulated import SimulatedExchange
+
+class StubResponse:
+    """requests.Response 대역 (pyupbit가 쓰는 속성만 구현)"""
+
+    def __init__(self, data, group: str, status_code: int = 200):
+        self.data = data
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {'Remaining-Req': f"group={group}; min=1800; sec=30"}
+        self.text = json.dumps(data)
+
+    def json(self):
+        return self.data
+
+class StubUpbitHttp:
+    """
+    업비트 REST 엔드포인트를 흉내 내는 HTTP 계층
+    - pyupbit 함수가 실제로 보내는 요청을 모의 거래소로 응답
+    - 경로별 호출 수를 집계해 사이클당 API 호출 수 측정에 사용
+    """
+
+    def __init__(self, exchange: SimulatedExchange):
+        self.exchange = exchange
+        self.quotes = exchange.quotes
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def reset(self) -> Dict[str, int]:
+        """집계를 초기화하고 직전까지의 경로별 호출 수 반환"""
+        with self._lock:
+            calls, self.calls = dict(self.calls), Counter()
+        return calls
+
+    def get(self, url: str, params=None, **kwargs) -> StubResponse:
+        return self._route('GET', url, params or {}, kwargs.get('data'))
+
+    def post(self, url: str, data=None, **kwargs) -> StubResponse:
+        return self._route('POST', url, {}, data)
+
+    def delete(self, url: str, data=None, **kwargs) -> StubResponse:
+        return self._route('DELETE', url, {}, data)
+
+    def _route(self, method: str, url: str, params: Dict, data) -> StubResponse:
+        path = urlparse(url).path.replace('/v1/', '', 1)
+        with self._lock:
+            self.calls[path.split('/')[0] if path.startswith('candles') else path] += 1
+
+        if path == 'ticker':
+            return StubResponse([self.quotes.stats(t) for t in self._markets(params)], 'ticker')
+        if path == 'market/all':
+            return StubResponse([{'market': t, 'korean_name': t, 'english_name': t}
+                                 for t in self.quotes.markets('')], 'market')
+        if path == 'orderbook':
+            return StubResponse([self.quotes.orderbook(t) for t in self._markets(params)],
+                                'orderbook')
+        if path.startswith('candles/'):
+            return StubResponse(self._candles(path, params), 'candles')
+        if path == 'accounts':
+            return StubResponse(self.exchange.get_balances(), 'default')
+        if path == 'orders' and method == 'GET':
+            return StubResponse(self.exchange.get_orders(data.get('uuids[]', [])), 'default')
+        if path == 'orders' and method == 'POST':
+            order = json.loads(data)
+            if order['side'] == 'bid':
+                result = self.exchange.buy_market_order(order['market'], float(order['price']))
+            else:
+                result = self.exchange.sell_market_order(order['market'], float(order['volume']))
+            if result is None:
+                return StubResponse({'error': {'name': 'insufficient_funds', 'message': ''}},
+                                    'order', 400)
+            return StubResponse(result, 'order')
+        return StubResponse({'error': {'name': 'not_found', 'message': path}}, 'default', 404)
+
+    @staticmethod
+    def _markets(params: Dict) -> List[str]:
+        markets = params.get('markets', [])
+        return [markets] if isinstance(markets, str) else list(markets)
+
+    def _candles(self, path: str, params: Dict) -> List[Dict]:
+        """캔들 응답 (최신 봉부터 내림차순)"""
+        unit = path.split('/')
+        interval = f"minute{unit[2]}" if unit[1] == 'minutes' else 'day'
+        count = int(params.get('count', 200))
+        if params.get('to'):
+            # to(UTC) 이전 봉만 - 가상 시세는 최근 capacity개까지
+            to = calendar.timegm(time.strptime(params['to'], "%Y-%m-%d %H:%M:%S")) + KST_OFFSET
+            df = self.quotes.ohlcv(params['market'], interval, self.quotes.capacity)
+            df = df[df.index.values.astype('datetime64[s]').astype('int64') < to].tail(count)
+        else:
+            df = self.quotes.ohlcv(params['market'], interval, count)
+        rows = []
+        for ts, row in zip(reversed(df.index), reversed(df.to_numpy().tolist())):
+            kst = ts.to_pydatetime()
+            rows.append({
+                'market': params['market'],
+                'candle_date_time_kst': kst.strftime("%Y-%m-%dT%H:%M:%S"),
+                'candle_date_time_utc': (kst - timedelta(seconds=KST_OFFSET)).strftime("%Y-%m-%dT%H:%M:%S"),
+                'opening_price': row[0], 'high_price': row[1], 'low_price': row[2],
+                'trade_price': row[3], 'candle_acc_trade_volume': row[4],
+                'candle_acc_trade_price': row[5],
+            })
+        return rows
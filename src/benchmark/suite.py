@@ -0,0 +1,332 @@
+import asyncio
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import replace
+from fnmatch import fnmatch
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+import numpy as np
+from pyupbit import request_api
+from src.api.gateway import RATE_LIMITS, get_gateway
+from src.benchmark.stub_http import StubUpbitHttp
+from src.config.trading_config import CoinConfig, StateSettings, TradingConfig
+from src.exchange.simulated import SimulatedExchange, SyntheticQuotes
+from src.indicators.heikin_ashi import HeikinAshiEngine, compute_heikin_ashi
+from src.strategies.base import TradingStrategy
+
+class MethodTimer:
+    """객체 메서드를 감싸 호출 수와 누적 시간 집계"""
+
+    def __init__(self):
+        self.stats: Dict[str, List[float]] = {}
+
+    def wrap(self, obj, name: str, label: Optional[str] = None) -> None:
+        func = getattr(obj, name, None)
+        if func is None:
+            return
+        samples = self.stats.setdefault(label or name, [])
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - started)
+
+        setattr(obj, name, timed)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {name: _describe(samples) for name, samples in self.stats.items() if samples}
+
+def _describe(samples: List[float]) -> Dict[str, float]:
+    """시간 표본 요약 (ms)"""
+    ms = sorted(s * 1000 for s in samples)
+    return {'count': len(ms), 'mean_ms': statistics.fmean(ms), 'p50_ms': ms[len(ms) // 2],
+            'max_ms': ms[-1], 'total_ms': sum(ms)}
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+@contextmanager
+def stub_upbit(seed: int = 0) -> Iterator[StubUpbitHttp]:
+    """
+    블록 안에서만 pyupbit HTTP 계층을 모의 업비트로 교체하고 요청 한도 대기를 해제
+    - 게이트웨이/pyupbit 파싱 경로는 실거래와 동일하게 실행
+    - 게이트웨이는 프로세스 공용이므로 블록을 나가면 버킷과 HTTP 계층을 원래대로 복원
+    """
+    gateway = get_gateway()
+    saved = {group: vars(bucket).copy() for group, bucket in gateway.buckets.items()}
+    backend = request_api.requests.backend
+    for bucket in gateway.buckets.values():
+        bucket.rate = bucket.capacity = bucket.tokens = 1e9
+    exchange = SimulatedExchange(SyntheticQuotes(seed=seed), initial_krw=1e12)
+    stub = StubUpbitHttp(exchange)
+    request_api.requests.backend = stub
+    try:
+        yield stub
+    finally:
+        request_api.requests.backend = backend
+        for group, state in saved.items():
+            vars(gateway.buckets[group]).update(state)
+
+def synthetic_coins(template: CoinConfig, count: int) -> Dict[str, CoinConfig]:
+    """템플릿 설정을 복제한 count개 가상 코인 설정"""
+    return {f"C{i:03d}": replace(template, ticker=f"KRW-C{i:03d}") for i in range(count)}
+
+def build_bot(strategy_type: TradingStrategy, coins: int, mode: str = 'sync'):
+    """가상 코인 coins개를 거래하는 봇 생성 (모의 HTTP 계층 사용)"""
+    os.environ.setdefault('UPBIT_ACCESS_KEY', 'benchmark-access-key')
+    os.environ.setdefault('UPBIT_SECRET_KEY', 'benchmark-secret-key-0123456789abcdef')
+    config = TradingConfig()
+    config.state_settings = StateSettings()  # 저장된 상태/캔들 캐시 없이 매번 같은 조건으로 측정
+    if mode == 'async':
+        from src.trading.async_bot import AsyncTradingBot
+        bot = AsyncTradingBot(strategy_type, config=config)
+    else:
+        from src.trading.bot import TradingBot
+        bot = TradingBot(strategy_type, config=config)
+    template = next(iter(bot.config.coin_settings.values()))
+    bot.config.coin_settings = synthetic_coins(template, coins)
+    bot.candle_store.refresh_interval = 0  # 매 사이클 캔들 갱신 (trade_interval 주기와 동일 조건)
+    return bot
+
+def run_cycle(bot, mode: str) -> bool:
+    """거래 사이클 1회 실행 (async는 사이클마다 새 이벤트 루프)"""
+    if mode == 'async':
+        async def cycle():
+            bot.semaphore = asyncio.Semaphore(bot.config.trade_settings.max_concurrency)
+            return await bot._execute_trading_cycle_async()
+        return asyncio.run(cycle())
+    return bot._execute_trading_cycle()
+
+def bench_cycles(strategy_type: TradingStrategy, coin_counts: List[int], cycles: int,
+                 mode: str = 'sync') -> Dict:
+    """
+    코인 수별 거래 사이클 시간과 사이클당 API 호출 수
+    - 첫 사이클(전체 캔들 조회)과 이후 사이클을 따로 집계
+    - 각 코인을 조금씩 보유한 상태로 실행해 매도 판단 경로까지 측정
+    """
+    results = {}
+    for count in coin_counts:
+        with stub_upbit() as stub:
+            results[str(count)] = _bench_cycle(strategy_type, count, cycles, mode, stub)
+    return results
+
+def _bench_cycle(strategy_type: TradingStrategy, count: int, cycles: int, mode: str,
+                 stub: StubUpbitHttp) -> Dict:
+    """코인 count개로 거래 사이클 측정"""
+    bot = build_bot(strategy_type, count, mode)
+    hold_all(bot, stub)
+
+    timer = MethodTimer()
+    timer.wrap(bot, '_check_exits', 'check_exits')
+    timer.wrap(bot.order_manager, 'check_buy')
+    timer.wrap(bot.strategy, 'get_heikin_ashi')
+    timer.wrap(bot.strategy, 'get_target_price')
+    timer.wrap(bot.market, 'refresh')
+    timer.wrap(bot.account, 'refresh_snapshot')
+
+    stub.reset()
+    started = time.perf_counter()
+    run_cycle(bot, mode)
+    cold = time.perf_counter() - started
+    cold_calls = stub.reset()
+
+    durations, calls = [], []
+    for _ in range(cycles):
+        started = time.perf_counter()
+        run_cycle(bot, mode)
+        durations.append(time.perf_counter() - started)
+        calls.append(stub.reset())
+
+    memory = bench_memory(strategy_type, count, mode)
+    per_path: Dict[str, float] = {}
+    for c in calls:
+        for path, n in c.items():
+            per_path[path] = per_path.get(path, 0) + n / len(calls)
+    return {
+        'coins': count,
+        'cold_cycle_ms': cold * 1000,
+        'cold_api_calls': sum(cold_calls.values()),
+        'cycle': _describe(durations),
+        'api_calls_per_cycle': sum(per_path.values()),
+        'api_calls_by_path': per_path,
+        'rate_limit_floor_ms': _rate_limit_floor(per_path) * 1000,
+        'memory_bytes': memory,
+        'memory_per_ticker_bytes': memory / count,
+        'functions': timer.summary(),
+    }
+
+def hold_all(bot, stub: StubUpbitHttp) -> None:
+    """모든 코인을 조금씩 보유한 상태로 설정"""
+    for coin_config in bot.config.coin_settings.values():
+        stub.exchange.buy_market_order(coin_config.ticker, 10000)
+
+def bench_memory(strategy_type: TradingStrategy, count: int, mode: str = 'sync') -> int:
+    """
+    봇 생성과 첫 사이클 후 남아 있는 메모리 (bytes)
+    - 시간 측정과 분리해 tracemalloc으로 측정
+    - 모의 시세의 캔들 이력은 미리 만들어 두어 집계에서 제외
+    """
+    with stub_upbit() as stub:
+        warm = build_bot(strategy_type, count, mode)
+        hold_all(warm, stub)
+        run_cycle(warm, mode)
+        del warm
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            bot = build_bot(strategy_type, count, mode)
+            run_cycle(bot, mode)
+            return tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+
+def _rate_limit_floor(per_path: Dict[str, float]) -> float:
+    """업비트 요청 한도로만 정해지는 사이클 최소 시간 (초)"""
+    groups = {'ticker': 'ticker', 'orderbook': 'orderbook', 'candles': 'candles',
+              'accounts': 'default', 'orders': 'order'}
+    return max((n / RATE_LIMITS[groups.get(path, 'default')] for path, n in per_path.items()),
+               default=0.0)
+
+def _throughput(func: Callable[[], int], min_time: float = 0.1, repeat: int = 5) -> float:
+    """
+    func 반복 실행 처리량 (func가 반환한 작업 수 / 초)
+    - min_time초씩 repeat회 측정해 가장 빠른 값 사용 (다른 프로세스/GC로 느려진 회차 제외)
+    """
+    best = 0.0
+    for _ in range(repeat):
+        done, started = 0, time.perf_counter()
+        while True:
+            done += func()
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = max(best, done / elapsed)
+    return best
+
+def bench_indicators(tickers: int = 200, bars: int = 100000, seed: int = 0) -> Dict:
+    """하이킨 아시 지표 계산 처리량"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, size=bars)))
+    open_ = np.append(close[0], close[:-1])
+    high = np.maximum(open_, close) * 1.001
+    low = np.minimum(open_, close) * 0.999
+
+    engine = HeikinAshiEngine(capacity=tickers)
+    names = [f"KRW-C{i:03d}" for i in range(tickers)]
+    ts = np.arange(24, dtype=np.int64) * 3600
+    window = np.column_stack([open_[:24], high[:24], low[:24], close[:24], np.ones(24)])
+    for name in names:
+        engine.warmup(name, ts, window)
+    rows = np.arange(tickers)
+    o, h, l, c = (np.full(tickers, v) for v in (open_[24], high[24], low[24], close[24]))
+    state = {'bar': int(ts[-1])}
+
+    def single_update() -> int:
+        state['bar'] += 3600
+        for k in range(1000):
+            engine.update(names[k % tickers], state['bar'], o[0], h[0], l[0], c[0])
+        return 1000
+
+    def batch_update() -> int:
+        state['bar'] += 3600
+        engine.update_many(rows, np.full(tickers, state['bar']), o, h, l, c)
+        return tickers
+
+    return {
+        'compute_heikin_ashi_bars_per_sec': _throughput(
+            lambda: (compute_heikin_ashi(open_, high, low, close), bars)[1]),
+        'engine_update_per_sec': _throughput(single_update),
+        'engine_update_many_tickers_per_sec': _throughput(batch_update),
+        'engine_buy_signals_tickers_per_sec': _throughput(
+            lambda: (engine.buy_signals(rows), tickers)[1]),
+        'engine_warmup_per_sec': _throughput(
+            lambda: (engine.warmup(names[0], ts, window), 1)[1]),
+    }
+
+def bench_strategy(strategy_type: TradingStrategy, coins: int = 30) -> Dict:
+    """캔들 저장소가 채워진 상태에서 전략 매수 판단 처리량"""
+    with stub_upbit():
+        bot = build_bot(strategy_type, coins)
+        bot.candle_store.refresh_interval = 3600  # 저장소 조회만 측정
+        tickers = bot.config.get_ticker_list()
+        prices = bot.market.refresh(tickers)
+        for ticker in tickers:
+            bot.strategy.should_buy(ticker, prices[ticker])
+
+        def evaluate() -> int:
+            for ticker in tickers:
+                bot.strategy.should_buy(ticker, prices[ticker])
+            return len(tickers)
+
+        return {'should_buy_per_sec': _throughput(evaluate)}
+
+def run_suite(strategy_type: TradingStrategy, coin_counts: List[int], cycles: int,
+              mode: str = 'sync') -> Dict:
+    """전체 벤치마크 실행 결과"""
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'strategy': strategy_type.value,
+            'mode': mode,
+            'cycles': cycles,
+        },
+        'cycles': bench_cycles(strategy_type, coin_counts, cycles, mode),
+        'indicators': bench_indicators(),
+        'strategy': bench_strategy(strategy_type),
+    }
+
+# 회귀 비교 대상 - 실행마다 안정적인 집계값만 (최대/첫 사이클/합계/함수별 시간은 잡음이 커서 제외)
+COMPARED_METRICS = (
+    'cycles.*.cycle.mean_ms',
+    'cycles.*.cycle.p50_ms',
+    'cycles.*.api_calls_per_cycle',
+    'cycles.*.memory_bytes',
+    'indicators.*_per_sec',
+    'strategy.*_per_sec',
+)
+
+# 비교 시 값이 클수록 좋은 지표 (나머지는 작을수록 좋음)
+HIGHER_IS_BETTER = ('_per_sec',)
+
+def flatten(result: Dict, prefix: str = '') -> Dict[str, float]:
+    """중첩 결과를 'a.b.c' 키의 숫자 값으로 평탄화"""
+    flat = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+def compare(base: Dict, current: Dict, threshold: float = 0.1,
+            metrics: Sequence[str] = COMPARED_METRICS) -> List[Dict]:
+    """
+    두 결과 비교 (metrics 패턴에 맞는 지표만)
+    :param threshold: 회귀로 판단할 변화율 (0.1 = 10%)
+    :param metrics: 비교할 지표 이름 패턴 (fnmatch)
+    :return: 지표별 변화 (regression: 나빠진 경우 True)
+    """
+    before, after = flatten(base), flatten(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        if not any(fnmatch(key, pattern) for pattern in metrics) or before[key] == 0:
+            continue
+        change = (after[key] - before[key]) / abs(before[key])
+        worse = -change if any(s in key for s in HIGHER_IS_BETTER) else change
+        rows.append({'metric': key, 'base': before[key], 'current': after[key],
+                     'change': change, 'regression': worse > threshold})
+    return rows
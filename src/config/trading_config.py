@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 import os
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
+from src.utils.logger import get_logger
+
+MIN_ORDER_KRW = 5000  # 업비트 최소 주문 금액
 
 @dataclass
 class CoinConfig:
@@ -27,6 +30,80 @@ class TradeSettings:
     min_krw_balance: int
     min_profit_krw: int
     min_loss_krw: int
+    max_concurrency: int = 8  # 비동기 모드 동시 평가 티커 수
+    reconcile_interval: int = 300  # 거래소 잔고로 로컬 장부를 보정하는 간격 (초)
+    guard_interval: float = 1.0  # 보유 포지션 청산 감시 주기 (초, 0이면 사이클에서만 점검)
+    exit_cooldown: Optional[float] = None  # 같은 코인 익절/부분 손절 재실행 제한 (초, 없으면 trade_interval)
+
+@dataclass
+class HttpSettings:
+    pool_connections: int = 4      # 호스트별 커넥션 풀 수
+    pool_maxsize: int = 16         # 풀당 유지할 최대 연결 수 (동시 요청 스레드 수 이상)
+    connect_timeout: float = 3.0   # 연결 타임아웃 (초)
+    read_timeout: float = 10.0     # 응답 타임아웃 (초)
+    max_retries: int = 0           # 연결 실패 시 재시도 횟수
+    report_interval: int = 300     # 연결/지연 통계 로그 간격 (초)
+
+@dataclass
+class PaperSettings:
+    initial_krw: float = 4000000   # 모의 계좌 시작 원화
+    fee_rate: float = 0.0005       # 거래 수수료율
+    latency: float = 0.0           # 요청당 평균 지연 (초)
+    latency_jitter: float = 0.0    # 지연 편차 (초)
+    error_rate: float = 0.0        # 요청 실패 확률
+    volatility: float = 0.0002     # 가상 시세 초당 로그 수익률 표준편차
+    seed: int = 0
+    replay: Optional[str] = None   # 녹화 시세 JSONL 경로 (없으면 가상 시세)
+    replay_speed: float = 1.0      # 녹화 재생 배속
+    universe_size: int = 0         # 전체 시장 스캔용 가상 티커 수
+
+@dataclass
+class UniverseSettings:
+    enabled: bool = False
+    fiat: str = 'KRW'
+    scan_interval: int = 600                  # 전체 시장 재스캔 간격 (초)
+    max_tickers: int = 20                     # 후보로 남길 최대 티커 수 (24시간 거래대금 순)
+    min_trade_value_24h: float = 1e10         # 24시간 거래대금 하한 (원)
+    min_volatility: float = 0.02              # (고가 - 저가) / 전일 종가 하한
+    max_volatility: float = 0.3               # 변동성 상한 (급등락 종목 제외)
+    min_price: float = 1.0                    # 현재가 하한 (원)
+    require_ha_uptrend: bool = True           # 일봉 하이킨아시 양봉만 통과
+    exclude: Tuple[str, ...] = ()             # 스캔에서 제외할 티커
+
+@dataclass
+class StateSettings:
+    path: Optional[str] = None        # 상태 DB(SQLite) 경로 (없으면 재시작 시 상태 초기화)
+    candle_dir: Optional[str] = None  # 캔들 버퍼를 매핑할 디렉터리 (없으면 메모리에만 보관)
+
+@dataclass
+class HistorySettings:
+    path: Optional[str] = None        # 과거 캔들 저장소 디렉터리 (없으면 비활성)
+    intervals: Tuple[str, ...] = ('minute60', 'minute240', 'minute1')
+    days: int = 365                   # 수집 기간 (일)
+    workers: int = 4                  # 동시 수집 작업 수
+
+@dataclass
+class MetricsSettings:
+    host: str = '127.0.0.1'
+    port: int = 0                       # /metrics HTTP 포트 (0이면 비활성)
+    snapshot_path: Optional[str] = None # 지표 스냅샷 JSON 경로 (없으면 비활성)
+    snapshot_interval: float = 60.0     # 스냅샷 기록 간격 (초)
+
+@dataclass
+class JournalSettings:
+    path: Optional[str] = None        # 이벤트 기록 디렉터리 (없으면 비활성)
+    flush_interval: float = 1.0       # 쌓인 이벤트를 파일에 추가하는 간격 (초)
+    max_queue: int = 100000           # 기록 대기 이벤트 상한 (넘으면 버림)
+    keep_days: int = 30               # 보관 일수 (0이면 삭제하지 않음)
+    debug: bool = False               # True면 매수 신호가 아닌 판단도 기록
+
+@dataclass
+class SupervisorSettings:
+    workers: int = 0                  # 워커 프로세스 수 (0이면 CPU 코어 수)
+    feed_interval: float = 1.0        # 공유 현재가 갱신 주기 (초)
+    max_price_age: float = 10.0       # 이보다 오래된 공유 현재가는 사용하지 않음 (초)
+    ready_timeout: float = 120.0      # 첫 시세/캔들 공유 완료 대기 시간 (초)
+    restart_delay: float = 5.0        # 종료된 워커 재시작 전 대기 (초)
 
 class TradingConfig:
     def __init__(self):
@@ -45,11 +122,16 @@ class TradingConfig:
             secret_key=os.getenv('UPBIT_SECRET_KEY', '')
         )
 
+    def _read_yaml(self) -> Dict:
+        """config.yaml 읽기 (재적재 확인용 수정 시각 기록)"""
+        self.config_path = Path(__file__).parent.parent.parent / 'config.yaml'
+        self._config_mtime = self.config_path.stat().st_mtime
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+
     def _load_yaml_config(self) -> None:
         """YAML 설정 파일 로드"""
-        config_path = Path(__file__).parent.parent.parent / 'config.yaml'
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = self._read_yaml()
 
         # 거래 설정 로드
         self.trade_settings = TradeSettings(**config['trade_settings'])
@@ -59,10 +141,125 @@ class TradingConfig:
         for coin, settings in config['coins'].items():
             self.coin_settings[coin] = CoinConfig(**settings)
 
+        # 전략 파라미터 로드 (선택)
+        self.strategy_settings: Dict[str, Dict] = config.get('strategies') or {}
+
+        # HTTP 연결 설정 로드 (선택)
+        self.http_settings = HttpSettings(**(config.get('http') or {}))
+
+        # 모의 거래 설정 로드 (선택)
+        self.paper_settings = PaperSettings(**(config.get('paper') or {}))
+
+        # 전체 시장 스캔 설정 로드 (선택)
+        universe = dict(config.get('universe') or {})
+        universe['exclude'] = tuple(universe.get('exclude') or ())
+        self.universe_settings = UniverseSettings(**universe)
+
+        # YAML에 없는 코인의 기본 청산 설정 (선택)
+        self.default_coin: Optional[Dict] = config.get('default_coin')
+        self.base_coin_settings = dict(self.coin_settings)
+
+        # 상태 저장 설정 로드 (선택)
+        self.state_settings = StateSettings(**(config.get('state') or {}))
+
+        # 과거 캔들 저장소 설정 로드 (선택)
+        history = dict(config.get('history') or {})
+        if 'intervals' in history:
+            history['intervals'] = tuple(history['intervals'])
+        self.history_settings = HistorySettings(**history)
+
+        # 지표 노출 설정 로드 (선택)
+        self.metrics_settings = MetricsSettings(**(config.get('metrics') or {}))
+
+        # 이벤트 기록 설정 로드 (선택)
+        self.journal_settings = JournalSettings(**(config.get('journal') or {}))
+
+        # 다중 프로세스 실행 설정 로드 (선택)
+        self.supervisor_settings = SupervisorSettings(**(config.get('supervisor') or {}))
+
+    def reload(self, held: Iterable[str] = ()) -> None:
+        """
+        청산 관련 설정(trade_settings, coins, default_coin)을 다시 읽어 교체
+        - 시장 스캔으로 추가된 코인은 유지하고 새 default_coin 블록으로 다시 생성
+        - coins에서 빠진 코인도 보유 중이면 청산 관리를 위해 default_coin 설정으로 유지
+        - 객체를 통째로 교체하므로 읽는 쪽은 한 번 가져온 객체를 일관되게 사용
+        :param held: 보유 중인 티커
+        """
+        config = self._read_yaml()
+        trade_settings = TradeSettings(**config['trade_settings'])
+        base = {coin: CoinConfig(**settings) for coin, settings in config['coins'].items()}
+        self.default_coin = config.get('default_coin')
+        held = set(held)
+        kept = {}
+        for coin, current in self.coin_settings.items():
+            if coin in base:
+                continue
+            if coin not in self.base_coin_settings or current.ticker in held:
+                kept[coin] = self._rebuild_default(current)
+        self.base_coin_settings = base
+        self.coin_settings = {**base, **kept}
+        self.trade_settings = trade_settings
+
+    def _rebuild_default(self, current: CoinConfig) -> CoinConfig:
+        """YAML에 없는 코인 설정을 현재 default_coin 블록으로 다시 생성 (블록이 없으면 기존 설정 유지)"""
+        if not self.default_coin:
+            return current
+        settings = dict(self.default_coin)
+        if not settings.get('min_unit'):
+            settings['min_unit'] = current.min_unit  # 생성 시 현재가로 계산한 최소 수량
+        return CoinConfig(ticker=current.ticker, **settings)
+
+    def reload_if_changed(self, held: Optional[Callable[[], Iterable[str]]] = None) -> bool:
+        """
+        config.yaml이 수정됐으면 reload()
+        :param held: 보유 중인 티커를 반환하는 함수 (파일이 바뀐 경우에만 호출)
+        :return: 다시 읽었으면 True (파일 오류 시 기존 설정 유지)
+        """
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            return False
+        if mtime == self._config_mtime:
+            return False
+        try:
+            self.reload(held() if held is not None else ())
+        except Exception as e:
+            self._config_mtime = mtime  # 파일이 다시 바뀔 때까지 재시도하지 않음
+            get_logger(__name__).error(f"설정 재적재 실패 (기존 설정 유지): {e}")
+            return False
+        get_logger(__name__).info(f"설정 재적재 - 코인 {len(self.coin_settings)}개")
+        return True
+
     def get_coin_config(self, coin: str) -> Optional[CoinConfig]:
         """특정 코인의 설정 반환"""
         return self.coin_settings.get(coin)
 
+    def default_coin_config(self, ticker: str, price: float) -> CoinConfig:
+        """
+        YAML에 없는 코인의 설정 생성 (default_coin 블록 기준)
+        - min_unit이 0이면 최소 주문 금액에 해당하는 수량 사용
+        """
+        settings = dict(self.default_coin or {})
+        if not settings.get('min_unit'):
+            settings['min_unit'] = MIN_ORDER_KRW / price if price else 0.0
+        return CoinConfig(ticker=ticker, **settings)
+
+    def apply_universe(self, prices: Dict[str, float], held: Optional[Dict[str, float]] = None) -> None:
+        """
+        거래 대상 재구성: YAML 코인 + 스캔 후보 + 보유 중인 코인
+        :param prices: 스캔 후보 티커별 현재가
+        :param held: 보유 중인 티커별 현재가 (청산 관리를 위해 계속 유지)
+        """
+        settings = dict(self.base_coin_settings)
+        listed = {c.ticker for c in settings.values()}
+        for ticker, price in {**(held or {}), **prices}.items():
+            if ticker in listed:
+                continue
+            coin = ticker.split('-', 1)[1]
+            current = self.coin_settings.get(coin)
+            settings[coin] = current if current is not None else self.default_coin_config(ticker, price)
+        self.coin_settings = settings
+
     def get_ticker_list(self) -> list[str]:
         """모든 거래 대상 티커 리스트 반환"""
         return [config.ticker for config in self.coin_settings.values()]
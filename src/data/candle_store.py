@@ -0,0 +1,257 @@
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.utils.logger import get_logger
+
+KST_OFFSET = 9 * 3600  # 업비트 캔들 시각(KST)을 epoch 초로 다루기 위한 오프셋
+
+# 캔들 값 배열의 열 순서
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+INTERVAL_SECONDS = {
+    "minute1": 60,
+    "minute3": 180,
+    "minute5": 300,
+    "minute10": 600,
+    "minute15": 900,
+    "minute30": 1800,
+    "minute60": 3600,
+    "minute240": 14400,
+    "day": 86400,
+}
+
+def now_kst() -> int:
+    """현재 시각을 캔들 타임스탬프와 같은 KST 기준 epoch 초로 반환"""
+    return int(time.time()) + KST_OFFSET
+
+class CandleBuffer:
+    """(티커, 봉 간격)별 캔들을 담는 고정 크기 링 버퍼"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)        # 캔들 시작 시각
+        self.values = np.zeros((capacity, len(FIELDS)), dtype=np.float64)
+        self.head = 0        # 다음 기록 위치
+        self.size = 0        # 저장된 캔들 수
+        self.fetched_at: Optional[float] = None
+        self.exhausted = False  # 거래소에 더 이전 캔들이 없음
+
+    def reset(self) -> None:
+        """버퍼 비우기"""
+        self.head = 0
+        self.size = 0
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """가장 최근 캔들의 시작 시각"""
+        if self.size == 0:
+            return None
+        return int(self.timestamps[(self.head - 1) % self.capacity])
+
+    def upsert(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """
+        시간순 캔들 반영 - 진행 중인 마지막 봉은 덮어쓰고 새 봉만 추가
+        :param timestamps: 캔들 시작 시각 배열 (오름차순)
+        :param values: (n, 5) OHLCV 배열
+        """
+        last = self.last_timestamp
+        if last is not None:
+            keep = timestamps >= last
+            timestamps, values = timestamps[keep], values[keep]
+            if len(timestamps) and timestamps[0] == last:
+                self.values[(self.head - 1) % self.capacity] = values[0]
+                timestamps, values = timestamps[1:], values[1:]
+
+        n = len(timestamps)
+        if n == 0:
+            return
+        if n > self.capacity:
+            timestamps, values = timestamps[-self.capacity:], values[-self.capacity:]
+            n = self.capacity
+        idx = (self.head + np.arange(n)) % self.capacity
+        self.timestamps[idx] = timestamps
+        self.values[idx] = values
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def latest(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 count개 캔들을 시간순으로 반환"""
+        n = min(count, self.size)
+        idx = (self.head - n + np.arange(n)) % self.capacity
+        return self.timestamps[idx], self.values[idx]
+
+class MappedCandleBuffer(CandleBuffer):
+    """
+    파일에 매핑된 캔들 링 버퍼 - 재시작 후 마지막 상태에서 이어서 사용
+    - <이름>.ts.npy: 헤더(head, size, exhausted) + 캔들 시작 시각
+    - <이름>.ohlcv.npy: (capacity, 5) OHLCV
+    - 기록은 페이지 캐시를 거쳐 OS가 반영하므로 프로세스가 종료돼도 유지됨
+    """
+    HEADER = 3
+
+    def __init__(self, capacity: int, path: Path):
+        ts_path = path.with_name(path.name + '.ts.npy')
+        values_path = path.with_name(path.name + '.ohlcv.npy')
+        ts_shape, values_shape = (capacity + self.HEADER,), (capacity, len(FIELDS))
+        reuse = False
+        if ts_path.exists() and values_path.exists():
+            try:
+                ts = np.load(ts_path, mmap_mode='r+')
+                values = np.load(values_path, mmap_mode='r+')
+                reuse = ts.shape == ts_shape and values.shape == values_shape
+            except (OSError, ValueError):
+                reuse = False
+        if not reuse:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            ts = np.lib.format.open_memmap(ts_path, mode='w+', dtype=np.int64, shape=ts_shape)
+            values = np.lib.format.open_memmap(values_path, mode='w+', dtype=np.float64,
+                                               shape=values_shape)
+        self.capacity = capacity
+        self._header = ts[:self.HEADER]
+        self.timestamps = ts[self.HEADER:]
+        self.values = values
+        self.fetched_at: Optional[float] = None  # 재시작 후 첫 조회는 빠진 봉만 가져옴
+
+    head = property(lambda self: int(self._header[0]),
+                    lambda self, v: self._header.__setitem__(0, v))
+    size = property(lambda self: int(self._header[1]),
+                    lambda self, v: self._header.__setitem__(1, v))
+    exhausted = property(lambda self: bool(self._header[2]),
+                         lambda self, v: self._header.__setitem__(2, int(v)))
+
+class CandleStore:
+    """
+    전략들이 공유하는 프로세스 내 OHLCV 캔들 저장소
+    - 보유한 마지막 봉 이후의 캔들만 추가로 조회
+    - 진행 중인 봉은 제자리에서 갱신
+    """
+
+    def __init__(self, capacity: int = 200, refresh_interval: float = 10.0, exchange=None,
+                 cache_dir: Optional[str] = None, history=None,
+                 buffer_factory: Optional[Callable[[str, str, int], CandleBuffer]] = None):
+        """
+        :param capacity: 버퍼별 최대 캔들 수
+        :param refresh_interval: 같은 버퍼를 다시 조회하기 전 최소 간격 (초)
+        :param exchange: 캔들을 조회할 거래소 백엔드 (없으면 업비트)
+        :param cache_dir: 버퍼를 파일에 매핑할 디렉터리 (없으면 메모리에만 보관)
+        :param history: 빈 버퍼를 먼저 채울 과거 캔들 저장소 (HistoryStore)
+        :param buffer_factory: (티커, 간격, 크기)로 버퍼를 만드는 함수 (공유 메모리 버퍼 등)
+        """
+        self.capacity = capacity
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.history = history
+        self.buffer_factory = buffer_factory
+        self.refresh_interval = refresh_interval
+        self.logger = get_logger(__name__)
+        if exchange is None:
+            from src.exchange.upbit import UpbitExchange
+            exchange = UpbitExchange()
+        self.exchange = exchange
+        self._buffers: Dict[Tuple[str, str], CandleBuffer] = {}
+        self._by_ticker: Dict[str, List[Tuple[str, CandleBuffer]]] = {}
+        self._lock = threading.Lock()
+
+    def get_candles(self, ticker: str, interval: str,
+                    count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        최근 캔들 조회
+        :param ticker: 코인 티커
+        :param interval: 봉 간격 (minute60 등)
+        :param count: 필요한 캔들 수
+        :return: (타임스탬프 배열, (n, 5) OHLCV 배열) 또는 None
+        """
+        buffer = self._buffer(ticker, interval, count)
+        if ((buffer.size < count and not buffer.exhausted) or buffer.fetched_at is None or
+                time.monotonic() - buffer.fetched_at >= self.refresh_interval):
+            self._update(ticker, interval, buffer, count)
+
+        with self._lock:
+            if buffer.size == 0:
+                return None
+            return buffer.latest(count)
+
+    def _buffer(self, ticker: str, interval: str, count: int) -> CandleBuffer:
+        """(티커, 간격) 버퍼 반환 - 없거나 작으면 새로 할당"""
+        key = (ticker, interval)
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None or buffer.capacity < count:
+                capacity = max(self.capacity, count)
+                if self.buffer_factory is not None:
+                    buffer = self.buffer_factory(ticker, interval, capacity)
+                elif self.cache_dir is not None:
+                    buffer = MappedCandleBuffer(capacity, self.cache_dir / f"{ticker}_{interval}")
+                else:
+                    buffer = CandleBuffer(capacity)
+                self._buffers[key] = buffer
+                entries = [e for e in self._by_ticker.get(ticker, []) if e[0] != interval]
+                self._by_ticker[ticker] = entries + [(interval, buffer)]
+            return buffer
+
+    def apply_trade(self, ticker: str, timestamp: int, price: float, volume: float) -> None:
+        """
+        실시간 체결을 보유 중인 모든 간격의 진행 봉에 반영
+        :param timestamp: 체결 시각 (KST epoch 초)
+        """
+        with self._lock:
+            for interval, buffer in self._by_ticker.get(ticker, []):
+                last = buffer.last_timestamp
+                if last is None:
+                    continue
+                seconds = INTERVAL_SECONDS[interval]
+                start = (timestamp - KST_OFFSET) // seconds * seconds + KST_OFFSET
+                if start == last:
+                    row = buffer.values[(buffer.head - 1) % buffer.capacity]
+                    row[HIGH] = max(row[HIGH], price)
+                    row[LOW] = min(row[LOW], price)
+                    row[CLOSE] = price
+                    row[VOLUME] += volume
+                elif start > last:
+                    buffer.upsert(np.array([start], dtype=np.int64),
+                                  np.array([[price, price, price, price, volume]]))
+
+    def _seed(self, ticker: str, interval: str, buffer: CandleBuffer) -> Optional[int]:
+        """과거 캔들 저장소의 최근 봉으로 빈 버퍼 채우기 - 이후에는 빠진 봉만 조회"""
+        try:
+            stored = self.history.load(ticker, interval)
+        except Exception as e:
+            self.logger.error(f"과거 캔들 로드 실패 - {ticker} {interval}: {e}")
+            return None
+        if stored is None:
+            return None
+        timestamps, values = stored
+        with self._lock:
+            buffer.upsert(np.asarray(timestamps[-buffer.capacity:]),
+                          np.asarray(values[-buffer.capacity:]))
+            return buffer.last_timestamp
+
+    def _update(self, ticker: str, interval: str, buffer: CandleBuffer, count: int) -> None:
+        """마지막 보유 봉 이후의 캔들만 조회해 버퍼에 반영"""
+        last = buffer.last_timestamp
+        if last is None and self.history is not None:
+            last = self._seed(ticker, interval, buffer)
+        backfill = last is None or buffer.size < count
+        if backfill:
+            fetch_count = count
+        else:
+            elapsed = now_kst() - last
+            fetch_count = min(buffer.capacity, max(elapsed, 0) // INTERVAL_SECONDS[interval] + 1)
+
+        try:
+            df = self.exchange.get_ohlcv(ticker, interval, fetch_count)
+            if df is None or df.empty:
+                self.logger.error(f"캔들 조회 실패 - {ticker} {interval}")
+                return
+            timestamps = df.index.values.astype('datetime64[s]').astype(np.int64)
+            values = df[list(FIELDS)].to_numpy(dtype=np.float64)
+            with self._lock:
+                if backfill:
+                    buffer.reset()
+                    buffer.exhausted = len(df) < fetch_count
+                buffer.upsert(timestamps, values)
+                buffer.fetched_at = time.monotonic()
+        except Exception as e:
+            self.logger.error(f"캔들 갱신 실패 - {ticker} {interval}: {e}")
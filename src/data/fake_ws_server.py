@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import websockets
+from src.data.stream import UPBIT_WEBSOCKET_URL, MarketStream
+from src.utils.logger import get_logger
+
+def load_messages(path: Path) -> List[Dict]:
+    """녹화된 WebSocket 메시지(JSONL) 로드"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def synthetic_messages(tickers: List[str], count: int, seed: int = 0,
+                       start_ms: Optional[int] = None) -> List[Dict]:
+    """
+    녹화 파일이 없을 때 쓰는 가상 메시지 생성 (랜덤워크 체결/현재가/호가)
+    :param count: 생성할 체결 메시지 수
+    """
+    rng = random.Random(seed)
+    now = start_ms or int(time.time() * 1000)
+    prices = {t: 10000.0 * (1 + i) for i, t in enumerate(tickers)}
+    messages = []
+    for i in range(count):
+        ticker = rng.choice(tickers)
+        price = round(prices[ticker] * (1 + rng.gauss(0, 0.001)), 2)
+        prices[ticker] = price
+        timestamp = now + i * 10
+        messages.append({'type': 'trade', 'code': ticker, 'trade_price': price,
+                         'trade_volume': round(rng.random(), 6), 'trade_timestamp': timestamp,
+                         'timestamp': timestamp, 'ask_bid': rng.choice(['ASK', 'BID'])})
+        messages.append({'type': 'ticker', 'code': ticker, 'trade_price': price,
+                         'trade_timestamp': timestamp, 'timestamp': timestamp})
+        if i % 5 == 0:
+            units = [{'ask_price': round(price * (1 + 0.0005 * (k + 1)), 2),
+                      'bid_price': round(price * (1 - 0.0005 * (k + 1)), 2),
+                      'ask_size': round(rng.random() * 2, 6),
+                      'bid_size': round(rng.random() * 2, 6)} for k in range(15)]
+            messages.append({'type': 'orderbook', 'code': ticker, 'timestamp': timestamp,
+                             'orderbook_units': units})
+    return messages
+
+class FakeUpbitServer:
+    """
+    녹화된 메시지를 재생하는 로컬 업비트 WebSocket 서버
+    - 구독 요청의 type/codes에 맞는 메시지만 전송
+    - speed 배속으로 원래 시간 간격을 재현 (0이면 최대 속도)
+    """
+
+    def __init__(self, messages: List[Dict], host: str = '127.0.0.1', port: int = 0,
+                 speed: float = 0.0, repeat: bool = False):
+        self.messages = messages
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self.repeat = repeat
+        self.logger = get_logger(__name__)
+        self.sent = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """서버 시작 후 접속 주소 반환"""
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, ws) -> None:
+        """클라이언트 1개에 대해 구독 조건에 맞는 메시지 재생"""
+        request = json.loads(await ws.recv())
+        wanted = {(item['type'], code) for item in request if 'type' in item
+                  for code in item.get('codes', [])}
+        messages = [m for m in self.messages if (m.get('type'), m.get('code')) in wanted]
+        if not messages:
+            return
+
+        while True:
+            base = messages[0].get('timestamp', 0)
+            started = time.monotonic()
+            for message in messages:
+                if self.speed > 0:
+                    due = (message.get('timestamp', base) - base) / 1000 / self.speed
+                    delay = due - (time.monotonic() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await ws.send(json.dumps(message).encode('utf-8'))  # 업비트와 같은 바이너리 프레임
+                self.sent += 1
+            if not self.repeat:
+                break
+        await ws.close()
+
+async def record(path: Path, tickers: List[str], duration: float,
+                 url: str = UPBIT_WEBSOCKET_URL) -> int:
+    """실제 업비트 피드를 duration초 동안 JSONL로 녹화"""
+    stream = MarketStream(tickers, url=url)
+    count = 0
+    deadline = time.monotonic() + duration
+    async with websockets.connect(url, ping_interval=60, max_size=None) as ws:
+        await ws.send(stream.subscription())
+        with open(path, 'w', encoding='utf-8') as f:
+            while time.monotonic() < deadline:
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+                f.write(json.dumps(json.loads(raw), ensure_ascii=False) + '\n')
+                count += 1
+    return count
+
+async def benchmark(messages: List[Dict], tickers: List[str]) -> Dict:
+    """가짜 서버로 MarketStream 수신/처리 처리량 측정"""
+    server = FakeUpbitServer(messages)
+    url = await server.start()
+    stream = MarketStream(tickers, url=url)
+    task = asyncio.create_task(stream.run())
+    started = time.perf_counter()
+    expected = len([m for m in messages if m.get('code') in set(tickers)])
+    while stream.message_count < expected and time.perf_counter() - started < 60:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    stream.stop()
+    task.cancel()
+    await server.stop()
+    return {'messages': stream.message_count, 'seconds': elapsed,
+            'messages_per_sec': stream.message_count / elapsed if elapsed else 0.0}
+
+def main():
+    parser = argparse.ArgumentParser(description="업비트 WebSocket 녹화/재생 도구")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help="실제 피드 녹화")
+    rec.add_argument('path')
+    rec.add_argument('--tickers', nargs='+', required=True)
+    rec.add_argument('--duration', type=float, default=60)
+
+    serve = sub.add_parser('serve', help="녹화 파일 재생 서버")
+    serve.add_argument('path', nargs='?', help="JSONL 파일 (없으면 가상 메시지)")
+    serve.add_argument('--tickers', nargs='+', default=['KRW-BTC', 'KRW-ETH', 'KRW-ETC'])
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--speed', type=float, default=1.0, help="재생 배속 (0: 최대 속도)")
+    serve.add_argument('--repeat', action='store_true')
+
+    bench = sub.add_parser('bench', help="오프라인 수신 처리량 측정")
+    bench.add_argument('path', nargs='?')
+    bench.add_argument('--tickers', nargs='+', default=['KRW-BTC', 'KRW-ETH', 'KRW-ETC'])
+    bench.add_argument('--count', type=int, default=100000)
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        count = asyncio.run(record(Path(args.path), args.tickers, args.duration))
+        print(f"{count}개 메시지 녹화 -> {args.path}")
+    elif args.command == 'serve':
+        messages = load_messages(Path(args.path)) if args.path else synthetic_messages(args.tickers, 100000)
+
+        async def serve_forever():
+            server = FakeUpbitServer(messages, port=args.port, speed=args.speed, repeat=args.repeat)
+            print(f"재생 서버 시작 - {await server.start()}")
+            await asyncio.Future()
+
+        asyncio.run(serve_forever())
+    else:
+        messages = load_messages(Path(args.path)) if args.path else synthetic_messages(args.tickers, args.count)
+        print(json.dumps(asyncio.run(benchmark(messages, args.tickers)), indent=2))
+
+if __name__ == "__main__":
+    main()
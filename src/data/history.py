@@ -0,0 +1,253 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.data.candle_store import FIELDS, INTERVAL_SECONDS, KST_OFFSET, now_kst
+from src.utils.logger import get_logger
+
+Bars = Tuple[np.ndarray, np.ndarray]  # (캔들 시작 시각 int64, (n, 5) OHLCV float64)
+
+class HistoryStore:
+    """
+    과거 캔들 저장소 (추가 전용, 파일 매핑으로 복사 없이 로드)
+    - {root}/{간격}/{티커}/timestamps.bin: int64 캔들 시작 시각 (KST epoch 초, 오름차순)
+    - {root}/{간격}/{티커}/ohlcv.bin: float64 (n, 5) OHLCV - BarSeries/CandleBuffer와 같은 배치
+    - meta.json의 rows까지만 유효 (기록 도중 중단돼도 다음 추가 시 잘라냄)
+    - 과거 방향 수집분은 staging/에 쌓았다가 merge_staged()로 앞쪽에 합침
+    """
+    TIMESTAMPS = 'timestamps.bin'
+    OHLCV = 'ohlcv.bin'
+    META = 'meta.json'
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _dir(self, ticker: str, interval: str, staging: bool = False) -> Path:
+        path = self.root / interval / ticker
+        return path / 'staging' if staging else path
+
+    def lock(self, ticker: str, interval: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((ticker, interval), threading.Lock())
+
+    def meta(self, ticker: str, interval: str, staging: bool = False) -> Dict:
+        """rows/first/last (staging은 cursor: 가장 오래된 수집 시각)"""
+        path = self._dir(ticker, interval, staging) / self.META
+        if not path.exists():
+            return {'rows': 0}
+        return json.loads(path.read_text())
+
+    def _write_meta(self, directory: Path, meta: Dict) -> None:
+        tmp = directory / (self.META + '.tmp')
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, directory / self.META)
+
+    def load(self, ticker: str, interval: str) -> Optional[Bars]:
+        """저장된 전체 캔들 (읽기 전용 memmap - 복사 없음)"""
+        directory = self._dir(ticker, interval)
+        rows = self.meta(ticker, interval)['rows']
+        if rows == 0:
+            return None
+        timestamps = np.memmap(directory / self.TIMESTAMPS, dtype=np.int64, mode='r', shape=(rows,))
+        values = np.memmap(directory / self.OHLCV, dtype=np.float64, mode='r',
+                           shape=(rows, len(FIELDS)))
+        return timestamps, values
+
+    def _append_files(self, directory: Path, meta: Dict, timestamps: np.ndarray,
+                      values: np.ndarray) -> None:
+        """meta의 rows 뒤에 이어 쓰기 (유효 범위 밖 잔여 바이트는 잘라냄)"""
+        directory.mkdir(parents=True, exist_ok=True)
+        rows = meta['rows']
+        for name, data, row_bytes in ((self.TIMESTAMPS, timestamps, 8),
+                                      (self.OHLCV, values, 8 * len(FIELDS))):
+            with open(directory / name, 'ab') as f:
+                f.truncate(rows * row_bytes)
+                f.write(np.ascontiguousarray(data).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, ticker: str, interval: str, timestamps: np.ndarray, values: np.ndarray) -> int:
+        """
+        마지막 보유 봉 이후의 캔들 추가
+        :return: 추가한 봉 수
+        """
+        meta = self.meta(ticker, interval)
+        if meta['rows']:
+            keep = timestamps > meta['last']
+            timestamps, values = timestamps[keep], values[keep]
+        if len(timestamps) == 0:
+            return 0
+        directory = self._dir(ticker, interval)
+        self._append_files(directory, meta, timestamps, values)
+        meta = dict(meta, rows=meta['rows'] + len(timestamps), last=int(timestamps[-1]),
+                    first=int(meta.get('first', timestamps[0])))
+        self._write_meta(directory, meta)
+        return len(timestamps)
+
+    def stage(self, ticker: str, interval: str, timestamps: np.ndarray, values: np.ndarray) -> int:
+        """과거 방향으로 받은 페이지 임시 저장 (cursor 이전 봉만)"""
+        meta = self.meta(ticker, interval, staging=True)
+        if meta['rows']:
+            keep = timestamps < meta['cursor']
+            timestamps, values = timestamps[keep], values[keep]
+        if len(timestamps) == 0:
+            return 0
+        directory = self._dir(ticker, interval, staging=True)
+        self._append_files(directory, meta, timestamps, values)
+        self._write_meta(directory, dict(meta, rows=meta['rows'] + len(timestamps),
+                                         cursor=int(timestamps[0])))
+        return len(timestamps)
+
+    def merge_staged(self, ticker: str, interval: str, complete: bool = False) -> int:
+        """
+        staging에 쌓인 과거 캔들을 본 파일 앞쪽에 합침 (새 파일에 쓴 뒤 교체)
+        :param complete: 거래소에 더 이전 데이터가 없음
+        :return: 합친 봉 수
+        """
+        staging = self._dir(ticker, interval, staging=True)
+        staged_rows = self.meta(ticker, interval, staging=True)['rows']
+        meta = self.meta(ticker, interval)
+        if staged_rows == 0:
+            if complete and meta['rows'] and not meta.get('complete'):
+                self._write_meta(self._dir(ticker, interval), dict(meta, complete=True))
+            return 0
+
+        ts = np.fromfile(staging / self.TIMESTAMPS, dtype=np.int64, count=staged_rows)
+        values = np.fromfile(staging / self.OHLCV, dtype=np.float64,
+                             count=staged_rows * len(FIELDS)).reshape(-1, len(FIELDS))
+        order = np.argsort(ts, kind='stable')  # 페이지는 최신 -> 과거 순으로 쌓임
+        ts, values = ts[order], values[order]
+        current = self.load(ticker, interval)
+        if current is not None:
+            keep = ts < current[0][0]
+            ts = np.concatenate([ts[keep], current[0]])
+            values = np.concatenate([values[keep], current[1]])
+        ts, unique = np.unique(ts, return_index=True)
+        values = values[unique]
+
+        directory = self._dir(ticker, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, data in ((self.TIMESTAMPS, ts), (self.OHLCV, values)):
+            tmp = directory / (name + '.tmp')
+            np.ascontiguousarray(data).tofile(tmp)
+            os.replace(tmp, directory / name)
+        self._write_meta(directory, {'rows': len(ts), 'first': int(ts[0]), 'last': int(ts[-1]),
+                                     'complete': complete or meta.get('complete', False)})
+        for name in (self.TIMESTAMPS, self.OHLCV, self.META):
+            (staging / name).unlink(missing_ok=True)
+        return staged_rows
+
+class HistoryDownloader:
+    """
+    업비트 과거 캔들 일괄 수집
+    - (티커, 간격)별로 최신 보유 봉 이후를 먼저 채우고, 이어서 since까지 과거 방향으로 페이지 수집
+    - 작업들은 스레드로 병렬 실행하고 요청 한도는 게이트웨이(candles 그룹)가 맞춤
+    - 페이지마다 staging에 기록하므로 중단 후 다시 실행하면 이어서 수집
+    """
+    PAGE_SIZE = 200       # 캔들 API 1회 최대 개수
+    MAX_RETRIES = 3
+
+    def __init__(self, exchange, store: HistoryStore, workers: int = 4):
+        self.exchange = exchange
+        self.store = store
+        self.workers = workers
+        self.logger = get_logger(__name__)
+
+    def download(self, tickers: Iterable[str], intervals: Iterable[str],
+                 since: int) -> Dict[Tuple[str, str], int]:
+        """
+        :param since: 이 시각(KST epoch 초)까지 과거 수집
+        :return: (티커, 간격)별 새로 저장한 봉 수
+        """
+        jobs = [(t, i) for t in tickers for i in intervals]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(lambda job: self._run_job(*job, since), jobs)
+            return dict(zip(jobs, results))
+
+    def _run_job(self, ticker: str, interval: str, since: int) -> int:
+        started = time.perf_counter()
+        try:
+            with self.store.lock(ticker, interval):
+                added = self.sync(ticker, interval, since)
+        except Exception as e:
+            self.logger.error(f"과거 캔들 수집 실패 - {ticker} {interval}: {e}")
+            return 0
+        meta = self.store.meta(ticker, interval)
+        self.logger.info(f"과거 캔들 수집 - {ticker} {interval}: +{added:,}봉 "
+                         f"(총 {meta['rows']:,}봉, {time.perf_counter() - started:.1f}초)")
+        return added
+
+    def sync(self, ticker: str, interval: str, since: int) -> int:
+        """(티커, 간격) 하나를 최신 상태로 맞추고 since까지 과거 수집"""
+        added = self.store.merge_staged(ticker, interval)  # 이전 실행에서 중단된 수집분
+        added += self._fill_recent(ticker, interval)
+        meta = self.store.meta(ticker, interval)
+        if meta.get('complete') or (meta['rows'] and meta['first'] <= since):
+            return added
+
+        cursor = meta.get('first') or self._closed_until(interval)
+        complete = False
+        try:
+            while cursor > since:
+                df = self._page(ticker, interval, cursor)
+                if df.empty:
+                    complete = True
+                    break
+                timestamps, values = self._to_arrays(df)
+                self.store.stage(ticker, interval, timestamps, values)
+                if len(df) < self.PAGE_SIZE:
+                    complete = True
+                    break
+                cursor = int(timestamps[0])
+        finally:
+            added += self.store.merge_staged(ticker, interval, complete)
+        return added
+
+    def _fill_recent(self, ticker: str, interval: str) -> int:
+        """마지막 저장 봉 이후 ~ 현재까지 (진행 중인 봉 제외) 추가"""
+        meta = self.store.meta(ticker, interval)
+        if not meta['rows']:
+            return 0
+        cursor = self._closed_until(interval)
+        pages: List[Tuple[np.ndarray, np.ndarray]] = []
+        while cursor > meta['last'] + INTERVAL_SECONDS[interval]:
+            df = self._page(ticker, interval, cursor)
+            if df.empty:
+                break
+            timestamps, values = self._to_arrays(df)
+            pages.append((timestamps, values))
+            if timestamps[0] <= meta['last']:
+                break
+            cursor = int(timestamps[0])
+        if not pages:
+            return 0
+        timestamps = np.concatenate([p[0] for p in reversed(pages)])
+        values = np.concatenate([p[1] for p in reversed(pages)])
+        return self.store.append(ticker, interval, timestamps, values)
+
+    def _page(self, ticker: str, interval: str, to: int):
+        """캔들 1페이지 (실패 시 재시도)"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return self.exchange.get_ohlcv_page(ticker, interval, to, self.PAGE_SIZE)
+            except Exception:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+
+    @staticmethod
+    def _closed_until(interval: str) -> int:
+        """진행 중인 봉의 시작 시각 - 이 시각 이전 봉은 모두 확정"""
+        seconds = INTERVAL_SECONDS[interval]
+        return (now_kst() - KST_OFFSET) // seconds * seconds + KST_OFFSET
+
+    @staticmethod
+    def _to_arrays(df) -> Tuple[np.ndarray, np.ndarray]:
+        timestamps = df.index.values.astype('datetime64[s]').astype(np.int64)
+        return timestamps, df[list(FIELDS)].to_numpy(dtype=np.float64)
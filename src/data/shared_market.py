@@ -0,0 +1,219 @@
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.data.candle_store import FIELDS, CandleBuffer
+from src.exchange.simulated import SyntheticQuotes
+
+# 공유 메모리 읽기는 seqlock으로 일관성 확인
+# - 쓰는 쪽(feed 프로세스 하나)은 기록 전후로 seq를 1씩 올림 (기록 중에는 홀수)
+# - 읽는 쪽은 읽기 전후 seq가 같고 짝수일 때만 결과 사용, 아니면 다시 읽음
+# - 기록 중 feed가 죽어 seq가 홀수로 남으면 읽는 쪽은 READ_TIMEOUT 후 포기하고, 새 feed가 연결 시 짝수로 복구
+READ_TIMEOUT = 0.5  # 일관된 값을 읽을 때까지 재시도하는 최대 시간 (초)
+
+def _attach(name: str, size: int, create: bool) -> shared_memory.SharedMemory:
+    if create:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    return shared_memory.SharedMemory(name=name)
+
+class SharedPrices:
+    """
+    티커별 현재가 공유 테이블
+    - 레이아웃: seq(int64), 갱신 시각(float64 epoch 초), 티커 순서대로 가격(float64, 없으면 NaN)
+    """
+
+    def __init__(self, name: str, tickers: List[str], create: bool = False):
+        self.tickers = list(tickers)
+        self.index = {t: i for i, t in enumerate(self.tickers)}
+        self.shm = _attach(name, 8 * (2 + len(self.tickers)), create)
+        self._seq = np.ndarray((1,), dtype=np.int64, buffer=self.shm.buf)
+        self._updated = np.ndarray((1,), dtype=np.float64, buffer=self.shm.buf, offset=8)
+        self._prices = np.ndarray((len(self.tickers),), dtype=np.float64, buffer=self.shm.buf,
+                                  offset=16)
+        if create:
+            self._prices[:] = np.nan
+
+    def write(self, prices: Dict[str, float]) -> None:
+        """조회한 현재가 기록 (없는 티커는 이전 값 유지)"""
+        rows = [(self.index[t], p) for t, p in prices.items() if t in self.index and p is not None]
+        self._seq[0] += 1
+        try:
+            for i, price in rows:
+                self._prices[i] = price
+            self._updated[0] = time.time()
+        finally:
+            self._seq[0] += 1
+
+    def recover(self) -> None:
+        """이전 feed가 기록 중 종료돼 seq가 홀수로 남았으면 짝수로 복구 (새 feed 연결 시)"""
+        if self._seq[0] % 2:
+            self._seq[0] += 1
+
+    def read(self) -> Tuple[np.ndarray, float]:
+        """
+        :return: (티커 순서 가격 배열 복사본, 갱신 시각)
+                 READ_TIMEOUT 안에 일관된 값을 못 읽으면 갱신 시각 0 (오래된 값으로 취급)
+        """
+        deadline = time.monotonic() + READ_TIMEOUT
+        while True:
+            seq = int(self._seq[0])
+            if seq % 2 == 0:
+                prices, updated = self._prices.copy(), float(self._updated[0])
+                if int(self._seq[0]) == seq:
+                    return prices, updated
+            if time.monotonic() > deadline:
+                return self._prices.copy(), 0.0
+            time.sleep(0)
+
+    def close(self) -> None:
+        self.shm.close()
+
+class SharedCandleBuffer(CandleBuffer):
+    """
+    공유 메모리 캔들 링 버퍼 - feed 프로세스의 CandleStore가 쓰고 워커들은 read()로 읽음
+    - 레이아웃: 헤더(seq, head, size, exhausted, capacity) + 캔들 시작 시각 + (capacity, 5) OHLCV
+    """
+    HEADER = 5
+
+    def __init__(self, name: str, capacity: int = 0, create: bool = False):
+        """
+        :param capacity: 생성 시 버퍼 크기 (연결 시에는 헤더 값 사용)
+        """
+        size = 8 * (self.HEADER + capacity * (1 + len(FIELDS)))
+        self.shm = _attach(name, size, create)
+        self._header = np.ndarray((self.HEADER,), dtype=np.int64, buffer=self.shm.buf)
+        if create:
+            self._header[:] = 0
+            self._header[4] = capacity
+        self.capacity = int(self._header[4])
+        self.timestamps = np.ndarray((self.capacity,), dtype=np.int64, buffer=self.shm.buf,
+                                     offset=8 * self.HEADER)
+        self.values = np.ndarray((self.capacity, len(FIELDS)), dtype=np.float64,
+                                 buffer=self.shm.buf, offset=8 * (self.HEADER + self.capacity))
+        self.fetched_at: Optional[float] = None
+
+    head = property(lambda self: int(self._header[1]),
+                    lambda self, v: self._header.__setitem__(1, v))
+    size = property(lambda self: int(self._header[2]),
+                    lambda self, v: self._header.__setitem__(2, v))
+    exhausted = property(lambda self: bool(self._header[3]),
+                         lambda self, v: self._header.__setitem__(3, int(v)))
+
+    def reset(self) -> None:
+        self._header[0] += 1
+        try:
+            super().reset()
+        finally:
+            self._header[0] += 1
+
+    def upsert(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        self._header[0] += 1
+        try:
+            super().upsert(timestamps, values)
+        finally:
+            self._header[0] += 1
+
+    def recover(self) -> None:
+        """이전 feed가 기록 중 종료돼 seq가 홀수로 남았으면 짝수로 복구하고 버퍼 비움 (다시 조회)"""
+        if self._header[0] % 2:
+            self._header[0] += 1
+            self.reset()
+
+    def read(self, count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """최근 count개 캔들 복사본 (비어 있거나 READ_TIMEOUT 안에 일관된 값을 못 읽으면 None)"""
+        deadline = time.monotonic() + READ_TIMEOUT
+        while True:
+            seq = int(self._header[0])
+            if seq % 2 == 0:
+                candles = self.latest(count) if self.size else None
+                if int(self._header[0]) == seq:
+                    return candles
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0)
+
+    def close(self) -> None:
+        self.shm.close()
+
+class SharedMarketData:
+    """
+    feed 프로세스와 워커들이 공유하는 시세/캔들 메모리 묶음
+    - 감독 프로세스가 create=True로 만들고 종료 시 unlink()
+    - feed/워커는 같은 prefix로 연결 (캔들 버퍼는 처음 읽을 때 연결)
+    """
+
+    def __init__(self, prefix: str, tickers: List[str], needs: Iterable[Tuple[str, int]],
+                 create: bool = False, writer: bool = False):
+        """
+        :param prefix: 공유 메모리 이름 접두사
+        :param needs: 공유할 (봉 간격, 캔들 수) 목록
+        :param writer: feed 프로세스로 연결 (이전 feed가 남긴 기록 중 상태 복구)
+        """
+        self.prefix = prefix
+        self.tickers = list(tickers)
+        self.needs = dict(needs)
+        self.writer = writer
+        self.prices = SharedPrices(f"{prefix}_prices", self.tickers, create)
+        if writer:
+            self.prices.recover()
+        self.buffers: Dict[Tuple[str, str], SharedCandleBuffer] = {}
+        if create:
+            for ticker in self.tickers:
+                for interval, count in self.needs.items():
+                    self.buffers[(ticker, interval)] = SharedCandleBuffer(
+                        self._name(ticker, interval), count, create=True)
+
+    def _name(self, ticker: str, interval: str) -> str:
+        return f"{self.prefix}_{interval}_{ticker}"
+
+    def buffer(self, ticker: str, interval: str) -> Optional[SharedCandleBuffer]:
+        """(티커, 간격) 공유 버퍼 (공유 대상이 아니면 None)"""
+        key = (ticker, interval)
+        buffer = self.buffers.get(key)
+        if buffer is None and ticker in self.prices.index and interval in self.needs:
+            buffer = self.buffers[key] = SharedCandleBuffer(self._name(ticker, interval))
+            if self.writer:
+                buffer.recover()
+        return buffer
+
+    def close(self) -> None:
+        self.prices.close()
+        for buffer in self.buffers.values():
+            buffer.close()
+
+    def unlink(self) -> None:
+        """공유 메모리 삭제 (생성한 감독 프로세스에서 한 번)"""
+        self.prices.shm.unlink()
+        for buffer in self.buffers.values():
+            buffer.shm.unlink()
+
+class SharedCandleStore:
+    """
+    워커용 캔들 저장소 - CandleStore.get_candles와 같은 형식으로 공유 버퍼를 읽음
+    - 거래소 조회는 하지 않음 (feed 프로세스가 갱신)
+    """
+
+    def __init__(self, shared: SharedMarketData):
+        self.shared = shared
+
+    def get_candles(self, ticker: str, interval: str,
+                    count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        buffer = self.shared.buffer(ticker, interval)
+        if buffer is None:
+            return None
+        return buffer.read(count)
+
+class SharedQuotes(SyntheticQuotes):
+    """모의 거래 워커용 시세 - 체결 가격을 feed 프로세스가 공유한 현재가에 맞춤"""
+
+    def __init__(self, prices: SharedPrices, **kwargs):
+        super().__init__(**kwargs)
+        self.shared_prices = prices
+
+    def price(self, ticker: str) -> float:
+        i = self.shared_prices.index.get(ticker)
+        if i is not None:
+            prices, _ = self.shared_prices.read()
+            if not np.isnan(prices[i]):
+                return float(prices[i])
+        return super().price(ticker)
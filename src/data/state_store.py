@@ -0,0 +1,156 @@
+import json
+import sqlite3
+import threading
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from src.utils.logger import get_logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cooldowns (
+    ticker TEXT PRIMARY KEY,
+    last_buy REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exits (
+    ticker TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    fired_at REAL NOT NULL,
+    profit_rate REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    currency TEXT PRIMARY KEY,
+    volume REAL NOT NULL,
+    avg_price REAL NOT NULL,
+    pending_sell REAL NOT NULL,
+    realized_pnl REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS orders (
+    uuid TEXT PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    side TEXT NOT NULL,
+    amount REAL NOT NULL,
+    reserved REAL NOT NULL,
+    state TEXT NOT NULL,
+    executed_volume REAL NOT NULL,
+    executed_funds REAL NOT NULL,
+    paid_fee REAL NOT NULL
+);
+"""
+
+class StateStore:
+    """
+    재시작 후에도 유지해야 하는 봇 상태 저장소 (SQLite WAL)
+    - 재매수 제한 시각, 일일 거래 횟수, 주문/포지션 장부
+    - 값이 바뀔 때마다 해당 행만 기록
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = get_logger(__name__)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋 단위 일관성 유지
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql: str, *params) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def _get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, value: Dict) -> None:
+        self._write("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", key, json.dumps(value))
+
+    def save_cooldown(self, ticker: str, last_buy: float) -> None:
+        """
+        :param last_buy: 마지막 매수 시각 (epoch 초)
+        """
+        self._write("INSERT OR REPLACE INTO cooldowns (ticker, last_buy) VALUES (?, ?)",
+                    ticker, last_buy)
+
+    def load_cooldowns(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT ticker, last_buy FROM cooldowns").fetchall())
+
+    def save_exit(self, ticker: str, action: str, fired_at: float, profit_rate: float) -> None:
+        """
+        마지막 익절/부분 손절 (같은 규칙 재실행 제한용)
+        :param fired_at: 실행 시각 (epoch 초)
+        """
+        self._write("INSERT OR REPLACE INTO exits (ticker, action, fired_at, profit_rate) "
+                    "VALUES (?, ?, ?, ?)", ticker, action, fired_at, profit_rate)
+
+    def delete_exit(self, ticker: str) -> None:
+        self._write("DELETE FROM exits WHERE ticker = ?", ticker)
+
+    def load_exits(self) -> Dict[str, Tuple[str, float, float]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT ticker, action, fired_at, profit_rate FROM exits").fetchall()
+        return {ticker: (action, fired_at, rate) for ticker, action, fired_at, rate in rows}
+
+    def save_daily(self, day: date, count: int) -> None:
+        """일일 거래 횟수"""
+        self._set('daily', {'date': day.isoformat(), 'count': count})
+
+    def load_daily(self) -> Optional[Tuple[date, int]]:
+        value = self._get('daily')
+        if value is None:
+            return None
+        return date.fromisoformat(value['date']), value['count']
+
+    def save_ledger(self, ledger) -> None:
+        """장부 전체를 한 트랜잭션으로 교체 (보유 코인/미체결 주문 수만큼의 작은 테이블)"""
+        state = ledger.export()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("INSERT OR REPLACE INTO kv (key, value) VALUES ('ledger', ?)",
+                                   (json.dumps(state['cash']),))
+                self._conn.execute("DELETE FROM positions")
+                self._conn.executemany(
+                    "INSERT INTO positions VALUES (:currency, :volume, :avg_price, :pending_sell, :realized_pnl)",
+                    [dict(asdict(p), currency=c) for c, p in state['positions'].items()])
+                self._conn.execute("DELETE FROM orders")
+                self._conn.executemany(
+                    "INSERT INTO orders VALUES (:uuid, :ticker, :side, :amount, :reserved, :state, "
+                    ":executed_volume, :executed_funds, :paid_fee)",
+                    [asdict(o) for o in state['orders'].values()])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_ledger(self, ledger) -> bool:
+        """
+        저장된 장부 복원
+        :return: 저장된 장부가 있었으면 True
+        """
+        cash = self._get('ledger')
+        if cash is None:
+            return False
+        with self._lock:
+            self._conn.row_factory = sqlite3.Row
+            try:
+                positions = {r['currency']: dict(r) for r in self._conn.execute("SELECT * FROM positions")}
+                orders = {r['uuid']: dict(r) for r in self._conn.execute("SELECT * FROM orders")}
+            finally:
+                self._conn.row_factory = None
+        for p in positions.values():
+            del p['currency']
+        ledger.restore({'cash': cash, 'positions': positions, 'orders': orders})
+        self.logger.info(f"장부 복원 - 보유 {len(positions)}종, 미체결 주문 {len(orders)}건")
+        return True
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import uuid
+from typing import Dict, Iterable, List, Optional, Set
+import websockets
+from src.data.candle_store import KST_OFFSET, CandleStore
+from src.utils.logger import get_logger
+
+UPBIT_WEBSOCKET_URL = "wss://api.upbit.com/websocket/v1"
+
+class MarketStream:
+    """
+    업비트 WebSocket 실시간 시세 수신기
+    - ticker/trade/orderbook 피드를 구독해 최신 가격과 호가를 메모리에 유지
+    - 체결은 캔들 저장소의 진행 봉에 반영
+    - 가격이 실제로 바뀐 티커만 모아서 알림
+    """
+
+    def __init__(self, tickers: Iterable[str], candle_store: Optional[CandleStore] = None,
+                 url: str = UPBIT_WEBSOCKET_URL, market=None,
+                 types: Iterable[str] = ('ticker', 'trade', 'orderbook'),
+                 reconnect_delay: float = 1.0):
+        """
+        :param candle_store: 체결을 반영할 캔들 저장소
+        :param market: 호가를 반영할 Market (apply_orderbook)
+        :param reconnect_delay: 연결이 끊겼을 때 재연결 대기 (초)
+        """
+        self.tickers: List[str] = list(tickers)
+        self.candle_store = candle_store
+        self.url = url
+        self.market = market
+        self.types = list(types)
+        self.reconnect_delay = reconnect_delay
+        self.logger = get_logger(__name__)
+
+        self.prices: Dict[str, float] = {}
+        self.orderbooks: Dict[str, Dict] = {}
+        self.message_count = 0
+        self._changed: Set[str] = set()
+        self._event: Optional[asyncio.Event] = None
+        self._running = False
+
+    def subscription(self) -> str:
+        """구독 요청 메시지"""
+        request = [{"ticket": str(uuid.uuid4())}]
+        request += [{"type": t, "codes": self.tickers} for t in self.types]
+        return json.dumps(request)
+
+    async def run(self) -> None:
+        """연결 유지 루프 - 끊기면 재연결"""
+        self._running = True
+        self._event = self._event or asyncio.Event()
+        while self._running:
+            try:
+                async with websockets.connect(self.url, ping_interval=60, max_size=None) as ws:
+                    await ws.send(self.subscription())
+                    self.logger.info(f"실시간 시세 연결 - {self.url} ({len(self.tickers)}개 티커)")
+                    async for raw in ws:
+                        self.handle(json.loads(raw))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"실시간 시세 연결 끊김: {e}")
+            if self._running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def handle(self, message: Dict) -> None:
+        """수신 메시지 1건 처리"""
+        self.message_count += 1
+        kind = message.get('type')
+        code = message.get('code')
+        if kind == 'trade':
+            price = message['trade_price']
+            if self.candle_store is not None:
+                timestamp = message['trade_timestamp'] // 1000 + KST_OFFSET
+                self.candle_store.apply_trade(code, timestamp, price, message['trade_volume'])
+            self._set_price(code, price)
+        elif kind == 'ticker':
+            self._set_price(code, message['trade_price'])
+        elif kind == 'orderbook':
+            self.orderbooks[code] = message
+            if self.market is not None:
+                self.market.apply_orderbook(message)
+
+    def _set_price(self, code: str, price: float) -> None:
+        """가격이 바뀐 경우에만 변경 목록에 추가"""
+        if self.prices.get(code) == price:
+            return
+        self.prices[code] = price
+        self._changed.add(code)
+        if self._event is not None:
+            self._event.set()
+
+    def pop_changed(self) -> Set[str]:
+        """마지막 조회 이후 가격이 바뀐 티커"""
+        changed, self._changed = self._changed, set()
+        if self._event is not None:
+            self._event.clear()
+        return changed
+
+    async def wait_changed(self) -> Set[str]:
+        """가격이 바뀐 티커가 생길 때까지 대기 후 반환"""
+        self._event = self._event or asyncio.Event()
+        if not self._changed:
+            await self._event.wait()
+        return self.pop_changed()
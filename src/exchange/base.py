@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+import pandas as pd
+
+class ExchangeBackend(ABC):
+    """
+    봇이 사용하는 거래소 기능 인터페이스
+    - 시세/잔고/주문 응답은 업비트 REST 응답 형식을 따름
+    """
+
+    @abstractmethod
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """티커별 현재가"""
+        pass
+
+    @abstractmethod
+    def get_orderbooks(self, tickers: List[str]) -> List[Dict]:
+        """티커별 호가 (market, orderbook_units)"""
+        pass
+
+    @abstractmethod
+    def get_tickers(self, fiat: str = 'KRW') -> List[str]:
+        """거래 가능한 전체 티커"""
+        pass
+
+    @abstractmethod
+    def get_ticker_stats(self, tickers: List[str]) -> List[Dict]:
+        """티커별 24시간 시세 통계 (업비트 /v1/ticker 응답)"""
+        pass
+
+    @abstractmethod
+    def get_ohlcv(self, ticker: str, interval: str, count: int) -> Optional[pd.DataFrame]:
+        """최근 캔들 (KST 인덱스, open/high/low/close/volume/value 열) - 실패 시 None"""
+        pass
+
+    @abstractmethod
+    def get_ohlcv_page(self, ticker: str, interval: str, to: int, count: int = 200) -> pd.DataFrame:
+        """
+        to 이전 캔들 1페이지 (과거 데이터 수집용)
+        :param to: 이 시각(KST epoch 초) 이전 봉만 반환
+        :return: 최대 count개 (더 이전 데이터가 없으면 빈 DataFrame, 실패 시 예외)
+        """
+        pass
+
+    @abstractmethod
+    def get_balances(self) -> List[Dict]:
+        """화폐별 잔고 (currency, balance, locked, avg_buy_price)"""
+        pass
+
+    @abstractmethod
+    def get_orders(self, uuids: List[str]) -> List[Dict]:
+        """주문 UUID 목록의 상태 일괄 조회 (uuid, state, executed_volume, executed_funds, paid_fee)"""
+        pass
+
+    @abstractmethod
+    def buy_market_order(self, ticker: str, price: float) -> Optional[Dict]:
+        """시장가 매수 (price: 주문 금액) - 실패 시 None"""
+        pass
+
+    @abstractmethod
+    def sell_market_order(self, ticker: str, volume: float) -> Optional[Dict]:
+        """시장가 매도 (volume: 주문 수량) - 실패 시 None"""
+        pass
@@ -0,0 +1,446 @@
+import asyncio
+import bisect
+import math
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.config.trading_config import MIN_ORDER_KRW, PaperSettings
+from src.data.candle_store import INTERVAL_SECONDS, KST_OFFSET, now_kst
+from src.data.stream import MarketStream
+from src.exchange.base import ExchangeBackend
+from src.utils.logger import get_logger
+
+class SimulatedExchangeError(Exception):
+    """모의 거래소에서 주입한 네트워크 오류"""
+    pass
+
+class SyntheticQuotes:
+    """
+    랜덤워크 가상 시세
+    - 티커별 가격은 경과 시간(step_seconds 단위)만큼 로그 정규 분포로 움직임
+    - 호가는 현재가를 중심으로 depth단계 생성
+    - 캔들은 최초 요청 시 과거 구간을 생성하고 이후 현재가로 이어 붙임
+    """
+
+    def __init__(self, volatility: float = 0.0002, step_seconds: float = 1.0,
+                 spread: float = 0.0005, depth: int = 15, capacity: int = 200, seed: int = 0,
+                 universe_size: int = 0):
+        """
+        :param volatility: step당 로그 수익률 표준편차
+        :param spread: 호가 단계 간격 (현재가 대비 비율)
+        :param capacity: 캔들 이력 최대 길이
+        :param universe_size: 전체 시장 스캔용 가상 티커 수 (KRW-SIM000 ...)
+        """
+        self.volatility = volatility
+        self.step_seconds = step_seconds
+        self.spread = spread
+        self.depth = depth
+        self.capacity = capacity
+        self.universe = [f"KRW-SIM{i:03d}" for i in range(universe_size)]
+        self.rng = np.random.default_rng(seed)
+        self._prices: Dict[str, Tuple[float, float]] = {}  # 티커 -> (가격, 갱신 시각)
+        self._candles: Dict[Tuple[str, str], Tuple[List[int], List[List[float]]]] = {}
+        self._lock = threading.RLock()
+
+    def price(self, ticker: str) -> float:
+        """현재가 - 마지막 조회 이후 경과 시간만큼 랜덤워크 진행"""
+        now = time.time()
+        with self._lock:
+            if ticker not in self._prices:
+                self._prices[ticker] = (float(10 ** self.rng.uniform(2, 7)), now)
+            price, updated = self._prices[ticker]
+            steps = (now - updated) / self.step_seconds
+            if steps > 0:
+                price *= math.exp(self.rng.normal(0, self.volatility * math.sqrt(steps)))
+                self._prices[ticker] = (price, now)
+            return price
+
+    def orderbook(self, ticker: str) -> Dict:
+        """현재가 중심의 가상 호가"""
+        price = self.price(ticker)
+        with self._lock:
+            sizes = self.rng.exponential(2_000_000 / price, size=(self.depth, 2))
+        units = [{'ask_price': price * (1 + self.spread * (k + 0.5)),
+                  'bid_price': price * (1 - self.spread * (k + 0.5)),
+                  'ask_size': float(sizes[k, 0]), 'bid_size': float(sizes[k, 1])}
+                 for k in range(self.depth)]
+        return {'market': ticker, 'timestamp': int(time.time() * 1000),
+                'total_ask_size': float(sizes[:, 0].sum()),
+                'total_bid_size': float(sizes[:, 1].sum()),
+                'orderbook_units': units}
+
+    def markets(self, fiat: str = 'KRW') -> List[str]:
+        """거래 가능한 티커 (가상 유니버스 + 조회된 적 있는 티커)"""
+        with self._lock:
+            known = set(self._prices) | set(self.universe)
+        return sorted(t for t in known if t.startswith(fiat))
+
+    def stats(self, ticker: str) -> Dict:
+        """24시간 시세 통계 (업비트 /v1/ticker 응답 형식)"""
+        timestamps, rows = self._bars(ticker, 'day', 2)
+        prev, today = rows
+        price = today[3]
+        return {'market': ticker, 'trade_price': price, 'opening_price': today[0],
+                'high_price': today[1], 'low_price': today[2], 'prev_closing_price': prev[3],
+                'signed_change_rate': price / prev[3] - 1,
+                'acc_trade_volume_24h': prev[4] + today[4],
+                'acc_trade_price_24h': (prev[4] + today[4]) * price,
+                'timestamp': int(time.time() * 1000)}
+
+    def ohlcv(self, ticker: str, interval: str, count: int) -> pd.DataFrame:
+        """최근 count개 캔들 (KST 인덱스)"""
+        timestamps, rows = self._bars(ticker, interval, count)
+        df = pd.DataFrame(rows, index=pd.DatetimeIndex(np.array(timestamps, dtype='datetime64[s]')),
+                          columns=['open', 'high', 'low', 'close', 'volume'])
+        df['value'] = df['close'] * df['volume']
+        return df
+
+    def _bars(self, ticker: str, interval: str,
+              count: int) -> Tuple[List[int], List[List[float]]]:
+        """최근 count개 캔들 복사본 - 진행 중인 봉은 현재가로 갱신"""
+        sec = INTERVAL_SECONDS[interval]
+        price = self.price(ticker)
+        current = (now_kst() - KST_OFFSET) // sec * sec + KST_OFFSET
+        with self._lock:
+            key = (ticker, interval)
+            if key not in self._candles:
+                self._candles[key] = self._history(price, current, sec, max(count, self.capacity))
+            timestamps, rows = self._candles[key]
+            last = timestamps[-1]
+            while last < current:
+                close = rows[-1][3]
+                last += sec
+                timestamps.append(last)
+                rows.append([close, close, close, close, 0.0])
+            row = rows[-1]
+            row[1] = max(row[1], price)
+            row[2] = min(row[2], price)
+            row[3] = price
+            row[4] += float(self.rng.exponential(1_000_000 / price))
+            del timestamps[:-self.capacity], rows[:-self.capacity]
+            return timestamps[-count:], [list(r) for r in rows[-count:]]
+
+    def _history(self, price: float, current: int, sec: int,
+                 count: int) -> Tuple[List[int], List[List[float]]]:
+        """현재가에서 끝나는 과거 캔들 생성"""
+        sigma = self.volatility * math.sqrt(sec / self.step_seconds)
+        returns = self.rng.normal(0, sigma, size=count)
+        closes = price * np.exp(-np.cumsum(returns[::-1]))[::-1]
+        closes = np.append(closes[1:], price)
+        opens = np.append(closes[0] * math.exp(-returns[0]), closes[:-1])
+        wiggle = np.abs(self.rng.normal(0, sigma / 2, size=(2, count)))
+        highs = np.maximum(opens, closes) * (1 + wiggle[0])
+        lows = np.minimum(opens, closes) * (1 - wiggle[1])
+        volumes = self.rng.exponential(sec * 10_000 / price, size=count)
+        timestamps = [current - (count - 1 - i) * sec for i in range(count)]
+        rows = np.column_stack([opens, highs, lows, closes, volumes]).tolist()
+        return timestamps, rows
+
+class ReplayQuotes(SyntheticQuotes):
+    """
+    녹화된 WebSocket 메시지를 재생하는 시세
+    - 벽시계 경과 시간 x speed 만큼 녹화 시간축을 진행 (끝나면 처음부터 반복)
+    - 녹화에 없는 티커는 가상 시세 사용
+    """
+
+    def __init__(self, messages: List[Dict], speed: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.speed = speed
+        trades: Dict[str, List[Tuple[int, float]]] = {}
+        books: Dict[str, List[Tuple[int, Dict]]] = {}
+        for m in messages:
+            code, kind = m.get('code'), m.get('type')
+            if kind in ('trade', 'ticker'):
+                trades.setdefault(code, []).append((m.get('trade_timestamp', m.get('timestamp')),
+                                                    m['trade_price']))
+            elif kind == 'orderbook':
+                books.setdefault(code, []).append((m['timestamp'], m))
+        self._trades = {code: (np.array([t for t, _ in v]), np.array([p for _, p in v]))
+                        for code, v in ((c, sorted(v, key=lambda x: x[0])) for c, v in trades.items())}
+        self._books = {code: sorted(v, key=lambda x: x[0]) for code, v in books.items()}
+        self._book_stamps = {code: [t for t, _ in v] for code, v in self._books.items()}
+        stamps = [m['timestamp'] for m in messages if 'timestamp' in m]
+        self.start_ms = min(stamps) if stamps else 0
+        self.duration_ms = max(max(stamps) - self.start_ms, 1) if stamps else 1
+        self.started = time.time()
+
+    def markets(self, fiat: str = 'KRW') -> List[str]:
+        recorded = {t for t in self._trades if t.startswith(fiat)}
+        return sorted(set(super().markets(fiat)) | recorded)
+
+    def _cursor(self) -> int:
+        """현재 벽시계에 대응하는 녹화 시각 (ms)"""
+        elapsed = (time.time() - self.started) * 1000 * self.speed
+        return self.start_ms + int(elapsed % self.duration_ms)
+
+    def price(self, ticker: str) -> float:
+        if ticker not in self._trades:
+            return super().price(ticker)
+        stamps, prices = self._trades[ticker]
+        i = max(int(np.searchsorted(stamps, self._cursor(), side='right')) - 1, 0)
+        return float(prices[i])
+
+    def orderbook(self, ticker: str) -> Dict:
+        if ticker not in self._books:
+            return super().orderbook(ticker)
+        i = max(bisect.bisect_right(self._book_stamps[ticker], self._cursor()) - 1, 0)
+        message = self._books[ticker][i][1]
+        return {'market': ticker, 'timestamp': message['timestamp'],
+                'total_ask_size': message.get('total_ask_size'),
+                'total_bid_size': message.get('total_bid_size'),
+                'orderbook_units': message['orderbook_units']}
+
+class QuoteStream(MarketStream):
+    """
+    모의 시세 소스로 구동하는 실시간 시세 (모의 거래 stream 모드용)
+    - WebSocket 대신 interval초마다 체결에 쓰는 시세 소스의 현재가/호가를 메시지로 만들어 처리
+    - 신호 판단 가격과 모의 체결 가격이 같은 시세 소스에서 나옴
+    """
+
+    def __init__(self, quotes: SyntheticQuotes, tickers: Iterable[str], candle_store=None, market=None,
+                 interval: float = 1.0):
+        """
+        :param quotes: 모의 거래소와 공유하는 시세 소스 (SyntheticQuotes/ReplayQuotes)
+        :param interval: 시세 갱신 간격 (초)
+        """
+        super().__init__(tickers, candle_store, url='paper://quotes', market=market)
+        self.quotes = quotes
+        self.interval = interval
+
+    async def run(self) -> None:
+        self._running = True
+        self._event = self._event or asyncio.Event()
+        self.logger.info(f"모의 실시간 시세 시작 - {len(self.tickers)}개 티커, {self.interval}초 간격")
+        while self._running:
+            for message in self.poll():
+                self.handle(message)
+            await asyncio.sleep(self.interval)
+
+    def poll(self) -> List[Dict]:
+        """구독 티커의 현재 시세를 업비트 WebSocket 메시지 형식으로"""
+        now = int(time.time() * 1000)
+        messages = []
+        for ticker in self.tickers:
+            price = self.quotes.price(ticker)
+            if 'trade' in self.types:
+                messages.append({'type': 'trade', 'code': ticker, 'trade_price': price,
+                                 'trade_volume': 0.0, 'trade_timestamp': now})
+            if 'ticker' in self.types:
+                messages.append({'type': 'ticker', 'code': ticker, 'trade_price': price,
+                                 'timestamp': now})
+            if 'orderbook' in self.types:
+                messages.append({**self.quotes.orderbook(ticker), 'type': 'orderbook', 'code': ticker})
+        return messages
+
+class SimulatedExchange(ExchangeBackend):
+    """
+    프로세스 내 모의 업비트
+    - 원화/코인 잔고와 평균 매수가 관리
+    - 시장가 주문은 시세 소스의 호가를 소진하며 체결, 수수료 차감
+    - 요청마다 지연 시간과 오류를 확률적으로 주입
+    """
+
+    def __init__(self, quotes: SyntheticQuotes, initial_krw: float = 4000000,
+                 fee_rate: float = 0.0005, latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        """
+        :param quotes: 시세 소스 (SyntheticQuotes/ReplayQuotes)
+        :param latency: 요청당 평균 지연 (초)
+        :param latency_jitter: 지연 편차 (초)
+        :param error_rate: 요청 실패 확률
+        """
+        self.quotes = quotes
+        self.fee_rate = fee_rate
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.logger = get_logger(__name__)
+        self.rng = random.Random(seed)
+        self.balances: Dict[str, Dict[str, float]] = {
+            'KRW': {'balance': float(initial_krw), 'avg_buy_price': 0.0}
+        }
+        self.orders: Dict[str, Dict] = {}
+        self.total_fee = 0.0
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def _network(self) -> None:
+        """지연 주입 후 설정 확률로 오류 발생"""
+        with self._lock:
+            self.request_count += 1
+            delay = max(0.0, self.rng.gauss(self.latency, self.latency_jitter)) if self.latency else 0.0
+            failed = self.rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if failed:
+            raise SimulatedExchangeError("모의 네트워크 오류")
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        self._network()
+        return {ticker: self.quotes.price(ticker) for ticker in tickers}
+
+    def get_orderbooks(self, tickers: List[str]) -> List[Dict]:
+        self._network()
+        return [self.quotes.orderbook(ticker) for ticker in tickers]
+
+    def get_ohlcv(self, ticker: str, interval: str, count: int) -> Optional[pd.DataFrame]:
+        try:
+            self._network()
+        except SimulatedExchangeError:
+            return None  # pyupbit.get_ohlcv와 같이 실패 시 None
+        return self.quotes.ohlcv(ticker, interval, count)
+
+    def get_ohlcv_page(self, ticker: str, interval: str, to: int, count: int = 200) -> pd.DataFrame:
+        """가상 시세는 최근 capacity개 봉까지만 제공"""
+        self._network()
+        df = self.quotes.ohlcv(ticker, interval, self.quotes.capacity)
+        timestamps = df.index.values.astype('datetime64[s]').astype(np.int64)
+        return df[timestamps < to].tail(count)
+
+    def get_tickers(self, fiat: str = 'KRW') -> List[str]:
+        self._network()
+        return self.quotes.markets(fiat)
+
+    def get_ticker_stats(self, tickers: List[str]) -> List[Dict]:
+        self._network()
+        return [self.quotes.stats(ticker) for ticker in tickers]
+
+    def get_balances(self) -> List[Dict]:
+        self._network()
+        with self._lock:
+            return [{'currency': currency, 'balance': str(b['balance']), 'locked': '0',
+                     'avg_buy_price': str(b['avg_buy_price']), 'avg_buy_price_modified': False,
+                     'unit_currency': 'KRW'}
+                    for currency, b in self.balances.items()]
+
+    def get_orders(self, uuids: List[str]) -> List[Dict]:
+        self._network()
+        with self._lock:
+            return [dict(self.orders[u]) for u in uuids if u in self.orders]
+
+    def buy_market_order(self, ticker: str, price: float) -> Optional[Dict]:
+        try:
+            self._network()
+        except SimulatedExchangeError as e:
+            self.logger.error(f"모의 매수 실패 - {ticker}: {e}")
+            return None  # pyupbit 주문 함수와 같이 실패 시 None
+        if price < MIN_ORDER_KRW:
+            self.logger.error(f"모의 매수 실패 - {ticker}: 최소 주문 금액 미만")
+            return None
+
+        units = self.quotes.orderbook(ticker)['orderbook_units']
+        volume, _ = self._fill(units, 'ask', krw=price)
+        fee = price * self.fee_rate
+        currency = ticker.split('-')[1]
+        with self._lock:
+            krw = self.balances['KRW']
+            if krw['balance'] < price + fee:
+                self.logger.error(f"모의 매수 실패 - {ticker}: 잔고 부족")
+                return None
+            krw['balance'] -= price + fee
+            coin = self.balances.setdefault(currency, {'balance': 0.0, 'avg_buy_price': 0.0})
+            held = coin['balance']
+            coin['avg_buy_price'] = (held * coin['avg_buy_price'] + price) / (held + volume)
+            coin['balance'] = held + volume
+            self.total_fee += fee
+            return self._record(ticker, 'bid', 'price', volume, price, fee)
+
+    def sell_market_order(self, ticker: str, volume: float) -> Optional[Dict]:
+        try:
+            self._network()
+        except SimulatedExchangeError as e:
+            self.logger.error(f"모의 매도 실패 - {ticker}: {e}")
+            return None
+
+        units = self.quotes.orderbook(ticker)['orderbook_units']
+        proceeds, _ = self._fill(units, 'bid', volume=volume)
+        fee = proceeds * self.fee_rate
+        currency = ticker.split('-')[1]
+        with self._lock:
+            coin = self.balances.get(currency)
+            if coin is None or coin['balance'] < volume:
+                self.logger.error(f"모의 매도 실패 - {ticker}: 보유 수량 부족")
+                return None
+            coin['balance'] -= volume
+            if coin['balance'] <= 1e-12:
+                del self.balances[currency]
+            self.balances['KRW']['balance'] += proceeds - fee
+            self.total_fee += fee
+            return self._record(ticker, 'ask', 'market', volume, proceeds, fee)
+
+    @staticmethod
+    def _fill(units: List[Dict], side: str, krw: float = 0.0,
+              volume: float = 0.0) -> Tuple[float, float]:
+        """
+        호가를 순서대로 소진하며 체결
+        - 매수(ask): krw 금액으로 살 수 있는 수량 반환
+        - 매도(bid): volume 수량을 판 금액 반환
+        호가가 모자라면 마지막 단계 가격으로 나머지를 체결
+        """
+        price_key, size_key = f'{side}_price', f'{side}_size'
+        filled = 0.0
+        for unit in units:
+            unit_price, size = unit[price_key], unit[size_key]
+            if side == 'ask':
+                take = min(krw, unit_price * size)
+                filled += take / unit_price
+                krw -= take
+                if krw <= 0:
+                    return filled, 0.0
+            else:
+                take = min(volume, size)
+                filled += take * unit_price
+                volume -= take
+                if volume <= 0:
+                    return filled, 0.0
+        last = units[-1][price_key]
+        if side == 'ask':
+            return filled + krw / last, krw
+        return filled + volume * last, volume
+
+    def _record(self, ticker: str, side: str, ord_type: str, volume: float,
+                funds: float, fee: float) -> Dict:
+        """체결 완료 주문 기록 (업비트 주문 응답 형식)"""
+        order = {
+            'uuid': str(uuid.uuid4()), 'side': side, 'ord_type': ord_type,
+            'market': ticker, 'state': 'done',
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'volume': str(volume), 'remaining_volume': '0',
+            'executed_volume': str(volume), 'executed_funds': str(funds), 'paid_fee': str(fee),
+            'price': str(funds), 'avg_price': str(funds / volume if volume else 0),
+            'trades_count': 1,
+        }
+        self.orders[order['uuid']] = order
+        return order
+
+    def equity(self) -> float:
+        """원화 + 코인 평가금액 (현재가 기준)"""
+        with self._lock:
+            holdings = {c: b['balance'] for c, b in self.balances.items() if c != 'KRW'}
+            total = self.balances['KRW']['balance']
+        return total + sum(v * self.quotes.price(f'KRW-{c}') for c, v in holdings.items())
+
+def create_paper_exchange(settings: PaperSettings, quotes: Optional[SyntheticQuotes] = None
+                          ) -> SimulatedExchange:
+    """
+    설정으로 모의 거래소 생성 (replay 경로가 있으면 녹화 시세 재생)
+    :param quotes: 사용할 시세 소스 (지정하면 설정의 시세 옵션 무시)
+    """
+    if quotes is None:
+        quote_args = dict(volatility=settings.volatility, seed=settings.seed,
+                          universe_size=settings.universe_size)
+        if settings.replay:
+            from src.data.fake_ws_server import load_messages
+            quotes = ReplayQuotes(load_messages(Path(settings.replay)), speed=settings.replay_speed,
+                                  **quote_args)
+        else:
+            quotes = SyntheticQuotes(**quote_args)
+    return SimulatedExchange(quotes, initial_krw=settings.initial_krw, fee_rate=settings.fee_rate,
+                             latency=settings.latency, latency_jitter=settings.latency_jitter,
+                             error_rate=settings.error_rate, seed=settings.seed)
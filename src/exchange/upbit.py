@@ -0,0 +1,89 @@
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+import pandas as pd
+import pyupbit
+from pyupbit.quotation_api import get_url_ohlcv
+from pyupbit.request_api import _call_public_api, _send_get_request
+from src.api.gateway import Priority, get_gateway
+from src.config.trading_config import APIConfig
+from src.data.candle_store import KST_OFFSET
+from src.exchange.base import ExchangeBackend
+
+class UpbitExchange(ExchangeBackend):
+    """pyupbit 기반 실거래 백엔드 - 모든 호출은 요청 게이트웨이를 거침"""
+    ORDERS_URL = "https://api.upbit.com/v1/orders"
+    ORDER_STATES = ('wait', 'watch', 'done', 'cancel')  # 생략하면 wait만 조회됨
+
+    def __init__(self, api_keys: Optional[APIConfig] = None):
+        """
+        :param api_keys: 업비트 API 키 (없으면 시세 조회만 가능)
+        """
+        self.gateway = get_gateway()
+        self.upbit = (pyupbit.Upbit(api_keys.access_key, api_keys.secret_key)
+                      if api_keys is not None else None)
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        result = self.gateway.call('ticker', pyupbit.get_current_price, tickers)
+        if isinstance(result, dict):
+            return result
+        return {} if result is None else {tickers[0]: result}
+
+    def get_orderbooks(self, tickers: List[str]) -> List[Dict]:
+        result = self.gateway.call('orderbook', pyupbit.get_orderbook, ticker=tickers)
+        if isinstance(result, dict):
+            return [result]
+        return result or []
+
+    def get_tickers(self, fiat: str = 'KRW') -> List[str]:
+        return self.gateway.call('market', pyupbit.get_tickers, fiat=fiat) or []
+
+    def get_ticker_stats(self, tickers: List[str]) -> List[Dict]:
+        result = self.gateway.call('ticker', pyupbit.get_current_price, tickers, verbose=True)
+        if isinstance(result, dict):
+            return [result]
+        return result or []
+
+    def get_ohlcv(self, ticker: str, interval: str, count: int) -> Optional[pd.DataFrame]:
+        return self.gateway.call('candles', pyupbit.get_ohlcv, ticker, interval=interval,
+                                 count=count, priority=Priority.LOW)
+
+    def get_ohlcv_page(self, ticker: str, interval: str, to: int, count: int = 200) -> pd.DataFrame:
+        return self.gateway.call('candles', self._get_ohlcv_page, ticker, interval, to, count,
+                                 priority=Priority.LOW)
+
+    @staticmethod
+    def _get_ohlcv_page(ticker: str, interval: str, to: int, count: int) -> pd.DataFrame:
+        """
+        캔들 API 1회 호출 (pyupbit.get_ohlcv는 빈 응답과 실패를 모두 None으로 돌려줘 구분 불가)
+        - to는 업비트 규격대로 UTC 문자열로 전달
+        """
+        contents, _ = _call_public_api(get_url_ohlcv(interval), market=ticker, count=count,
+                                       to=time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(to - KST_OFFSET)))
+        index = [datetime.strptime(x['candle_date_time_kst'], "%Y-%m-%dT%H:%M:%S") for x in contents]
+        df = pd.DataFrame(contents, index=pd.DatetimeIndex(index),
+                          columns=['opening_price', 'high_price', 'low_price', 'trade_price',
+                                   'candle_acc_trade_volume', 'candle_acc_trade_price'])
+        df.columns = ['open', 'high', 'low', 'close', 'volume', 'value']
+        return df.sort_index()
+
+    def get_balances(self) -> List[Dict]:
+        return self.gateway.call('default', self.upbit.get_balances)
+
+    def get_orders(self, uuids: List[str]) -> List[Dict]:
+        return self.gateway.call('default', self._get_orders, list(uuids))
+
+    def _get_orders(self, uuids: List[str]) -> List[Dict]:
+        """GET /v1/orders?uuids[]=...&states[]=... (pyupbit에 없는 일괄 조회, 체결 완료 주문 포함)"""
+        data = {'uuids[]': uuids, 'states[]': list(self.ORDER_STATES)}
+        headers = self.upbit._request_headers(data)
+        result, _ = _send_get_request(self.ORDERS_URL, headers=headers, data=data)
+        return result
+
+    def buy_market_order(self, ticker: str, price: float) -> Optional[Dict]:
+        return self.gateway.call('order', self.upbit.buy_market_order, ticker, price,
+                                 priority=Priority.CRITICAL)
+
+    def sell_market_order(self, ticker: str, volume: float) -> Optional[Dict]:
+        return self.gateway.call('order', self.upbit.sell_market_order, ticker, volume,
+                                 priority=Priority.CRITICAL)
@@ -0,0 +1,174 @@
+from typing import Dict, List, Tuple
+import numpy as np
+
+def compute_heikin_ashi(o: np.ndarray, h: np.ndarray, l: np.ndarray,
+                        c: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    하이킨 아시 봉 일괄 계산
+    - 마지막 축이 시간축인 1-D 또는 2-D(티커, 봉) 배열을 받음
+    - HA 시가는 이전 HA 시가/종가의 평균인 재귀 정의를 따름
+    :return: (ha_open, ha_high, ha_low, ha_close)
+    """
+    ha_close = (o + h + l + c) / 4
+    ha_open = np.empty_like(ha_close)
+    ha_open[..., 0] = (o[..., 0] + c[..., 0]) / 2
+    # 시간축으로만 순차 계산하고 티커 축은 벡터 연산
+    for t in range(1, ha_close.shape[-1]):
+        ha_open[..., t] = (ha_open[..., t - 1] + ha_close[..., t - 1]) / 2
+    ha_high = np.maximum(np.maximum(h, ha_open), ha_close)
+    ha_low = np.minimum(np.minimum(l, ha_open), ha_close)
+    return ha_open, ha_high, ha_low, ha_close
+
+class HeikinAshiEngine:
+    """
+    여러 티커의 하이킨 아시 상태를 2-D 배열(티커별 한 행)로 유지하는 지표 엔진
+    - 진행 중인 봉은 제자리 갱신, 새 봉은 직전 HA 값으로부터 O(1) 계산
+    - 추세 플래그는 전체 티커에 대한 불리언 배열로 제공
+    """
+
+    def __init__(self, recent_candles: int = 3, capacity: int = 64):
+        """
+        :param recent_candles: 강세 추세 판단에 쓰는 최근 봉 수
+        :param capacity: 초기 티커 수용량 (부족하면 자동 확장)
+        """
+        self.recent_candles = recent_candles
+        self.depth = max(recent_candles, 2)   # 행마다 보관하는 최근 HA 봉 수
+        self.rows: Dict[str, int] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """상태 배열 할당 (기존 값 유지)"""
+        old = getattr(self, 'bar_time', None)
+        n = 0 if old is None else len(self.rows)
+
+        bar_time = np.full(capacity, -1, dtype=np.int64)
+        filled = np.zeros(capacity, dtype=np.int64)
+        arrays = [np.zeros((capacity, self.depth), dtype=np.float64) for _ in range(4)]
+        if old is not None:
+            bar_time[:n] = self.bar_time[:n]
+            filled[:n] = self.filled[:n]
+            for new, cur in zip(arrays, (self.ha_open, self.ha_high, self.ha_low, self.ha_close)):
+                new[:n] = cur[:n]
+
+        self.bar_time = bar_time   # 행별 최근 봉 시작 시각
+        self.filled = filled       # 행별 유효한 HA 봉 수
+        self.ha_open, self.ha_high, self.ha_low, self.ha_close = arrays
+
+    def row(self, ticker: str) -> int:
+        """티커의 행 번호 반환 (없으면 추가)"""
+        i = self.rows.get(ticker)
+        if i is None:
+            i = len(self.rows)
+            if i >= len(self.bar_time):
+                self._allocate(len(self.bar_time) * 2)
+            self.rows[ticker] = i
+        return i
+
+    def warmup(self, ticker: str, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """
+        과거 캔들로 티커 상태 초기화
+        :param timestamps: 캔들 시작 시각 배열
+        :param values: (n, 4 이상) OHLC 배열
+        """
+        i = self.row(ticker)
+        ha = compute_heikin_ashi(values[:, 0], values[:, 1], values[:, 2], values[:, 3])
+        n = min(len(timestamps), self.depth)
+        for target, source in zip((self.ha_open, self.ha_high, self.ha_low, self.ha_close), ha):
+            target[i, :] = 0
+            target[i, self.depth - n:] = source[-n:]
+        self.bar_time[i] = timestamps[-1]
+        self.filled[i] = n
+
+    def update(self, ticker: str, timestamp: int, o: float, h: float, l: float, c: float) -> None:
+        """
+        캔들 1개 반영 - O(1)
+        - 같은 시각이면 진행 중인 봉 갱신, 더 최근이면 새 봉 추가
+        """
+        i = self.row(ticker)
+        if timestamp < self.bar_time[i]:
+            return
+        if timestamp > self.bar_time[i]:
+            for arr in (self.ha_open, self.ha_high, self.ha_low, self.ha_close):
+                arr[i, :-1] = arr[i, 1:]
+            self.bar_time[i] = timestamp
+            self.filled[i] = min(self.filled[i] + 1, self.depth)
+
+        ha_close = (o + h + l + c) / 4
+        if self.filled[i] > 1:
+            ha_open = (self.ha_open[i, -2] + self.ha_close[i, -2]) / 2
+        else:
+            ha_open = (o + c) / 2
+        self.ha_open[i, -1] = ha_open
+        self.ha_close[i, -1] = ha_close
+        self.ha_high[i, -1] = max(h, ha_open, ha_close)
+        self.ha_low[i, -1] = min(l, ha_open, ha_close)
+
+    def update_many(self, rows: np.ndarray, timestamps: np.ndarray, o: np.ndarray,
+                    h: np.ndarray, l: np.ndarray, c: np.ndarray) -> None:
+        """
+        여러 티커의 캔들을 한 번에 반영 (행 번호 배열 기준, 행 중복 불가)
+        """
+        current = self.bar_time[rows]
+        valid = timestamps >= current
+        rows, timestamps = rows[valid], timestamps[valid]
+        o, h, l, c = o[valid], h[valid], l[valid], c[valid]
+
+        new_bar = timestamps > self.bar_time[rows]
+        shifted = rows[new_bar]
+        for arr in (self.ha_open, self.ha_high, self.ha_low, self.ha_close):
+            arr[shifted, :-1] = arr[shifted, 1:]
+        self.bar_time[shifted] = timestamps[new_bar]
+        self.filled[shifted] = np.minimum(self.filled[shifted] + 1, self.depth)
+
+        ha_close = (o + h + l + c) / 4
+        ha_open = np.where(self.filled[rows] > 1,
+                           (self.ha_open[rows, -2] + self.ha_close[rows, -2]) / 2,
+                           (o + c) / 2)
+        self.ha_open[rows, -1] = ha_open
+        self.ha_close[rows, -1] = ha_close
+        self.ha_high[rows, -1] = np.maximum(np.maximum(h, ha_open), ha_close)
+        self.ha_low[rows, -1] = np.minimum(np.minimum(l, ha_open), ha_close)
+
+    def _view(self, rows) -> slice:
+        """행 선택자 - 지정이 없으면 등록된 전체 행"""
+        return slice(0, len(self.rows)) if rows is None else rows
+
+    def trend(self, rows=None) -> np.ndarray:
+        """현재 봉 상승 여부"""
+        r = self._view(rows)
+        return self.ha_close[r, -1] > self.ha_open[r, -1]
+
+    def prev_trend(self, rows=None) -> np.ndarray:
+        """직전 봉 상승 여부"""
+        r = self._view(rows)
+        return (self.ha_close[r, -2] > self.ha_open[r, -2]) & (self.filled[r] >= 2)
+
+    def strong_trend(self, rows=None) -> np.ndarray:
+        """최근 봉들이 모두 같은 방향인지 여부"""
+        r = self._view(rows)
+        k = self.recent_candles
+        close, open_ = self.ha_close[r, -k:], self.ha_open[r, -k:]
+        same_direction = (close > open_).all(axis=1) | (close < open_).all(axis=1)
+        return same_direction & (self.filled[r] >= k)
+
+    def buy_signals(self, rows=None) -> np.ndarray:
+        """상승 전환 매수 신호 - 현재 상승, 강세, 직전 하락"""
+        return self.trend(rows) & self.strong_trend(rows) & ~self.prev_trend(rows)
+
+    def snapshot(self, ticker: str) -> Dict:
+        """티커의 최근 HA 봉과 추세 정보"""
+        i = self.rows[ticker]
+        return {
+            'open': float(self.ha_open[i, -1]),
+            'high': float(self.ha_high[i, -1]),
+            'low': float(self.ha_low[i, -1]),
+            'close': float(self.ha_close[i, -1]),
+            'trend': 'up' if self.trend([i])[0] else 'down',
+            'strong_trend': bool(self.strong_trend([i])[0]),
+            'body_size': float(abs(self.ha_close[i, -1] - self.ha_open[i, -1])),
+            'prev_trend': 'up' if self.prev_trend([i])[0] else 'down'
+        }
+
+    def tickers(self) -> List[str]:
+        """행 순서대로 등록된 티커 목록"""
+        return sorted(self.rows, key=self.rows.get)
@@ -0,0 +1,301 @@
+import math
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import numpy as np
+from src.data.candle_store import HIGH, LOW, CLOSE
+
+class Operator:
+    """
+    스트리밍 지표 연산자 기반 클래스
+    - update()는 확정된 입력 1개를 받아 O(1)로 상태를 갱신하고 현재 값을 반환
+    - 과거 데이터 초기화도 같은 update()를 순서대로 호출하므로 실시간 갱신과 결과가 같음
+    - 준비 전(봉 수 부족)에는 value가 None
+    """
+    __slots__ = ('value', 'count')
+    period = 1
+
+    def __init__(self):
+        self.value = None
+        self.count = 0   # 지금까지 반영한 입력 수
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def reset(self) -> None:
+        self.value = None
+        self.count = 0
+
+    def update(self, x):
+        raise NotImplementedError
+
+class Field(Operator):
+    """봉에서 한 필드 선택 (OPEN/HIGH/LOW/CLOSE/VOLUME 열 번호)"""
+    __slots__ = ('index',)
+
+    def __init__(self, index: int = CLOSE):
+        super().__init__()
+        self.index = index
+
+    def update(self, bar) -> float:
+        self.count += 1
+        self.value = float(bar[self.index])
+        return self.value
+
+class TrueRange(Operator):
+    """진폭 - max(고가-저가, |고가-전봉 종가|, |저가-전봉 종가|) (첫 봉은 고가-저가)"""
+    __slots__ = ('prev_close',)
+
+    def __init__(self):
+        super().__init__()
+        self.prev_close = None
+
+    def reset(self) -> None:
+        super().reset()
+        self.prev_close = None
+
+    def update(self, bar) -> float:
+        high, low, close = float(bar[HIGH]), float(bar[LOW]), float(bar[CLOSE])
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.count += 1
+        self.value = tr
+        return tr
+
+class SMA(Operator):
+    """단순 이동평균 (원형 배열 + 누적 합)"""
+    __slots__ = ('period', 'window', 'total')
+
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self.window = np.zeros(period, dtype=np.float64)
+        self.total = 0.0
+
+    def reset(self) -> None:
+        super().reset()
+        self.window[:] = 0
+        self.total = 0.0
+
+    def update(self, x: float) -> Optional[float]:
+        i = self.count % self.period
+        self.total += x - self.window[i]
+        self.window[i] = x
+        self.count += 1
+        if self.count >= self.period:
+            self.value = self.total / self.period
+        return self.value
+
+class EMA(Operator):
+    """지수 이동평균 - 첫 period개의 단순 평균으로 시작"""
+    __slots__ = ('period', 'alpha', 'seed')
+
+    def __init__(self, period: int, alpha: Optional[float] = None):
+        """
+        :param alpha: 평활 계수 (없으면 2 / (period + 1))
+        """
+        super().__init__()
+        self.period = period
+        self.alpha = alpha if alpha is not None else 2 / (period + 1)
+        self.seed = 0.0
+
+    def reset(self) -> None:
+        super().reset()
+        self.seed = 0.0
+
+    def update(self, x: float) -> Optional[float]:
+        self.count += 1
+        if self.count < self.period:
+            self.seed += x
+        elif self.count == self.period:
+            self.value = (self.seed + x) / self.period
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+class RMA(EMA):
+    """와일더 이동평균 (평활 계수 1 / period) - ATR/RSI에 사용"""
+    __slots__ = ()
+
+    def __init__(self, period: int):
+        super().__init__(period, alpha=1 / period)
+
+class Chain(Operator):
+    """연산자 직렬 연결 - 앞 연산자가 준비된 뒤의 출력만 다음 연산자에 전달"""
+    __slots__ = ('ops',)
+
+    def __init__(self, *ops: Operator):
+        super().__init__()
+        self.ops = ops
+
+    @property
+    def period(self) -> int:
+        """첫 값이 나오기까지 필요한 입력 수"""
+        return sum(op.period for op in self.ops) - len(self.ops) + 1
+
+    def reset(self) -> None:
+        super().reset()
+        for op in self.ops:
+            op.reset()
+
+    def update(self, x):
+        self.count += 1
+        for op in self.ops:
+            x = op.update(x)
+            if x is None:
+                return None
+        self.value = x
+        return x
+
+class ATR(Chain):
+    """평균 진폭 (진폭의 와일더 이동평균)"""
+    __slots__ = ()
+
+    def __init__(self, period: int = 14):
+        super().__init__(TrueRange(), RMA(period))
+
+class RSI(Operator):
+    """상대강도지수 (와일더 방식, 0~100)"""
+    __slots__ = ('period', 'prev', 'gain', 'loss')
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.period = period + 1   # 첫 값은 직전 값이 있어야 변화량이 생김
+        self.prev = None
+        self.gain = RMA(period)
+        self.loss = RMA(period)
+
+    def reset(self) -> None:
+        super().reset()
+        self.prev = None
+        self.gain.reset()
+        self.loss.reset()
+
+    def update(self, x: float) -> Optional[float]:
+        self.count += 1
+        if self.prev is not None:
+            change = x - self.prev
+            gain = self.gain.update(max(change, 0.0))
+            loss = self.loss.update(max(-change, 0.0))
+            if gain is not None:
+                self.value = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+        self.prev = x
+        return self.value
+
+class Bollinger(Operator):
+    """볼린저 밴드 - 값은 (중심선, 상단, 하단), 표준편차는 모집단 기준"""
+    __slots__ = ('period', 'width', 'window', 'total', 'total_sq')
+
+    def __init__(self, period: int = 20, width: float = 2.0):
+        super().__init__()
+        self.period = period
+        self.width = width
+        self.window = np.zeros(period, dtype=np.float64)
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def reset(self) -> None:
+        super().reset()
+        self.window[:] = 0
+        self.total = self.total_sq = 0.0
+
+    def update(self, x: float) -> Optional[Tuple[float, float, float]]:
+        i = self.count % self.period
+        old = self.window[i]
+        self.total += x - old
+        self.total_sq += x * x - old * old
+        self.window[i] = x
+        self.count += 1
+        if self.count >= self.period:
+            mid = self.total / self.period
+            std = math.sqrt(max(self.total_sq / self.period - mid * mid, 0.0))
+            self.value = (mid, mid + self.width * std, mid - self.width * std)
+        return self.value
+
+class Pipeline:
+    """
+    같은 봉 흐름을 받는 이름 붙은 연산자 묶음
+    - 예: Pipeline(atr=ATR(14), ema=Chain(Field(CLOSE), EMA(20)))
+    """
+    __slots__ = ('ops', 'timestamp')
+
+    def __init__(self, **ops: Operator):
+        self.ops: Dict[str, Operator] = ops
+        self.timestamp: Optional[int] = None   # 마지막으로 반영한 봉 시작 시각
+
+    def __getitem__(self, name: str):
+        return self.ops[name].value
+
+    @property
+    def ready(self) -> bool:
+        return all(op.ready for op in self.ops.values())
+
+    @property
+    def period(self) -> int:
+        return max(op.period for op in self.ops.values())
+
+    def update(self, timestamp: int, bar) -> None:
+        """확정 봉 1개 반영"""
+        for op in self.ops.values():
+            op.update(bar)
+        self.timestamp = timestamp
+
+    def warmup(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """과거 봉 반영 - update()를 순서대로 호출한 것과 같음"""
+        for timestamp, bar in zip(timestamps.tolist(), values.tolist()):
+            self.update(timestamp, bar)
+
+    def values(self) -> Dict:
+        return {name: op.value for name, op in self.ops.items()}
+
+def replay(op: Operator, rows) -> np.ndarray:
+    """
+    입력을 순서대로 반영하며 매 시점의 값 기록 (백테스트용)
+    :return: 시점별 값 배열 (준비 전은 NaN, 튜플 값은 열로 펼침)
+    """
+    op.reset()
+    out = []
+    for row in (rows.tolist() if isinstance(rows, np.ndarray) else rows):
+        out.append(op.update(row))
+    width = next((len(v) for v in out if isinstance(v, tuple)), None)
+    if width is None:
+        return np.array([np.nan if v is None else v for v in out], dtype=np.float64)
+    return np.array([(np.nan,) * width if v is None else v for v in out], dtype=np.float64)
+
+class IndicatorFeed:
+    """
+    (티커, 간격)별 파이프라인을 캔들 저장소의 최신 봉으로 갱신
+    - 마지막 봉(진행 중)은 제외하고 확정 봉만 반영
+    - 직전에 반영한 봉이 조회 범위 안에 있으면 그 이후 봉만 O(1)씩 반영
+    - 없으면(처음 또는 공백) 파이프라인을 새로 만들어 조회 범위 전체로 초기화
+    """
+
+    def __init__(self, factory: Callable[[], Pipeline]):
+        """
+        :param factory: 새 파이프라인 생성 함수 (파라미터가 바뀌면 feed를 새로 만듦)
+        """
+        self.factory = factory
+        self.pipelines: Dict[Hashable, Pipeline] = {}
+        self._lock = threading.Lock()
+
+    def sync(self, key: Hashable, timestamps: np.ndarray, values: np.ndarray) -> Pipeline:
+        """
+        :param timestamps: 캔들 시작 시각 (오름차순, 마지막은 진행 중인 봉)
+        :param values: (n, 5) OHLCV 배열
+        """
+        with self._lock:
+            pipeline = self.pipelines.get(key)
+            closed = len(timestamps) - 1
+            if pipeline is not None and pipeline.timestamp is not None:
+                start = int(np.searchsorted(timestamps[:closed], pipeline.timestamp, side='right'))
+                if start > 0 and timestamps[start - 1] == pipeline.timestamp:
+                    pipeline.warmup(timestamps[start:closed], values[start:closed])
+                    return pipeline
+                if closed == 0 or pipeline.timestamp >= timestamps[closed - 1]:
+                    return pipeline
+            pipeline = self.factory()
+            pipeline.warmup(timestamps[:closed], values[:closed])
+            self.pipelines[key] = pipeline
+            return pipeline
@@ -1,6 +1,8 @@
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
+import numpy as np
+from .context import DataNeed, MarketContext
 
 class TradingStrategy(Enum):
     VOLATILITY = "volatility"
@@ -8,19 +10,59 @@ class TradingStrategy(Enum):
     COMBINED = "combined"
 
 class Strategy(ABC):
+    PARAMS: Tuple[str, ...] = ()  # 설정/최적화로 조정 가능한 파라미터 이름
+    COST = 1                      # 데이터가 준비된 상태에서의 상대 계산 비용
+
     def __init__(self, bot):
         self.bot = bot
 
+    def set_params(self, **params) -> None:
+        """전략 파라미터 변경"""
+        for name, value in params.items():
+            if name not in self.PARAMS:
+                raise ValueError(f"{type(self).__name__}에 없는 파라미터입니다: {name}")
+            setattr(self, name, value)
+
+    def get_params(self) -> dict:
+        """현재 전략 파라미터"""
+        return {name: getattr(self, name) for name in self.PARAMS}
+
+    def data_needs(self) -> List[DataNeed]:
+        """판단에 필요한 데이터 목록 (복합 전략의 평가 순서 결정에 사용)"""
+        return []
+
+    def context(self, context: Optional[MarketContext]) -> MarketContext:
+        """사이클 컨텍스트가 없으면 이번 호출용으로 생성"""
+        return context if context is not None else MarketContext(self.bot)
+
     @abstractmethod
-    def should_buy(self, ticker: str, current_price: float) -> bool:
+    def should_buy(self, ticker: str, current_price: float,
+                   context: Optional[MarketContext] = None) -> bool:
         """
         매수 시점 판단
         :param ticker: 코인 티커
         :param current_price: 현재가
+        :param context: 사이클 공유 시장 데이터 (없으면 새로 조회)
         :return: 매수 여부 (True/False)
         """
         pass
 
-    def get_target_price(self, ticker: str) -> Optional[float]:
+    def get_target_price(self, ticker: str,
+                         context: Optional[MarketContext] = None) -> Optional[float]:
         """기본 목표가 계산 메서드 - 필요시 오버라이드"""
         return None
+
+    def generate_signals(self, series) -> np.ndarray:
+        """
+        백테스트용 기준봉별 매수 신호
+        - 기본 구현은 재생용 캔들 저장소를 한 봉씩 옮기며 should_buy를 호출
+        - 벡터 연산이 가능한 전략은 오버라이드
+        :param series: BarSeries
+        :return: 기준봉 수 길이의 불리언 배열
+        """
+        signals = np.zeros(len(series), dtype=bool)
+        close = series.close
+        for position in range(len(series)):
+            self.bot.candle_store.seek(series.ticker, position)
+            signals[position] = self.should_buy(series.ticker, float(close[position]))
+        return signals
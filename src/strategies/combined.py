@@ -1,14 +1,49 @@
+from typing import List, Optional
+import numpy as np
 from .base import Strategy
+from .context import DataNeed, MarketContext
 from .volatility import VolatilityStrategy
 from .heikin_ashi import HeikinAshiStrategy
 
 class CombinedStrategy(Strategy):
+    PARAMS = VolatilityStrategy.PARAMS + HeikinAshiStrategy.PARAMS
+
     def __init__(self, bot):
         super().__init__(bot)
         self.volatility = VolatilityStrategy(bot)
         self.heikin_ashi = HeikinAshiStrategy(bot)
+        self.components: List[Strategy] = [self.volatility, self.heikin_ashi]
+
+    def set_params(self, **params) -> None:
+        """파라미터를 해당 구성 전략에 전달"""
+        for strategy in self.components:
+            own = {k: v for k, v in params.items() if k in strategy.PARAMS}
+            strategy.set_params(**own)
+        unknown = set(params) - set(self.PARAMS)
+        if unknown:
+            raise ValueError(f"CombinedStrategy에 없는 파라미터입니다: {', '.join(sorted(unknown))}")
+
+    def get_params(self) -> dict:
+        return {**self.volatility.get_params(), **self.heikin_ashi.get_params()}
+
+    def data_needs(self) -> List[DataNeed]:
+        needs = []
+        for strategy in self.components:
+            needs += [n for n in strategy.data_needs() if n not in needs]
+        return needs
+
+    def should_buy(self, ticker: str, current_price: float,
+                   context: Optional[MarketContext] = None) -> bool:
+        """
+        복합 전략 매수 시점 판단 (모든 구성 전략이 매수일 때)
+        - 아직 불러오지 않은 데이터가 적고 계산이 싼 전략부터 평가하고 하나라도 아니면 중단
+        """
+        context = self.context(context)
+        ordered = sorted(self.components,
+                         key=lambda s: (context.missing(ticker, s.data_needs()), s.COST))
+        return all(strategy.should_buy(ticker, current_price, context) for strategy in ordered)
 
-    def should_buy(self, ticker: str, current_price: float) -> bool:
-        """복합 전략 매수 시점 판단"""
-        return (self.volatility.should_buy(ticker, current_price) and
-                self.heikin_ashi.should_buy(ticker, current_price))
+    def generate_signals(self, series) -> np.ndarray:
+        """백테스트용 매수 신호 - 두 전략 신호의 교집합"""
+        return (self.volatility.generate_signals(series) &
+                self.heikin_ashi.generate_signals(series))
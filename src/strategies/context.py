@@ -0,0 +1,75 @@
+import threading
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+import numpy as np
+
+# 전략이 선언하는 필요 데이터: ('candles', 봉 간격, 개수) / ('orderbook', None, 0) / ('balances', None, 0)
+DataNeed = Tuple[str, Optional[str], int]
+
+class MarketContext:
+    """
+    한 거래 사이클 동안 모든 전략이 공유하는 시장 데이터
+    - 캔들/호가/잔고는 처음 요청할 때 불러오고 사이클 끝까지 재사용
+    - 사이클마다 새로 만들어 전략에 전달
+    """
+
+    def __init__(self, bot, prices: Optional[Dict[str, float]] = None):
+        """
+        :param bot: candle_store/market/account를 가진 봇
+        :param prices: 사이클 시작 시 일괄 조회한 현재가
+        """
+        self.bot = bot
+        self.prices: Dict[str, float] = prices or {}
+        self._candles: Dict[Tuple[str, str], Tuple[int, Optional[Tuple[np.ndarray, np.ndarray]]]] = {}
+        self._memo: Dict[Hashable, object] = {}
+        self._lock = threading.Lock()
+
+    def price(self, ticker: str) -> Optional[float]:
+        return self.prices.get(ticker)
+
+    def candles(self, ticker: str, interval: str,
+                count: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """최근 count개 캔들 - 같은 (티커, 간격)은 사이클 내 한 번만 조회"""
+        key = (ticker, interval)
+        with self._lock:
+            cached = self._candles.get(key)
+        if cached is None or cached[0] < count:
+            candles = self.bot.candle_store.get_candles(ticker, interval, count)
+            with self._lock:
+                self._candles[key] = cached = (count, candles)
+        candles = cached[1]
+        if candles is None or cached[0] == count:
+            return candles
+        timestamps, values = candles
+        return timestamps[-count:], values[-count:]
+
+    def orderbook(self, ticker: str) -> Optional[Dict]:
+        """호가 (Market의 사이클 캐시 사용)"""
+        return self.memo(('orderbook', ticker), lambda: self.bot.market.get_orderbook(ticker))
+
+    def balances(self) -> Dict[str, Dict]:
+        """화폐별 잔고 (계좌 스냅샷)"""
+        return self.memo('balances', self.bot.account.snapshot)
+
+    def memo(self, key: Hashable, factory: Callable[[], object]):
+        """key별로 한 번만 계산한 값 반환 (파생 지표 공유용)"""
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+        value = factory()
+        with self._lock:
+            return self._memo.setdefault(key, value)
+
+    def is_loaded(self, ticker: str, need: DataNeed) -> bool:
+        """필요 데이터가 이미 준비됐는지"""
+        kind, interval, count = need
+        with self._lock:
+            if kind == 'candles':
+                cached = self._candles.get((ticker, interval))
+                return cached is not None and cached[0] >= count
+            if kind == 'orderbook':
+                return ('orderbook', ticker) in self._memo
+            return kind in self._memo
+
+    def missing(self, ticker: str, needs: Iterable[DataNeed]) -> int:
+        """아직 불러오지 않은 데이터 수"""
+        return sum(not self.is_loaded(ticker, need) for need in needs)
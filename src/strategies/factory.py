@@ -0,0 +1,26 @@
+from typing import Optional, Type
+from .base import Strategy, TradingStrategy
+from .volatility import VolatilityStrategy
+from .heikin_ashi import HeikinAshiStrategy
+from .combined import CombinedStrategy
+
+def strategy_class(strategy_type: TradingStrategy) -> Type[Strategy]:
+    """전략 타입에 해당하는 전략 클래스 (객체 없이 PARAMS 등을 볼 때 사용)"""
+    if strategy_type == TradingStrategy.VOLATILITY:
+        return VolatilityStrategy
+    if strategy_type == TradingStrategy.HEIKIN_ASHI:
+        return HeikinAshiStrategy
+    if strategy_type == TradingStrategy.COMBINED:
+        return CombinedStrategy
+    raise ValueError(f"지원하지 않는 전략 타입입니다: {strategy_type}")
+
+def create_strategy(strategy_type: TradingStrategy, bot,
+                    params: Optional[dict] = None) -> Strategy:
+    """
+    전략 타입에 따른 전략 객체 생성
+    :param params: 전략 파라미터 (없으면 기본값)
+    """
+    strategy = strategy_class(strategy_type)(bot)
+    if params:
+        strategy.set_params(**params)
+    return strategy
@@ -1,54 +1,120 @@
-from typing import Optional, Dict
-import pyupbit
+import threading
+from typing import Optional, Dict, List
+import numpy as np
+from src.data.candle_store import OPEN, HIGH, LOW, CLOSE
+from src.indicators.heikin_ashi import HeikinAshiEngine, compute_heikin_ashi
 from .base import Strategy
+from .context import DataNeed, MarketContext
 
 class HeikinAshiStrategy(Strategy):
+    PARAMS = ('recent_candles',)
+    COST = 2  # 지표 엔진 갱신이 필요해 변동성 돌파보다 비쌈
+
     def __init__(self, bot):
         super().__init__(bot)  # 부모 클래스 초기화
         self.ha_interval = "minute60"    # 하이킨 아시용 1시간봉
+        self.window = 24                 # 지표 초기화에 사용하는 봉 수
+        self.recent_candles = 3          # 강세 추세 판단 봉 수
+        self.engine = HeikinAshiEngine(recent_candles=self.recent_candles)
+        self._lock = threading.Lock()  # 여러 스레드에서 평가할 때 엔진 상태 보호
+
+    def set_params(self, **params) -> None:
+        """파라미터 변경 - 추세 판단 봉 수가 바뀌면 지표 엔진 재생성"""
+        super().set_params(**params)
+        if self.engine.recent_candles != self.recent_candles:
+            self.engine = HeikinAshiEngine(recent_candles=self.recent_candles)
+
+    def data_needs(self) -> List[DataNeed]:
+        return [('candles', self.ha_interval, self.window)]
 
-    def get_heikin_ashi(self, ticker: str) -> Optional[Dict]:
+    def _sync(self, ticker: str, context: Optional[MarketContext] = None) -> bool:
         """
-        하이킨 아시 지표 계산
+        캔들 저장소의 최신 봉을 지표 엔진에 반영
+        - 직전에 본 봉이 남아 있으면 O(1) 갱신, 아니면 전체 재계산
         """
-        try:
-            df = pyupbit.get_ohlcv(ticker, interval=self.ha_interval, count=24)
-
-            ha_close = (df['open'] + df['high'] + df['low'] + df['close']) / 4
-            ha_open = (df['open'].shift(1) + df['close'].shift(1)) / 2
-            ha_open.iloc[0] = (df['open'].iloc[0] + df['close'].iloc[0]) / 2
-            ha_high = df[['high', 'open', 'close']].max(axis=1)
-            ha_low = df[['low', 'open', 'close']].min(axis=1)
-
-            recent_candles = 3
-            strong_trend = all(
-                ha_close.iloc[-i] > ha_open.iloc[-i]
-                for i in range(1, recent_candles+1)
-            ) or all(
-                ha_close.iloc[-i] < ha_open.iloc[-i]
-                for i in range(1, recent_candles+1)
-            )
+        candles = self.context(context).candles(ticker, self.ha_interval, self.window)
+        if candles is None:
+            return False
+        timestamps, values = candles
+        if len(timestamps) < 2:
+            return False
 
-            result = {
-                'open': ha_open.iloc[-1],
-                'high': ha_high.iloc[-1],
-                'low': ha_low.iloc[-1],
-                'close': ha_close.iloc[-1],
-                'trend': 'up' if ha_close.iloc[-1] > ha_open.iloc[-1] else 'down',
-                'strong_trend': strong_trend,
-                'body_size': abs(ha_close.iloc[-1] - ha_open.iloc[-1]),
-                'prev_trend': 'up' if ha_close.iloc[-2] > ha_open.iloc[-2] else 'down'
-            }
+        with self._lock:
+            i = self.engine.rows.get(ticker)
+            last = None if i is None else self.engine.bar_time[i]
+            if last == timestamps[-1]:
+                self.engine.update(ticker, int(timestamps[-1]), *values[-1, :4])
+            elif last == timestamps[-2]:
+                self.engine.update(ticker, int(timestamps[-2]), *values[-2, :4])  # 직전 봉 확정값
+                self.engine.update(ticker, int(timestamps[-1]), *values[-1, :4])
+            else:
+                self.engine.warmup(ticker, timestamps, values)
+        return True
 
-            return result
+    def get_heikin_ashi(self, ticker: str,
+                        context: Optional[MarketContext] = None) -> Optional[Dict]:
+        """
+        하이킨 아시 지표 계산
+        """
+        try:
+            if not self._sync(ticker, context):
+                return None
+            with self._lock:
+                return self.engine.snapshot(ticker)
 
         except Exception as e:
             self.bot.logger.error(f"하이킨 아시 계산 실패 - {ticker}: {e}")
             return None
 
-    def should_buy(self, ticker: str, current_price: float) -> bool:
+    def buy_signals(self, tickers: List[str],
+                    context: Optional[MarketContext] = None) -> np.ndarray:
+        """여러 티커의 매수 신호를 한 번에 계산"""
+        context = self.context(context)
+        synced = np.array([self._sync(ticker, context) for ticker in tickers], dtype=bool)
+        with self._lock:
+            rows = np.array([self.engine.row(ticker) for ticker in tickers], dtype=np.int64)
+            return self.engine.buy_signals(rows) & synced
+
+    def generate_signals(self, series) -> np.ndarray:
+        """
+        백테스트용 매수 신호
+        - 확정된 1시간봉은 재귀 HA로 한 번에 계산
+        - 진행 중인 봉은 기준봉 시점까지의 부분 OHLC로 계산
+        """
+        _, candles, bucket = series.resample(self.ha_interval)
+        ha_open, _, _, ha_close = compute_heikin_ashi(
+            candles[:, OPEN], candles[:, HIGH], candles[:, LOW], candles[:, CLOSE])
+        forming = series.forming(self.ha_interval)
+
+        prev = bucket - 1
+        has_prev = prev >= 0
+        prev_safe = np.maximum(prev, 0)
+        cur_close = forming[:, :4].sum(axis=1) / 4
+        cur_open = np.where(has_prev,
+                            (ha_open[prev_safe] + ha_close[prev_safe]) / 2,
+                            (forming[:, OPEN] + forming[:, CLOSE]) / 2)
+
+        def run_length(flags: np.ndarray) -> np.ndarray:
+            """각 봉에서 끝나는 연속 True 길이"""
+            idx = np.arange(len(flags))
+            last_false = np.maximum.accumulate(np.where(flags, -1, idx))
+            return idx - last_false
+
+        up_run = run_length(ha_close > ha_open)[prev_safe]
+        down_run = run_length(ha_close < ha_open)[prev_safe]
+        needed = self.recent_candles - 1
+
+        trend = cur_close > cur_open
+        prev_trend = has_prev & (ha_close[prev_safe] > ha_open[prev_safe])
+        strong_trend = has_prev & (
+            (trend & (up_run >= needed)) |
+            ((cur_close < cur_open) & (down_run >= needed)))
+        return trend & strong_trend & ~prev_trend
+
+    def should_buy(self, ticker: str, current_price: float,
+                   context: Optional[MarketContext] = None) -> bool:
         """하이킨 아시 전략 매수 시점 판단"""
-        ha_data = self.get_heikin_ashi(ticker)
+        ha_data = self.get_heikin_ashi(ticker, context)
         if ha_data is None:
             return False
 
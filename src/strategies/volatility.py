@@ -1,30 +1,72 @@
-from typing import Optional
-import pyupbit
+from typing import List, Optional
+import numpy as np
+from src.data.candle_store import HIGH, LOW, CLOSE
+from src.indicators.streaming import ATR, IndicatorFeed, Pipeline, replay
 from .base import Strategy
+from .context import DataNeed, MarketContext
 
 class VolatilityStrategy(Strategy):
+    PARAMS = ('k', 'atr_period')
+    ATR_WARMUP = 10  # ATR 초기화에 쓰는 봉 수 (기간의 배수 - 와일더 평균이 충분히 수렴하는 길이)
+
     def __init__(self, bot):
         super().__init__(bot)
         self.trade_interval = "minute240"  # 거래용 4시간봉
+        self.k = 0.5                       # 돌파 계수
+        self.atr_period = 0                # 0이면 직전 봉 변동폭, 양수면 해당 기간 ATR을 돌파 폭으로 사용
+        self.feed = self._create_feed()
+
+    def set_params(self, **params) -> None:
+        """파라미터 변경 - ATR 기간이 바뀌면 지표 파이프라인 재생성"""
+        period = self.atr_period
+        super().set_params(**params)
+        if self.atr_period != period:
+            self.feed = self._create_feed()
+
+    def _create_feed(self) -> IndicatorFeed:
+        period = self.atr_period
+        return IndicatorFeed(lambda: Pipeline(atr=ATR(period)))
+
+    def _window(self) -> int:
+        """목표가 계산에 필요한 봉 수 (진행 중인 봉 포함)"""
+        return self.atr_period * self.ATR_WARMUP + 1 if self.atr_period else 2
 
-    def get_target_price(self, ticker: str) -> Optional[float]:
+    def data_needs(self) -> List[DataNeed]:
+        return [('candles', self.trade_interval, self._window())]
+
+    def get_target_price(self, ticker: str,
+                         context: Optional[MarketContext] = None) -> Optional[float]:
         """
         변동성 돌파 전략의 목표가 계산
+        - 직전 봉 종가 + 돌파 폭 * k (돌파 폭은 직전 봉 변동폭 또는 확정 봉 기준 ATR)
         """
         try:
-            df = pyupbit.get_ohlcv(ticker, interval=self.trade_interval, count=2)
-            target_price = df.iloc[0]['close'] + (df.iloc[0]['high'] - df.iloc[0]['low']) * 0.5
-            return target_price
+            candles = self.context(context).candles(ticker, self.trade_interval, self._window())
+            if candles is None:
+                return None
+            timestamps, values = candles
+            if len(timestamps) < 2:
+                return None
+            prev = values[-2]
+            if self.atr_period:
+                breakout = self.feed.sync(ticker, timestamps, values)['atr']
+                if breakout is None:
+                    return None
+            else:
+                breakout = prev[HIGH] - prev[LOW]
+            target_price = prev[CLOSE] + breakout * self.k
+            return float(target_price)
         except Exception as e:
             self.bot.logger.error(f"목표가 계산 실패 - {ticker}: {e}")
             return None
 
-    def should_buy(self, ticker: str, current_price: float) -> bool:
+    def should_buy(self, ticker: str, current_price: float,
+                   context: Optional[MarketContext] = None) -> bool:
         """
         변동성 돌파 전략 매수 시점 판단
         - 현재가가 목표가를 상향 돌파하면 매수
         """
-        target_price = self.get_target_price(ticker)
+        target_price = self.get_target_price(ticker, context)
         if target_price is None:
             return False
 
@@ -33,3 +75,20 @@ class VolatilityStrategy(Strategy):
             return True
 
         return False
+
+    def generate_signals(self, series) -> np.ndarray:
+        """
+        백테스트용 매수 신호 - 직전 4시간봉 기준 목표가 돌파 여부
+        - ATR은 실시간과 같은 스트리밍 연산자를 상위 봉 순서대로 재생해 계산
+        """
+        _, candles, bucket = series.resample(self.trade_interval)
+        if self.atr_period:
+            breakout = replay(ATR(self.atr_period), candles)
+        else:
+            breakout = candles[:, HIGH] - candles[:, LOW]
+        prev = bucket - 1
+        valid = prev >= 0
+        target = np.full(len(series), np.inf)
+        target[valid] = candles[prev[valid], CLOSE] + breakout[prev[valid]] * self.k
+        target[np.isnan(target)] = np.inf  # ATR 준비 전
+        return series.close > target
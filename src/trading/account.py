@@ -1,25 +1,113 @@
 import logging
-from typing import Dict
-import pyupbit
+import threading
+import time
+from typing import Dict, Optional
+from src.exchange.base import ExchangeBackend
 from src.utils.logger import get_logger
-from src.config.trading_config import APIConfig
+from src.trading.market import Market
+from src.trading.ledger import OrderLedger
 
 class TradingAccount:
-    def __init__(self, api_keys: APIConfig):
-        self.upbit = pyupbit.Upbit(api_keys.access_key, api_keys.secret_key)
+    def __init__(self, exchange: ExchangeBackend, reconcile_interval: float = 300, state=None):
+        """
+        :param reconcile_interval: 거래소 잔고로 장부를 보정하는 간격 (초)
+        :param state: 장부를 저장/복원할 상태 저장소 (StateStore)
+        """
+        self.exchange = exchange
         self.logger = get_logger(__name__)
         self.TOTAL_ASSETS = 4000000  # 총 자산 400만원
         self.MIN_INVEST_RATIO = 0.015  # 최소 투자비율 1.5%
         self.MAX_INVEST_RATIO = 0.05   # 최대 투자비율 5%
+        self.RECONCILE_INTERVAL = reconcile_interval
+        self.ORDER_POLL_INTERVAL = 1.0  # 미체결 주문 상태 조회 최소 간격 (초)
+        self.ledger = OrderLedger()     # 주문 체결로 갱신하는 로컬 잔고
+        self._reconciled_at: Optional[float] = None
+        self._polled_at = 0.0
+        self._lock = threading.Lock()   # 잔고/주문 조회는 한 스레드만 진행
+        self.state = state
+        if state is not None:
+            state.load_ledger(self.ledger)
+
+    def refresh_snapshot(self) -> None:
+        """전체 잔고를 조회해 장부 보정 (조회 중 주문이 나갔으면 다음 조회 때 재시도)"""
+        generation = self.ledger.generation
+        balances = self.exchange.get_balances()
+        if self.ledger.reconcile(balances, generation):
+            self._reconciled_at = time.monotonic()
+            self._persist()
+
+    def invalidate_snapshot(self) -> None:
+        """다음 조회 때 거래소 잔고로 장부 보정"""
+        self._reconciled_at = None
+
+    def sync(self) -> None:
+        """
+        장부 동기화
+        - 미체결 주문이 있으면 상태를 한 번의 요청으로 일괄 조회해 체결분 반영
+        - 보정 주기가 지났으면 전체 잔고 조회
+        """
+        with self._lock:
+            now = time.monotonic()
+            uuids = self.ledger.open_uuids()
+            if uuids and now - self._polled_at >= self.ORDER_POLL_INTERVAL:
+                self._polled_at = now
+                try:
+                    if self.ledger.update(self.exchange.get_orders(uuids)):
+                        self._reconciled_at = None  # 제거한 주문은 거래소 잔고로 보정
+                    self._persist()
+                except Exception as e:
+                    self.logger.error(f"주문 상태 조회 실패 - {len(uuids)}건: {e}")
+            if self._reconciled_at is None or now - self._reconciled_at > self.RECONCILE_INTERVAL:
+                self.refresh_snapshot()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """장부 기준 화폐별 잔고 (필요 시 동기화)"""
+        self.sync()
+        return self.ledger.snapshot()
+
+    def buy_market_order(self, ticker: str, price: float):
+        """시장가 매수 - 접수된 주문은 장부에 기록"""
+        result = self._send(self.exchange.buy_market_order, ticker, price)
+        if result is not None:
+            self.ledger.record(result, 'bid', ticker, price)
+            self._persist()
+        return result
+
+    def sell_market_order(self, ticker: str, volume: float):
+        """시장가 매도 - 체결 전까지 매도 수량을 잠가 중복 매도 방지"""
+        result = self._send(self.exchange.sell_market_order, ticker, volume)
+        if result is not None:
+            self.ledger.record(result, 'ask', ticker, volume)
+            self._persist()
+        return result
+
+    def _persist(self) -> None:
+        """장부 변경 저장 (상태 저장소가 있을 때)"""
+        if self.state is None:
+            return
+        try:
+            self.state.save_ledger(self.ledger)
+        except Exception as e:
+            self.logger.error(f"장부 저장 실패: {e}")
+
+    def _send(self, order, ticker: str, amount: float) -> Optional[Dict]:
+        try:
+            result = order(ticker, amount)
+        except Exception:
+            self.invalidate_snapshot()  # 접수 여부를 알 수 없으므로 다음 조회 때 보정
+            raise
+        if result is not None and 'uuid' not in result:
+            self.logger.error(f"주문 응답 이상 - {ticker}: {result}")
+            self.invalidate_snapshot()
+            return None
+        return result
 
     def get_balance(self, ticker: str) -> float:
         """특정 코인/원화의 보유량 조회"""
         try:
-            balances = self.upbit.get_balances()
-            for b in balances:
-                if b['currency'] == ticker:
-                    if b['balance'] is not None:
-                        return float(b['balance'])
+            b = self.snapshot().get(ticker)
+            if b is not None and b['balance'] is not None:
+                return float(b['balance'])
             return 0
         except Exception as e:
             self.logger.error(f"잔고 조회 실패 - {ticker}: {e}")
@@ -34,19 +122,26 @@ class TradingAccount:
     def get_average_buy_price(self, ticker: str) -> float:
         """특정 코인의 평균 매수가 조회"""
         try:
-            balances = self.upbit.get_balances()
-            for b in balances:
-                if b['currency'] == ticker.replace('KRW-', ''):
-                    return float(b['avg_buy_price'])
+            b = self.snapshot().get(ticker.replace('KRW-', ''))
+            if b is not None:
+                return float(b['avg_buy_price'])
             return 0
         except Exception as e:
             self.logger.error(f"평균 매수가 조회 실패 - {ticker}: {e}")
             return 0
 
-    def log_portfolio_status(self, coin_settings: Dict) -> None:
-        """포트폴리오 상태 로깅"""
+    def log_portfolio_status(self, coin_settings: Dict,
+                             prices: Optional[Dict[str, float]] = None) -> None:
+        """
+        포트폴리오 상태 로깅
+        :param coin_settings: 코인별 설정
+        :param prices: 티커별 현재가 (없으면 일괄 조회)
+        """
         try:
             total_value = self.get_balance("KRW")
+            if prices is None:
+                tickers = [c.ticker for c in coin_settings.values()]
+                prices = Market(self.exchange).get_current_prices(tickers)
 
             for coin, coin_config in coin_settings.items():
                 ticker = coin_config.ticker
@@ -54,7 +149,7 @@ class TradingAccount:
                 avg_price = self.get_average_buy_price(ticker)
 
                 if balance > 0:
-                    current_price = pyupbit.get_current_price(ticker)
+                    current_price = prices.get(ticker)
                     if current_price:
                         coin_value = balance * current_price
                         profit_loss = ((current_price - avg_price) / avg_price) * 100
@@ -0,0 +1,120 @@
+import asyncio
+import math
+import time
+from typing import Dict, Optional
+
+from src.strategies.base import TradingStrategy
+from src.strategies.context import MarketContext
+from src.trading.bot import CYCLE_ERRORS, TradingBot
+from src.utils.metrics import get_metrics
+
+CYCLE_SKIPPED = get_metrics().counter('bot_cycle_skipped_total', "사이클 지연으로 건너뛴 회차 수")
+
+class AsyncTradingBot(TradingBot):
+    """
+    asyncio 기반 트레이딩 봇
+    - 티커별 매수 신호를 세마포어로 제한된 동시성으로 평가
+    - 주문은 잔고 경쟁을 피하기 위해 사이클 안에서 순차 실행
+    - 사이클은 실행 시간과 무관하게 벽시계 기준 trade_interval 간격으로 시작
+    """
+
+    def __init__(self, strategy_type: TradingStrategy, paper: bool = False, config=None):
+        super().__init__(strategy_type, paper, config)
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _call(self, func, *args):
+        """블로킹 업비트 REST 호출을 스레드에서 실행"""
+        return await asyncio.to_thread(func, *args)
+
+    def run(self) -> None:
+        """메인 실행 함수"""
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        """비동기 메인 루프"""
+        self.logger.info(f"자동매매 프로그램 시작(async) - 전략: {self.strategy_type.value}")
+        self.semaphore = asyncio.Semaphore(self.config.trade_settings.max_concurrency)
+        self._start_reporting()
+
+        if not await self._call(self.check_system_status):
+            self.logger.error("시스템 상태 체크 실패. 프로그램을 종료합니다.")
+            return
+
+        if self.guard is not None:
+            self.guard.start()
+
+        interval = self.config.trade_settings.trade_interval
+        next_run = math.ceil(time.time() / interval) * interval
+
+        while True:
+            await asyncio.sleep(max(0.0, next_run - time.time()))
+            started = time.time()
+            try:
+                if self._daily_limit_reached():
+                    self.logger.info("일일 거래 한도 도달")
+                elif self.market.is_trade_time():
+                    trades_executed = await self._execute_trading_cycle_async()
+                    self._record_cycle(time.time() - started, 'async')
+                    if trades_executed:
+                        self._count_trade()
+
+            except Exception as e:
+                CYCLE_ERRORS.inc(mode='async')
+                self.logger.error(f"전체 실행 중 에러 발생: {e}")
+
+            next_run += interval
+            now = time.time()
+            if now > next_run:
+                # 사이클이 주기를 넘기면 놓친 회차를 건너뛰고 다음 정시에 실행
+                missed = math.ceil((now - next_run) / interval)
+                self.logger.warning(f"사이클 지연 - 소요 {now - started:.1f}초, {missed}회 건너뜀")
+                CYCLE_SKIPPED.inc(missed)
+                next_run += missed * interval
+
+    async def _evaluate(self, ticker: str, current_price: float,
+                        context: MarketContext) -> bool:
+        """티커 하나의 매수 신호 평가"""
+        async with self.semaphore:
+            try:
+                return await self._call(self.order_manager.check_buy,
+                                        ticker, current_price, self.strategy, context)
+            except Exception as e:
+                self.logger.error(f"매수 신호 평가 실패 - {ticker}: {e}")
+                return False
+
+    async def _execute_trading_cycle_async(self) -> bool:
+        """비동기 거래 사이클 실행"""
+        trades_executed = False
+        await self._call(self._refresh_universe)
+        prices, snapshot = await asyncio.gather(
+            self._call(self.market.refresh, self.config.get_ticker_list()),
+            self._call(self.account.sync),
+            return_exceptions=True,
+        )
+        if isinstance(prices, Exception):
+            raise prices
+        if isinstance(snapshot, Exception):
+            self.logger.error(f"잔고 조회 실패: {snapshot}")
+
+        context = MarketContext(self, prices)
+        targets: Dict[str, tuple] = {
+            coin: (coin_config, prices[coin_config.ticker])
+            for coin, coin_config in self.config.coin_settings.items()
+            if prices.get(coin_config.ticker) is not None
+        }
+        signals = await asyncio.gather(*(
+            self._evaluate(coin_config.ticker, price, context)
+            for coin_config, price in targets.values()
+        ))
+
+        for (coin_config, price), signal in zip(targets.values(), signals):
+            try:
+                if signal and await self._call(self.order_manager.place_buy,
+                                               coin_config.ticker, price):
+                    trades_executed = True
+            except Exception as e:
+                self.logger.error(f"매수 실패 - {coin_config.ticker}: {e}")
+
+        if await self._call(self._check_exits, prices):
+            trades_executed = True
+        return trades_executed
@@ -1,30 +1,64 @@
 import time
 import pyupbit
-from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from datetime import datetime, timedelta
 
 from src.strategies.base import Strategy, TradingStrategy
-from src.strategies.volatility import VolatilityStrategy
-from src.strategies.heikin_ashi import HeikinAshiStrategy
-from src.strategies.combined import CombinedStrategy
+from src.strategies.factory import create_strategy
 from src.utils.logger import setup_logger, get_logger
 from src.trading.account import TradingAccount
 from src.trading.market import Market
 from src.trading.order import OrderManager
+from src.trading.exits import ExitEngine
+from src.trading.universe import UniverseScanner
+from src.trading.guard import PositionGuard
 from src.config.trading_config import TradingConfig
+from src.data.candle_store import CandleStore
+from src.data.state_store import StateStore
+from src.data.history import HistoryStore
+from src.strategies.context import MarketContext
+from src.api.transport import get_transport
+from src.exchange.base import ExchangeBackend
+from src.utils.metrics import get_metrics, start_exporter
+from src.utils.journal import get_journal, start_journal
+
+CYCLE_SECONDS = get_metrics().histogram('bot_cycle_seconds', "거래 사이클 소요 시간 (초)")
+LAST_CYCLE = get_metrics().gauge('bot_last_cycle_seconds', "마지막 거래 사이클 소요 시간 (초)")
+CYCLE_OVERRUN = get_metrics().counter('bot_cycle_overrun_total', "trade_interval을 넘긴 사이클 수")
+CYCLE_ERRORS = get_metrics().counter('bot_cycle_errors_total', "에러로 끝난 사이클 수")
 
 class TradingBot:
-    def __init__(self, strategy_type: TradingStrategy):
-        """트레이딩 봇 초기화"""
+    def __init__(self, strategy_type: TradingStrategy, paper: bool = False,
+                 config: Optional[TradingConfig] = None):
+        """
+        트레이딩 봇 초기화
+        :param paper: True면 실거래 대신 모의 거래소로 실행
+        :param config: 사용할 설정 (없으면 config.yaml)
+        """
         setup_logger()
         self.logger = get_logger(__name__)
 
         self.strategy_type = strategy_type
-        self.config = TradingConfig()
-        self.market = Market()
-        self.account = TradingAccount(self.config.api_keys)
-        self.upbit = self.account.upbit
-        self.order_manager = OrderManager(self.config, self.account, self.market)
+        self.config = config or TradingConfig()
+        get_transport().configure(self.config.http_settings)
+        self.paper = paper
+        self.exchange = self._create_exchange()
+        self.state = self._create_state()
+        self.market = self._create_market()
+        self.candle_store = self._create_candle_store()
+        self.account = TradingAccount(self.exchange, self.config.trade_settings.reconcile_interval,
+                                      self.state)
+        self.order_manager = OrderManager(self.config, self.account, self.market, self.state)
         self.strategy = self._create_strategy()
+        self.scanner = (UniverseScanner(self.market, self.config.universe_settings)
+                        if self.config.universe_settings.enabled else None)
+        self.exits = ExitEngine(self.config)
+        guard_interval = self.config.trade_settings.guard_interval
+        self.guard = PositionGuard(self, guard_interval) if guard_interval > 0 else None
+        self.daily_trade_count = 0
+        self.last_trade_date = datetime.now().date()
+        self._load_daily()
 
     def _initialize_upbit(self) -> pyupbit.Upbit:
         """업비트 API 초기화"""
@@ -37,19 +71,68 @@ class TradingBot:
             self.logger.error(f"업비트 초기화 실패: {e}")
             raise
 
+    def _create_exchange(self) -> ExchangeBackend:
+        """실거래(업비트) 또는 모의 거래소 백엔드 생성"""
+        if self.paper:
+            from src.exchange.simulated import create_paper_exchange
+            self.logger.info("모의 거래 모드 - 주문은 실제 거래소로 전송되지 않습니다")
+            return create_paper_exchange(self.config.paper_settings)
+        from src.exchange.upbit import UpbitExchange
+        return UpbitExchange(self.config.api_keys)
+
+    def _create_market(self) -> Market:
+        return Market(self.exchange)
+
+    def _create_candle_store(self) -> CandleStore:
+        return CandleStore(exchange=self.exchange,
+                           cache_dir=self._state_path(self.config.state_settings.candle_dir),
+                           history=self._create_history())
+
+    def _state_path(self, path):
+        """상태 파일 경로 - 모의 거래는 실거래 상태와 섞이지 않도록 *_paper 경로 사용"""
+        if not path or not self.paper:
+            return path
+        p = Path(path)
+        return str(p.with_name(f"{p.stem}_paper{p.suffix}"))
+
+    def _create_state(self):
+        """상태 저장소 생성 (설정이 없으면 None)"""
+        path = self._state_path(self.config.state_settings.path)
+        return StateStore(path) if path else None
+
+    def _create_history(self) -> Optional[HistoryStore]:
+        """지표 준비에 쓸 과거 캔들 저장소 (모의 거래는 가상 시세라 사용하지 않음)"""
+        path = self.config.history_settings.path
+        if not path or self.paper or not Path(path).exists():
+            return None
+        return HistoryStore(path)
+
+    def _load_daily(self) -> None:
+        """저장된 오늘 거래 횟수 복원"""
+        if self.state is None:
+            return
+        saved = self.state.load_daily()
+        if saved is not None and saved[0] == self.last_trade_date:
+            self.daily_trade_count = saved[1]
+            self.logger.info(f"오늘 거래 횟수 복원 - {self.daily_trade_count}회")
+
+    def _save_daily(self) -> None:
+        if self.state is None:
+            return
+        try:
+            self.state.save_daily(self.last_trade_date, self.daily_trade_count)
+        except Exception as e:
+            self.logger.error(f"거래 횟수 저장 실패: {e}")
+
+    def _count_trade(self) -> None:
+        """거래가 있었던 사이클 수 증가"""
+        self.daily_trade_count += 1
+        self._save_daily()
+
     def _create_strategy(self) -> Strategy:
         """전략 타입에 따른 전략 객체 생성"""
-        if self.strategy_type == TradingStrategy.VOLATILITY:
-            from src.strategies.volatility import VolatilityStrategy
-            return VolatilityStrategy(self)
-        elif self.strategy_type == TradingStrategy.HEIKIN_ASHI:
-            from src.strategies.heikin_ashi import HeikinAshiStrategy
-            return HeikinAshiStrategy(self)
-        elif self.strategy_type == TradingStrategy.COMBINED:
-            from src.strategies.combined import CombinedStrategy
-            return CombinedStrategy(self)
-        else:
-            raise ValueError(f"지원하지 않는 전략 타입입니다: {self.strategy_type}")
+        params = self.config.strategy_settings.get(self.strategy_type.value)
+        return create_strategy(self.strategy_type, self, params)
 
     def check_system_status(self) -> bool:
         """시스템 상태 점검"""
@@ -63,7 +146,7 @@ class TradingBot:
                 self.logger.warning(f"잔고 부족: {balance}원")
                 return False
 
-            server_time = pyupbit.get_current_price("KRW-BTC")
+            server_time = self.exchange.get_current_prices(["KRW-BTC"]).get("KRW-BTC")
             if server_time is None:
                 self.logger.error("서버 연결 실패")
                 return False
@@ -74,54 +157,116 @@ class TradingBot:
             self.logger.error(f"시스템 체크 중 에러 발생: {e}")
             return False
 
+    def _refresh_universe(self) -> None:
+        """
+        config.yaml 변경분을 반영하고, 스캔 주기가 되면 전체 시장을 스캔해 거래 대상 재구성
+        (실패 시 기존 대상 유지)
+        """
+        self.config.reload_if_changed(self._held_tickers)
+        if self.scanner is None or not self.scanner.due():
+            return
+        try:
+            shortlist = self.scanner.scan()
+            held = self.scanner.held_tickers(self.account.snapshot(), shortlist)
+            self.config.apply_universe(shortlist, held)
+        except Exception as e:
+            self.logger.error(f"시장 스캔 실패 - 기존 거래 대상 유지: {e}")
+
+    def _held_tickers(self) -> List[str]:
+        """보유 중인 티커 (설정 재적재 시 coins에서 빠져도 청산 관리 유지)"""
+        return self.exits.held(self.account.snapshot())
+
+    def _check_exits(self, prices) -> bool:
+        """보유 포지션 청산 규칙을 한 번에 판단해 매도 - 매도 주문을 냈으면 True"""
+        orders = self.exits.check(self.account.snapshot(), prices)
+        return self.order_manager.execute_exits(orders) > 0
+
+    def _daily_limit_reached(self) -> bool:
+        """날짜가 바뀌면 거래 횟수를 초기화하고 일일 거래 한도 도달 여부 반환"""
+        current_date = datetime.now().date()
+        if current_date != self.last_trade_date:
+            self.daily_trade_count = 0
+            self.last_trade_date = current_date
+            self._save_daily()
+        return self.daily_trade_count >= self.config.trade_settings.max_daily_trades
+
+    @staticmethod
+    def _seconds_until_next_day() -> float:
+        """다음 날 0시까지 남은 시간 (초)"""
+        now = datetime.now()
+        tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return (tomorrow - now).total_seconds()
+
+    def _journal_source(self) -> str:
+        """이벤트 기록 파일 이름 (실거래/모의 구분)"""
+        return 'paper' if self.paper else 'live'
+
+    def _start_reporting(self) -> None:
+        """지표 노출과 이벤트 기록 시작"""
+        start_exporter(self.config.metrics_settings)
+        start_journal(self.config.journal_settings, self._journal_source())
+
+    def _record_cycle(self, elapsed: float, mode: str) -> None:
+        """사이클 소요 시간 기록 - trade_interval을 넘기면 경고"""
+        CYCLE_SECONDS.observe(elapsed, mode=mode)
+        LAST_CYCLE.set(elapsed, mode=mode)
+        get_journal().record('cycle', mode=mode, seconds=elapsed,
+                             tickers=len(self.config.coin_settings))
+        interval = self.config.trade_settings.trade_interval
+        if elapsed > interval:
+            CYCLE_OVERRUN.inc(mode=mode)
+            self.logger.warning(f"사이클 주기 초과 - 소요 {elapsed:.1f}초 (주기 {interval}초)")
+
     def run(self) -> None:
         """메인 실행 함수"""
         self.logger.info(f"자동매매 프로그램 시작 - 전략: {self.strategy_type.value}")
+        self._start_reporting()
 
         if not self.check_system_status():
             self.logger.error("시스템 상태 체크 실패. 프로그램을 종료합니다.")
             return
 
-        daily_trade_count = 0
-        last_trade_date = datetime.now().date()
+        if self.guard is not None:
+            self.guard.start()  # 일일 거래 한도로 대기하는 동안에도 청산 감시 유지
 
         while True:
             try:
-                current_date = datetime.now().date()
-                if current_date != last_trade_date:
-                    daily_trade_count = 0
-                    last_trade_date = current_date
-
-                if daily_trade_count >= self.config.trade_settings.max_daily_trades:
-                    self.logger.info("일일 거래 한도 도달")
-                    time.sleep(1000)
+                if self._daily_limit_reached():
+                    self.logger.info("일일 거래 한도 도달 - 다음 날까지 대기")
+                    time.sleep(self._seconds_until_next_day())
                     continue
 
                 if self.market.is_trade_time():
+                    started = time.perf_counter()
                     trades_executed = self._execute_trading_cycle()
+                    self._record_cycle(time.perf_counter() - started, 'sync')
                     if trades_executed:
-                        daily_trade_count += 1
+                        self._count_trade()
 
                 time.sleep(self.config.trade_settings.trade_interval)
 
             except Exception as e:
+                CYCLE_ERRORS.inc(mode='sync')
                 self.logger.error(f"전체 실행 중 에러 발생: {e}")
                 time.sleep(self.config.trade_settings.trade_interval)
 
     def _execute_trading_cycle(self) -> bool:
         """거래 사이클 실행"""
         trades_executed = False
+        self._refresh_universe()
+        self.account.sync()  # 미체결 주문 반영 (잔고 조회는 보정 주기마다)
+        prices = self.market.refresh(self.config.get_ticker_list())  # 사이클당 시세 조회 1회
+        context = MarketContext(self, prices)  # 전략들이 공유하는 사이클 데이터
         for coin, coin_config in self.config.coin_settings.items():
             ticker = coin_config.ticker
-            current_price = pyupbit.get_current_price(ticker)
+            current_price = prices.get(ticker)
 
             if current_price is None:
                 continue
 
-            if self.order_manager.execute_buy(ticker, current_price, self.strategy):
-                trades_executed = True
-            if self.order_manager.execute_sell(coin, coin_config, current_price):
+            if self.order_manager.execute_buy(ticker, current_price, self.strategy, context):
                 trades_executed = True
-            time.sleep(1)
 
+        if self._check_exits(prices):
+            trades_executed = True
         return trades_executed
@@ -0,0 +1,119 @@
+import multiprocessing
+from datetime import date
+from typing import Tuple
+
+# 공유 배열 칸 (float64)
+KRW, RESERVED, DAY, DAILY_COUNT, LAST_CYCLE, COMMITTED, CREDITED = range(7)
+
+class TradeCoordinator:
+    """
+    여러 워커 프로세스가 함께 지키는 전체 거래 한도
+    - 원화 풀: 매수 전에 금액을 예약해 워커들이 같은 원화를 동시에 쓰지 않게 함
+    - min_krw_balance: 예약 후 남는 원화가 이 값 아래로 내려가는 매수는 거절
+    - max_daily_trades: 전체 거래 사이클(trade_interval 구간) 중 어느 워커든 거래가 있었던 수로 판단
+      (워커 N개가 같은 구간에 거래해도 1회 - 단일 프로세스 봇과 같은 의미)
+    - 상태는 프로세스 간 공유 배열 1개와 잠금 1개 (워커 생성 시 인자로 전달)
+    """
+
+    def __init__(self, max_daily_trades: int, min_krw_balance: float, krw: float = 0.0,
+                 context=None):
+        """
+        :param krw: 시작 원화 (실거래는 feed 프로세스가 주기적으로 거래소 잔고로 보정)
+        :param context: multiprocessing 컨텍스트 (기본: 기본 컨텍스트)
+        """
+        ctx = context or multiprocessing.get_context()
+        self.max_daily_trades = max_daily_trades
+        self.min_krw_balance = min_krw_balance
+        self._lock = ctx.Lock()
+        self._state = ctx.RawArray('d', 7)
+        self._state[KRW] = krw
+        self._state[DAY] = date.today().toordinal()
+        self._state[LAST_CYCLE] = -1
+
+    def _roll_day(self) -> None:
+        """날짜가 바뀌면 거래 횟수 초기화 (잠금 안에서 호출)"""
+        today = date.today().toordinal()
+        if self._state[DAY] != today:
+            self._state[DAY] = today
+            self._state[DAILY_COUNT] = 0
+
+    def reserve(self, amount: float) -> bool:
+        """
+        매수 금액 예약
+        :return: 예약했으면 True (남는 원화가 min_krw_balance 미만이 되면 False)
+        """
+        with self._lock:
+            available = self._state[KRW] - self._state[RESERVED]
+            if available - amount < self.min_krw_balance:
+                return False
+            self._state[RESERVED] += amount
+            return True
+
+    def commit(self, amount: float) -> None:
+        """예약한 매수가 접수됨 - 원화 풀에서 차감"""
+        with self._lock:
+            self._state[RESERVED] -= amount
+            self._state[KRW] -= amount
+            self._state[COMMITTED] += amount
+
+    def release(self, amount: float) -> None:
+        """예약한 매수가 실패함 - 예약 해제"""
+        with self._lock:
+            self._state[RESERVED] -= amount
+
+    def credit(self, amount: float) -> None:
+        """매도 대금 (체결 전 추정치 - 실거래는 다음 보정 때 맞춰짐)"""
+        with self._lock:
+            self._state[KRW] += amount
+            self._state[CREDITED] += amount
+
+    def sync_marker(self) -> Tuple[float, float]:
+        """잔고 조회 직전의 누적 매수 차감/매도 대금 (sync_krw에 전달)"""
+        with self._lock:
+            return self._state[COMMITTED], self._state[CREDITED]
+
+    def sync_krw(self, krw: float, marker: Tuple[float, float] = (0.0, 0.0)) -> None:
+        """
+        거래소 원화 잔고로 원화 풀 보정
+        - 잔고 조회 이후(marker 이후) 접수된 매수/매도는 조회 결과에 없으므로 다시 반영
+        :param marker: 잔고 조회 직전 sync_marker() 값
+        """
+        with self._lock:
+            committed, credited = marker
+            self._state[KRW] = (krw - (self._state[COMMITTED] - committed)
+                                + (self._state[CREDITED] - credited))
+
+    def count_trade(self, cycle: int) -> int:
+        """
+        거래가 있었던 전체 거래 사이클 수 증가 (같은 사이클에 다른 워커가 이미 셌으면 그대로)
+        :param cycle: 거래 사이클 번호 (벽시계 // trade_interval)
+        """
+        with self._lock:
+            self._roll_day()
+            if cycle > self._state[LAST_CYCLE]:
+                self._state[LAST_CYCLE] = cycle
+                self._state[DAILY_COUNT] += 1
+            return int(self._state[DAILY_COUNT])
+
+    def daily_limit_reached(self) -> bool:
+        with self._lock:
+            self._roll_day()
+            return self._state[DAILY_COUNT] >= self.max_daily_trades
+
+    def daily(self) -> Tuple[date, int]:
+        """(날짜, 오늘 거래 횟수)"""
+        with self._lock:
+            self._roll_day()
+            return date.fromordinal(int(self._state[DAY])), int(self._state[DAILY_COUNT])
+
+    def restore_daily(self, day: date, count: int) -> None:
+        """저장된 오늘 거래 횟수 복원 (다른 날짜면 무시)"""
+        with self._lock:
+            self._roll_day()
+            if day.toordinal() == self._state[DAY]:
+                self._state[DAILY_COUNT] = count
+
+    def krw(self) -> float:
+        """예약분을 뺀 사용 가능 원화"""
+        with self._lock:
+            return self._state[KRW] - self._state[RESERVED]
@@ -0,0 +1,147 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from src.config.trading_config import CoinConfig, TradeSettings
+from src.trading.order import ExitDecision
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+EXIT_REBUILDS = get_metrics().counter('exit_table_rebuilds_total', "청산 규칙 테이블 재구성 횟수")
+
+# 청산 규칙 코드 (배열 값) - 0은 매도 없음
+NONE, TAKE_PROFIT, STOP_LOSS, PARTIAL_STOP = 0, 1, 2, 3
+ACTIONS = (None, 'take_profit', 'stop_loss', 'partial_stop')
+
+# 코인별 청산 임계값 열 (CoinConfig 필드 순서 그대로)
+THRESHOLDS = ('min_unit', 'take_profit', 'profit_sell', 'stop_loss', 'partial_stop', 'partial_sell')
+
+# 청산 대상: (코인, 코인 설정, 현재가, 판단에 쓴 주문 가능 수량, 판단 결과)
+ExitOrder = Tuple[str, CoinConfig, float, float, ExitDecision]
+
+@dataclass
+class ExitTable:
+    """coin_settings를 행 단위로 펼친 청산 임계값 배열"""
+    coins: List[str]
+    configs: List[CoinConfig]
+    rows: Dict[str, int]       # 티커 -> 행 번호
+    coin_rows: Dict[str, int]  # 코인 -> 행 번호
+    thresholds: np.ndarray     # (n, len(THRESHOLDS)) float64
+    min_profit_krw: float
+    min_loss_krw: float
+
+    def column(self, name: str) -> np.ndarray:
+        return self.thresholds[:, THRESHOLDS.index(name)]
+
+@dataclass
+class ExitBatch:
+    """전체 포지션의 청산 판단 결과 (행 순서는 ExitTable과 같음)"""
+    action: np.ndarray         # int8 청산 규칙 코드
+    volume: np.ndarray         # 매도 수량
+    profit_rate: np.ndarray    # 수익률 (%)
+    profit_krw: np.ndarray     # 평가 손익 (원)
+
+class ExitEngine:
+    """
+    전체 보유 포지션 청산 규칙 일괄 판단
+    - coin_settings의 임계값을 연속된 NumPy 배열로 컴파일하고 수량/평균 매수가/현재가를 같은 행 순서의 배열로 받음
+    - 익절/손절/부분 손절 판단을 모든 행에 대해 배열 연산 한 번으로 계산 (decide_exit와 같은 규칙)
+    - coin_settings/trade_settings 객체가 교체되면(시장 스캔, 설정 재적재) 다음 호출에서 테이블 재구성
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.logger = get_logger(__name__)
+        self._table: Optional[ExitTable] = None
+        self._source: Tuple = (None, None)
+        self._lock = threading.Lock()
+
+    def table(self) -> ExitTable:
+        """현재 설정의 청산 테이블 (설정 객체가 바뀌었으면 재구성)"""
+        coin_settings, trade_settings = self.config.coin_settings, self.config.trade_settings
+        with self._lock:
+            if self._source[0] is not coin_settings or self._source[1] is not trade_settings:
+                self._table = self.compile(coin_settings, trade_settings)
+                self._source = (coin_settings, trade_settings)
+                EXIT_REBUILDS.inc()
+            return self._table
+
+    @staticmethod
+    def compile(coin_settings: Dict[str, CoinConfig], trade_settings: TradeSettings) -> ExitTable:
+        coins = list(coin_settings)
+        configs = [coin_settings[c] for c in coins]
+        thresholds = np.array([[getattr(c, f) for f in THRESHOLDS] for c in configs],
+                              dtype=np.float64).reshape(len(configs), len(THRESHOLDS))
+        return ExitTable(coins, configs, {c.ticker: i for i, c in enumerate(configs)},
+                         {c: i for i, c in enumerate(coins)}, np.ascontiguousarray(thresholds),
+                         float(trade_settings.min_profit_krw), float(trade_settings.min_loss_krw))
+
+    def positions(self, table: ExitTable,
+                  snapshot: Dict[str, Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        잔고 스냅샷을 테이블 행 순서의 배열로 변환
+        :return: (주문 가능 수량, 평균 매수가) - 보유하지 않은 행은 0
+        """
+        volume = np.zeros(len(table.coins))
+        avg_price = np.zeros(len(table.coins))
+        for coin, b in snapshot.items():
+            i = table.coin_rows.get(coin)
+            if i is not None:
+                volume[i] = float(b.get('balance') or 0)
+                avg_price[i] = float(b.get('avg_buy_price') or 0)
+        return volume, avg_price
+
+    def prices(self, table: ExitTable, prices: Dict[str, float]) -> np.ndarray:
+        """티커별 현재가를 행 순서 배열로 변환 (없으면 NaN - 매도 판단에서 제외)"""
+        current = np.full(len(table.coins), np.nan)
+        for ticker, price in prices.items():
+            i = table.rows.get(ticker)
+            if i is not None and price is not None:
+                current[i] = price
+        return current
+
+    def held(self, snapshot: Dict[str, Dict]) -> List[str]:
+        """최소 거래량 이상 보유 중인 티커"""
+        table = self.table()
+        volume, _ = self.positions(table, snapshot)
+        return [table.configs[i].ticker for i in np.flatnonzero(volume > table.column('min_unit'))]
+
+    @staticmethod
+    def evaluate(table: ExitTable, volume: np.ndarray, avg_price: np.ndarray,
+                 price: np.ndarray) -> ExitBatch:
+        """모든 행의 청산 규칙 판단 - 규칙 우선순위는 익절 > 손절 > 부분 손절"""
+        min_unit, take_profit, profit_sell, stop_loss, partial_stop, partial_sell = table.thresholds.T
+        held = (volume > min_unit) & (avg_price != 0) & ~np.isnan(price)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profit_rate = np.where(held, (price - avg_price) / avg_price * 100, 0.0)
+        profit_krw = np.where(held, (price - avg_price) * volume, 0.0)
+
+        # 익절 구간에 들어가면 조건 미달이어도 손절 규칙은 보지 않음
+        in_profit = held & (profit_rate >= take_profit)
+        take = in_profit & (profit_krw >= table.min_profit_krw) & (volume * profit_sell >= min_unit)
+        loss_ok = held & ~in_profit & (np.abs(profit_krw) >= table.min_loss_krw)
+        stop = loss_ok & (profit_rate <= stop_loss)
+        partial = (loss_ok & ~stop & (profit_rate <= partial_stop)
+                   & (volume * partial_sell >= min_unit))
+
+        action = np.select([take, stop, partial], [TAKE_PROFIT, STOP_LOSS, PARTIAL_STOP],
+                           NONE).astype(np.int8)
+        sell = np.select([take, stop, partial],
+                         [volume * profit_sell, volume, volume * partial_sell], 0.0)
+        return ExitBatch(action, sell, profit_rate, profit_krw)
+
+    def check(self, snapshot: Dict[str, Dict], prices: Dict[str, float]) -> List[ExitOrder]:
+        """
+        잔고 스냅샷과 현재가로 전체 포지션 1회 판단
+        :return: 매도할 포지션 목록
+        """
+        table = self.table()
+        volume, avg_price = self.positions(table, snapshot)
+        batch = self.evaluate(table, volume, avg_price, self.prices(table, prices))
+        orders = []
+        for i in np.flatnonzero(batch.action):
+            decision = ExitDecision(ACTIONS[batch.action[i]], float(batch.volume[i]),
+                                    float(batch.profit_rate[i]), float(batch.profit_krw[i]))
+            orders.append((table.coins[i], table.configs[i], float(prices[table.configs[i].ticker]),
+                           float(volume[i]), decision))
+        return orders
@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Dict, List, Optional
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+GUARD_SECONDS = get_metrics().histogram('guard_check_seconds', "포지션 감시 1회 소요 시간 (초)")
+GUARD_EXITS = get_metrics().counter('guard_exits_total', "포지션 감시에서 낸 매도 주문 수")
+GUARD_POSITIONS = get_metrics().gauge('guard_positions', "감시 중인 보유 포지션 수")
+
+class PositionGuard:
+    """
+    보유 포지션 청산 감시 (빠른 주기)
+    - interval초마다 보유 중인 코인의 현재가만 일괄 조회해 익절/손절/부분 손절을 즉시 실행
+    - 청산 판단은 ExitEngine으로 전체 포지션을 한 번에 계산하고 매도할 코인만 주문
+    - 매수 신호 평가(느린 주기)와 별도 스레드로 동작
+    - 주문은 OrderManager의 티커별 잠금으로 느린 주기와 직렬화
+    """
+
+    def __init__(self, bot, interval: float = 1.0):
+        """
+        :param bot: config/account/market/order_manager/exits를 가진 봇
+        :param interval: 감시 주기 (초)
+        """
+        self.config = bot.config
+        self.account = bot.account
+        self.market = bot.market
+        self.order_manager = bot.order_manager
+        self.exits = bot.exits
+        self.interval = interval
+        self.logger = get_logger(__name__)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='position-guard')
+        self._thread.start()
+        self.logger.info(f"포지션 감시 시작 - {self.interval}초 주기")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def held_positions(self, snapshot: Optional[Dict[str, Dict]] = None) -> List[str]:
+        """최소 거래량 이상 보유 중인 티커"""
+        return self.exits.held(snapshot if snapshot is not None else self.account.snapshot())
+
+    def check(self) -> int:
+        """
+        보유 포지션 청산 조건 1회 점검 (config.yaml이 바뀌었으면 먼저 다시 읽음)
+        :return: 낸 매도 주문 수
+        """
+        self.config.reload_if_changed(self.held_positions)
+        snapshot = self.account.snapshot()
+        tickers = self.held_positions(snapshot)
+        GUARD_POSITIONS.set(len(tickers))
+        if not tickers:
+            return 0
+
+        prices = self.market.get_current_prices(tickers)
+        exits = self.order_manager.execute_exits(self.exits.check(snapshot, prices))
+        if exits:
+            GUARD_EXITS.inc(exits)
+        return exits
+
+    def _run(self) -> None:
+        next_run = time.monotonic()
+        while not self._stop.wait(max(0.0, next_run - time.monotonic())):
+            try:
+                with GUARD_SECONDS.time():
+                    self.check()
+            except Exception as e:
+                self.logger.error(f"포지션 감시 중 에러 발생: {e}")
+            next_run += self.interval
+            now = time.monotonic()
+            if now > next_run:
+                # 점검이 주기를 넘기면 밀린 회차를 몰아서 실행하지 않음
+                next_run = now
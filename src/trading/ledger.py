@@ -0,0 +1,243 @@
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+from src.utils.journal import get_journal
+
+REALIZED_PNL = get_metrics().gauge('ledger_realized_pnl_krw', "장부 기준 누적 실현 손익 (원)")
+OPEN_ORDERS = get_metrics().gauge('ledger_open_orders', "체결 대기 중인 주문 수")
+RECONCILE_DRIFT = get_metrics().counter('ledger_reconcile_drift_total', "거래소 잔고와 달라 보정한 화폐 수")
+
+FINAL_STATES = ('done', 'cancel')  # 더 이상 체결되지 않는 주문 상태
+
+@dataclass
+class Position:
+    volume: float = 0.0        # 보유 수량 (매도 대기 포함)
+    avg_price: float = 0.0     # 평균 매수가 (수수료 제외)
+    pending_sell: float = 0.0  # 체결 대기 중인 매도 수량
+    realized_pnl: float = 0.0  # 실현 손익 (원, 수수료 차감)
+
+@dataclass
+class OrderRecord:
+    uuid: str
+    ticker: str
+    side: str                  # bid / ask
+    amount: float              # 매수: 주문 금액(원), 매도: 주문 수량
+    reserved: float = 0.0      # 매수 주문에 묶어 둔 원화 (수수료 포함)
+    state: str = 'wait'
+    executed_volume: float = 0.0
+    executed_funds: float = 0.0
+    paid_fee: float = 0.0
+    missing_since: Optional[float] = None  # 상태 조회 결과에서 처음 빠진 시각 (epoch 초)
+
+class OrderLedger:
+    """
+    주문/포지션 장부
+    - 주문 UUID별 체결량을 추적하고 체결분만큼 수량/평균 매수가/실현 손익을 갱신
+    - 매도 주문 수량은 체결 전까지 잠가 두어 같은 포지션의 중복 매도를 막음
+    - 거래소 잔고와는 reconcile()로 주기적으로만 맞춤
+    """
+
+    def __init__(self, fee_rate: float = 0.0005, missing_timeout: float = 30.0):
+        """
+        :param missing_timeout: 상태 조회 결과에 이 시간(초) 넘게 나오지 않는 주문은 장부에서 제거
+        """
+        self.fee_rate = fee_rate
+        self.missing_timeout = missing_timeout
+        self.krw = 0.0             # 주문 가능 원화
+        self.krw_locked = 0.0      # 매수 대기 주문에 묶인 원화
+        self.positions: Dict[str, Position] = {}
+        self.orders: Dict[str, OrderRecord] = {}  # 체결 대기 주문
+        self.generation = 0        # 주문 기록/체결 반영 횟수 (잔고 조회와의 경합 확인용)
+        self.reconciled = False
+        self.logger = get_logger(__name__)
+        self._lock = threading.RLock()
+
+    def record(self, order: Dict, side: str, ticker: str, amount: float) -> None:
+        """
+        접수된 주문 기록
+        :param order: 주문 응답 (uuid, state, executed_volume ...)
+        :param amount: 매수는 주문 금액(원), 매도는 주문 수량
+        """
+        currency = ticker.split('-')[1]
+        with self._lock:
+            self.generation += 1
+            record = OrderRecord(order['uuid'], ticker, side, amount)
+            if side == 'bid':
+                record.reserved = amount * (1 + self.fee_rate)
+                self.krw -= record.reserved
+                self.krw_locked += record.reserved
+            else:
+                self.positions.setdefault(currency, Position()).pending_sell += amount
+            self.orders[record.uuid] = record
+            self._apply(record, order)
+            OPEN_ORDERS.set(len(self.orders))
+
+    def open_uuids(self) -> List[str]:
+        with self._lock:
+            return list(self.orders)
+
+    def update(self, orders: List[Dict]) -> List[str]:
+        """
+        일괄 조회한 주문 상태 반영
+        - 조회 결과에 missing_timeout 넘게 나오지 않는 주문은 제거 (잔고 보정을 막지 않도록)
+        :return: 제거한 주문 UUID (호출 측에서 거래소 잔고로 장부 보정)
+        """
+        now = time.time()
+        dropped = []
+        with self._lock:
+            seen = set()
+            for order in orders:
+                record = self.orders.get(order.get('uuid'))
+                if record is not None:
+                    seen.add(record.uuid)
+                    record.missing_since = None
+                    self.generation += 1
+                    self._apply(record, order)
+            for record in list(self.orders.values()):
+                if record.uuid in seen:
+                    continue
+                if record.missing_since is None:
+                    record.missing_since = now
+                elif now - record.missing_since > self.missing_timeout:
+                    self._drop(record)
+                    dropped.append(record.uuid)
+            OPEN_ORDERS.set(len(self.orders))
+        return dropped
+
+    def _drop(self, record: OrderRecord) -> None:
+        """체결 상태를 알 수 없는 주문 제거 - 예약 원화/매도 잠금만 풀고 수량은 잔고 보정에 맡김"""
+        self.generation += 1
+        if record.side == 'bid':
+            self.krw_locked -= record.reserved
+            self.krw += record.reserved
+        else:
+            position = self.positions.get(record.ticker.split('-')[1])
+            if position is not None:
+                unfilled = record.amount - record.executed_volume
+                position.pending_sell = max(position.pending_sell - unfilled, 0.0)
+        del self.orders[record.uuid]
+        self.logger.warning(f"주문 상태 확인 불가 - {record.ticker} {record.side} {record.uuid}: "
+                            f"{self.missing_timeout:.0f}초 넘게 조회되지 않아 장부에서 제거")
+
+    def _apply(self, record: OrderRecord, order: Dict) -> None:
+        """이전 조회 이후 늘어난 체결분만 포지션에 반영 (종료된 주문은 장부에서 제거)"""
+        volume = float(order.get('executed_volume') or 0)
+        fee = float(order.get('paid_fee') or 0)
+        state = order.get('state', record.state)
+        funds = order.get('executed_funds')
+        if funds is None:
+            # executed_funds가 없는 응답은 평균 체결가(없으면 주문 금액)로 계산
+            if order.get('avg_price') is not None:
+                funds = volume * float(order['avg_price'])
+            elif record.side == 'bid' and state in FINAL_STATES:
+                funds = record.amount
+            else:
+                funds = record.executed_funds
+        funds = float(funds)
+        d_volume = volume - record.executed_volume
+        d_funds = funds - record.executed_funds
+        d_fee = fee - record.paid_fee
+        record.executed_volume, record.executed_funds, record.paid_fee = volume, funds, fee
+        record.state = state
+
+        if d_volume > 0:
+            get_journal().record('fill', uuid=record.uuid, ticker=record.ticker, side=record.side,
+                                 volume=d_volume, funds=d_funds, fee=d_fee, state=state)
+
+        position = self.positions.setdefault(record.ticker.split('-')[1], Position())
+        if record.side == 'bid':
+            if d_volume > 0:
+                cost = position.volume * position.avg_price + d_funds
+                position.volume += d_volume
+                position.avg_price = cost / position.volume
+            if record.state in FINAL_STATES:
+                # 남은 예약 원화 반환
+                self.krw_locked -= record.reserved
+                self.krw += record.reserved - funds - fee
+        else:
+            if d_volume > 0:
+                pnl = d_funds - d_fee - d_volume * position.avg_price
+                position.volume -= d_volume
+                position.pending_sell -= d_volume
+                position.realized_pnl += pnl
+                self.krw += d_funds - d_fee
+                REALIZED_PNL.set(self.realized_pnl())
+            if record.state in FINAL_STATES:
+                position.pending_sell -= record.amount - volume
+
+        if record.state in FINAL_STATES:
+            del self.orders[record.uuid]
+
+    def reconcile(self, balances: List[Dict], generation: int) -> bool:
+        """
+        거래소 잔고로 장부 보정 - 체결 대기 주문이 있는 화폐는 건너뜀
+        :param generation: 잔고 조회 시작 시점의 generation
+        :return: 보정했으면 True (조회 중 주문/체결이 반영됐으면 False)
+        """
+        with self._lock:
+            if generation != self.generation:
+                return False
+            busy = {r.ticker.split('-')[1] for r in self.orders.values()}
+            exchange = {b['currency']: b for b in balances}
+            for currency in set(exchange) | set(self.positions):
+                if currency in busy or currency == 'KRW':
+                    continue
+                b = exchange.get(currency, {})
+                volume = float(b.get('balance') or 0) + float(b.get('locked') or 0)
+                avg_price = float(b.get('avg_buy_price') or 0)
+                position = self.positions.setdefault(currency, Position())
+                if self.reconciled and abs(position.volume - volume) > 1e-8:
+                    RECONCILE_DRIFT.inc()
+                    self.logger.warning(f"장부 보정 - {currency}: {position.volume:.8f} -> {volume:.8f}")
+                position.volume, position.avg_price = volume, avg_price
+                position.pending_sell = 0.0
+                if volume <= 0 and position.realized_pnl == 0:
+                    del self.positions[currency]
+            if not self.orders:
+                krw = exchange.get('KRW', {})
+                self.krw = float(krw.get('balance') or 0)
+                self.krw_locked = float(krw.get('locked') or 0)
+            self.reconciled = True
+            return True
+
+    def export(self) -> Dict:
+        """저장용 장부 복사본"""
+        with self._lock:
+            return {'cash': {'krw': self.krw, 'krw_locked': self.krw_locked},
+                    'positions': {c: replace(p) for c, p in self.positions.items()},
+                    'orders': {u: replace(o) for u, o in self.orders.items()}}
+
+    def restore(self, state: Dict) -> None:
+        """저장된 장부 복원 - 다음 reconcile에서 달라진 잔고는 보정 로그를 남김"""
+        with self._lock:
+            self.krw = state['cash']['krw']
+            self.krw_locked = state['cash']['krw_locked']
+            self.positions = {c: Position(**p) for c, p in state['positions'].items()}
+            self.orders = {u: OrderRecord(**o) for u, o in state['orders'].items()}
+            self.reconciled = True
+            OPEN_ORDERS.set(len(self.orders))
+            REALIZED_PNL.set(self.realized_pnl())
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """화폐별 잔고 (업비트 /v1/accounts 형식 - balance는 주문 가능 수량)"""
+        with self._lock:
+            result = {'KRW': {'currency': 'KRW', 'balance': str(self.krw),
+                              'locked': str(self.krw_locked), 'avg_buy_price': '0'}}
+            for currency, p in self.positions.items():
+                if p.volume > 0:
+                    result[currency] = {'currency': currency,
+                                        'balance': str(max(p.volume - p.pending_sell, 0.0)),
+                                        'locked': str(p.pending_sell),
+                                        'avg_buy_price': str(p.avg_price)}
+            return result
+
+    def realized_pnl(self, currency: Optional[str] = None) -> float:
+        """실현 손익 (currency가 없으면 전체 합계)"""
+        with self._lock:
+            if currency is not None:
+                position = self.positions.get(currency)
+                return position.realized_pnl if position else 0.0
+            return sum(p.realized_pnl for p in self.positions.values())
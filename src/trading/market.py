@@ -1,17 +1,82 @@
 import logging
-from typing import Optional
-import pyupbit
+from typing import Dict, List, Optional
 from datetime import datetime
+from src.exchange.base import ExchangeBackend
 
 class Market:
+    MAX_TICKERS_PER_REQUEST = 100  # 시세 API 1회 요청당 최대 티커 수
+
+    def __init__(self, exchange: Optional[ExchangeBackend] = None):
+        self._tickers: List[str] = []           # 이번 사이클 조회 대상 티커
+        self._prices: Dict[str, float] = {}     # 사이클 현재가 캐시
+        self._orderbooks: Dict[str, Dict] = {}  # 사이클 호가 캐시
+        if exchange is None:
+            from src.exchange.upbit import UpbitExchange
+            exchange = UpbitExchange()
+        self.exchange = exchange
+
+    def refresh(self, tickers: List[str]) -> Dict[str, float]:
+        """사이클 시작 시 전체 티커의 현재가를 일괄 조회"""
+        self._tickers = list(tickers)
+        self._orderbooks = {}
+        self._prices = self.get_current_prices(self._tickers)
+        return self._prices
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """여러 티커의 현재가를 한 번의 요청(100개 단위)으로 조회"""
+        prices = {}
+        for chunk in self._chunks(tickers):
+            try:
+                prices.update(self.exchange.get_current_prices(chunk))
+            except Exception as e:
+                logging.error(f"현재가 일괄 조회 실패 - {chunk}: {e}")
+        return prices
+
+    def get_orderbooks(self, tickers: List[str]) -> Dict[str, Dict]:
+        """여러 티커의 호가를 한 번의 요청(100개 단위)으로 조회"""
+        orderbooks = {}
+        for chunk in self._chunks(tickers):
+            try:
+                for orderbook in self.exchange.get_orderbooks(chunk):
+                    orderbooks[orderbook['market']] = orderbook
+            except Exception as e:
+                logging.error(f"호가 일괄 조회 실패 - {chunk}: {e}")
+        return orderbooks
+
+    def get_ticker_stats(self, tickers: List[str]) -> List[Dict]:
+        """여러 티커의 24시간 시세 통계를 한 번의 요청(100개 단위)으로 조회"""
+        stats = []
+        for chunk in self._chunks(tickers):
+            try:
+                stats.extend(self.exchange.get_ticker_stats(chunk))
+            except Exception as e:
+                logging.error(f"시세 통계 일괄 조회 실패 - {chunk}: {e}")
+        return stats
+
+    def get_orderbook(self, ticker: str) -> Optional[Dict]:
+        """호가 조회 - 사이클 내 첫 요청 시 대상 티커 전체를 일괄 조회"""
+        if ticker not in self._orderbooks:
+            tickers = self._tickers if ticker in self._tickers else [ticker]
+            self._orderbooks.update(self.get_orderbooks(tickers))
+        return self._orderbooks.get(ticker)
+
+    def apply_orderbook(self, orderbook: Dict) -> None:
+        """실시간 수신한 호가로 캐시 갱신"""
+        self._orderbooks[orderbook['code' if 'code' in orderbook else 'market']] = orderbook
+
     def get_current_price(self, ticker: str) -> Optional[float]:
         """현재가 조회"""
         try:
-            return pyupbit.get_orderbook(ticker=ticker)["orderbook_units"][0]["ask_price"]
+            return self.get_orderbook(ticker)["orderbook_units"][0]["ask_price"]
         except Exception as e:
             logging.error(f"현재가 조회 실패 - {ticker}: {e}")
             return None
 
+    def _chunks(self, tickers: List[str]) -> List[List[str]]:
+        """요청 단위로 티커 분할"""
+        size = self.MAX_TICKERS_PER_REQUEST
+        return [tickers[i:i + size] for i in range(0, len(tickers), size)]
+
     @staticmethod
     def is_trade_time() -> bool:
         """거래 시점 체크"""
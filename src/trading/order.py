@@ -1,86 +1,307 @@
-from src.config.trading_config import CoinConfig
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from src.config.trading_config import CoinConfig, TradeSettings
 from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+from src.utils.journal import get_journal
 from datetime import datetime
+import threading
+import time
+
+STRATEGY_SECONDS = get_metrics().histogram('strategy_eval_seconds', "전략 매수 판단 소요 시간 (초)")
+SIGNALS = get_metrics().counter('strategy_signals_total', "매수 신호 수")
+ORDER_SECONDS = get_metrics().histogram('order_seconds', "주문 요청 소요 시간 (초)")
+ORDERS = get_metrics().counter('orders_total', "주문 수 (side, result)")
+SIGNAL_TO_ORDER = get_metrics().histogram('signal_to_order_seconds', "매수 신호 판단부터 주문 완료까지 지연 (초)")
+
+@dataclass
+class ExitDecision:
+    action: str          # take_profit / stop_loss / partial_stop
+    volume: float        # 매도 수량
+    profit_rate: float   # 수익률 (%)
+    profit_krw: float    # 평가 손익 (원)
+
+def decide_exit(coin_config: CoinConfig, trade_settings: TradeSettings, balance: float,
+                avg_price: float, current_price: float) -> Optional[ExitDecision]:
+    """
+    익절/손절/부분 손절 규칙 판단
+    :return: 매도할 경우 ExitDecision, 아니면 None
+    """
+    if balance <= coin_config.min_unit or avg_price == 0:
+        return None
+
+    profit_rate = ((current_price - avg_price) / avg_price) * 100
+    profit_krw = (current_price - avg_price) * balance
+
+    # 익절
+    if profit_rate >= coin_config.take_profit:
+        if profit_krw >= trade_settings.min_profit_krw:
+            sell_amount = balance * coin_config.profit_sell
+            if sell_amount >= coin_config.min_unit:
+                return ExitDecision('take_profit', sell_amount, profit_rate, profit_krw)
+        return None
+
+    # 손절
+    if profit_rate <= coin_config.stop_loss and abs(profit_krw) >= trade_settings.min_loss_krw:
+        return ExitDecision('stop_loss', balance, profit_rate, profit_krw)
+
+    # 부분 손절
+    if profit_rate <= coin_config.partial_stop and abs(profit_krw) >= trade_settings.min_loss_krw:
+        sell_amount = balance * coin_config.partial_sell
+        if sell_amount >= coin_config.min_unit:
+            return ExitDecision('partial_stop', sell_amount, profit_rate, profit_krw)
+        return None
+
+    return None
+
+# 마지막 청산: (규칙, 실행 시각(epoch 초), 실행 시 수익률)
+ExitRecord = Tuple[str, float, float]
+
+def exit_cooldown_seconds(trade_settings: TradeSettings) -> float:
+    """같은 익절/부분 손절 규칙 재실행 제한 시간 (초, 설정이 없으면 거래 사이클 간격)"""
+    if trade_settings.exit_cooldown is not None:
+        return trade_settings.exit_cooldown
+    return trade_settings.trade_interval
+
+def exit_cooling_down(coin_config: CoinConfig, decision: ExitDecision, last: Optional[ExitRecord],
+                      now: float, cooldown: float) -> bool:
+    """
+    같은 규칙을 방금 실행한 포지션인지 판단 (부분 매도 후 남은 수량에 같은 규칙이 매번 다시 걸리는 것 방지)
+    - 손절은 항상 실행
+    - cooldown초 안에서는 수익률이 마지막 실행 시점보다 임계값 한 단계만큼 더 움직였을 때만 다시 실행
+    """
+    if decision.action == 'stop_loss' or last is None:
+        return False
+    action, fired_at, fired_rate = last
+    if action != decision.action or now - fired_at >= cooldown:
+        return False
+    if action == 'partial_stop':
+        return decision.profit_rate > fired_rate + coin_config.partial_stop
+    return decision.profit_rate < fired_rate + coin_config.take_profit
 
 class OrderManager:
-    def __init__(self, config, account, market):
+    BUY_COOLDOWN = 3600  # 같은 코인 재매수 제한 시간 (초)
+    FEE_RATE = 0.0005    # 거래 수수료율
+
+    def __init__(self, config, account, market, state=None, coordinator=None):
+        """
+        :param state: 재매수 제한 시각을 저장/복원할 상태 저장소 (StateStore)
+        :param coordinator: 여러 워커 프로세스가 공유하는 원화 한도 (TradeCoordinator)
+        """
         self.config = config
         self.account = account
         self.market = market
-        self.upbit = account.upbit
+        self.exchange = account.exchange
         self.logger = get_logger(__name__)
         self.last_buy_time = {}  # 코인별 마지막 구매 시점 저장
+        self.signal_time = {}    # 티커별 매수 신호 판단 시점 (perf_counter)
+        self.last_exit = {}      # 티커별 마지막 익절/부분 손절 (ExitRecord)
+        self._ticker_locks = {}  # 티커별 주문 잠금 (사이클과 포지션 감시 스레드가 공유)
+        self._locks_guard = threading.Lock()
+        self.state = state
+        self.coordinator = coordinator
+        if state is not None:
+            self.last_buy_time = {t: datetime.fromtimestamp(ts)
+                                  for t, ts in state.load_cooldowns().items()}
+            self.last_exit = state.load_exits()
+
+    @property
+    def exit_cooldown(self) -> float:
+        return exit_cooldown_seconds(self.config.trade_settings)
+
+    def ticker_lock(self, ticker: str) -> threading.Lock:
+        """티커별 주문 잠금 - 잔고 확인부터 주문까지 한 스레드만 진행"""
+        with self._locks_guard:
+            lock = self._ticker_locks.get(ticker)
+            if lock is None:
+                lock = self._ticker_locks[ticker] = threading.Lock()
+            return lock
+
+    def check_buy(self, ticker: str, current_price: float, strategy, context=None) -> bool:
+        """
+        매수 조건 판단 - 재매수 제한 시간과 전략 신호 확인
+        :param context: 사이클 공유 시장 데이터 (MarketContext)
+        """
+        # 최근 1시간 이내 구매 여부 확인
+        if ticker in self.last_buy_time:
+            time_diff = (datetime.now() - self.last_buy_time[ticker]).total_seconds()
+            if time_diff < self.BUY_COOLDOWN:  # 1시간 이내라면
+                self.logger.info(f"매수 제외 - {ticker}: 최근 1시간 이내 매수 이력 있음")
+                return False
+
+        strategy_name = type(strategy).__name__
+        started = time.perf_counter()
+        with STRATEGY_SECONDS.time(strategy=strategy_name):
+            signal = strategy.should_buy(ticker, current_price, context)
+        now = time.perf_counter()
+        if signal:
+            SIGNALS.inc(strategy=strategy_name)
+            self.signal_time[ticker] = now
+        journal = get_journal()
+        if signal or journal.debug:
+            journal.record('signal', ticker=ticker, price=current_price, strategy=strategy_name,
+                           buy=bool(signal), seconds=now - started)
+        return signal
 
-    def execute_buy(self, ticker: str, current_price: float, strategy) -> None:
-        """매수 로직 실행"""
+    def _save_exit(self, ticker: str) -> None:
+        """마지막 청산 기록 저장/삭제 (상태 저장소가 있을 때)"""
+        if self.state is None:
+            return
         try:
-            # 최근 1시간 이내 구매 여부 확인
-            current_time = datetime.now()
-            if ticker in self.last_buy_time:
-                time_diff = (current_time - self.last_buy_time[ticker]).total_seconds() / 3600  # 시간 단위로 변환
-                if time_diff < 1:  # 1시간 이내라면
-                    self.logger.info(f"매수 제외 - {ticker}: 최근 1시간 이내 매수 이력 있음")
-                    return
-
-            if not strategy.should_buy(ticker, current_price):
-                return
-
-            krw = self.account.get_balance("KRW")
-            invest_amount = self.account.calculate_invest_amount(krw)
-
-            if krw > invest_amount:
-                invest_amount = invest_amount * 0.9995  # 수수료 고려
-                self.upbit.buy_market_order(ticker, invest_amount)
-                self.last_buy_time[ticker] = current_time  # 구매 시점 기록
-                self.logger.info(
-                    f"매수 성공: {ticker} - 가격: {current_price:,}원, "
-                    f"투자금액: {invest_amount:,}원 "
-                    f"(총자산의 {(invest_amount/self.account.TOTAL_ASSETS)*100:.1f}%)"
-                )
+            last = self.last_exit.get(ticker)
+            if last is None:
+                self.state.delete_exit(ticker)
             else:
-                self.logger.info(f"매수 안함 - {ticker}: 잔액 부족")
+                self.state.save_exit(ticker, *last)
+        except Exception as e:
+            self.logger.error(f"청산 기록 저장 실패 - {ticker}: {e}")
+
+    def _save_cooldown(self, ticker: str) -> None:
+        """재매수 제한 시각 저장 (상태 저장소가 있을 때)"""
+        if self.state is None:
+            return
+        try:
+            self.state.save_cooldown(ticker, self.last_buy_time[ticker].timestamp())
+        except Exception as e:
+            self.logger.error(f"재매수 제한 시각 저장 실패 - {ticker}: {e}")
+
+    def _send_order(self, side: str, order, ticker: str, amount: float):
+        """주문 요청 후 소요 시간과 결과 기록"""
+        started = time.perf_counter()
+        with ORDER_SECONDS.time(side=side):
+            result = order(ticker, amount)
+        elapsed = time.perf_counter() - started
+        ORDERS.inc(side=side, result='ok' if result is not None else 'failed')
+        get_journal().record('order', ticker=ticker, side=side, amount=amount,
+                             uuid=result.get('uuid') if isinstance(result, dict) else None,
+                             ok=result is not None, seconds=elapsed)
+        return result
+
+    def place_buy(self, ticker: str, current_price: float) -> bool:
+        """매수 주문 실행 - 주문을 냈으면 True"""
+        with self.ticker_lock(ticker):
+            return self._place_buy(ticker, current_price)
+
+    def _place_buy(self, ticker: str, current_price: float) -> bool:
+        krw = self.account.get_balance("KRW")
+        invest_amount = self.account.calculate_invest_amount(krw)
+
+        if krw > invest_amount:
+            invest_amount = invest_amount * (1 - self.FEE_RATE)  # 수수료 고려
+            reserved = invest_amount * (1 + self.FEE_RATE)
+            if self.coordinator is not None and not self.coordinator.reserve(reserved):
+                self.logger.info(f"매수 안함 - {ticker}: 전체 원화 한도 도달")
+                return False
+            result = None
+            try:
+                result = self._send_order('bid', self.account.buy_market_order, ticker, invest_amount)
+            finally:
+                if self.coordinator is not None:
+                    # 접수되면 원화 풀에서 차감, 실패하면 예약 해제
+                    settle = self.coordinator.commit if result is not None else self.coordinator.release
+                    settle(reserved)
+            if result is None:
+                self.logger.error(f"매수 주문 실패 - {ticker}: 주문이 접수되지 않음")
+                return False
+            signal_time = self.signal_time.pop(ticker, None)
+            if signal_time is not None:
+                SIGNAL_TO_ORDER.observe(time.perf_counter() - signal_time)
+            self.last_buy_time[ticker] = datetime.now()  # 구매 시점 기록
+            if self.last_exit.pop(ticker, None) is not None:  # 평균 매수가가 바뀌므로 청산 판단 새로 시작
+                self._save_exit(ticker)
+            self._save_cooldown(ticker)
+            self.logger.info(
+                f"매수 성공: {ticker} - 가격: {current_price:,}원, "
+                f"투자금액: {invest_amount:,}원 "
+                f"(총자산의 {(invest_amount/self.account.TOTAL_ASSETS)*100:.1f}%)"
+            )
+            return True
+
+        self.logger.info(f"매수 안함 - {ticker}: 잔액 부족")
+        return False
+
+    def execute_buy(self, ticker: str, current_price: float, strategy, context=None) -> bool:
+        """매수 로직 실행 - 주문을 냈으면 True"""
+        try:
+            if not self.check_buy(ticker, current_price, strategy, context):
+                return False
+            return self.place_buy(ticker, current_price)
 
         except Exception as e:
             self.logger.error(f"매수 실패 - {ticker}: {e}")
+            return False
+
+    def execute_sell(self, coin: str, coin_config: CoinConfig, current_price: float) -> bool:
+        """매도 로직 실행 - 주문을 냈으면 True"""
+        with self.ticker_lock(coin_config.ticker):
+            return self._execute_sell(coin, coin_config, current_price)
 
-    def execute_sell(self, coin: str, coin_config: CoinConfig, current_price: float) -> None:
-        """매도 로직 실행"""
+    def _execute_sell(self, coin: str, coin_config: CoinConfig, current_price: float) -> bool:
         try:
-            balance = self.account.get_balance(coin)
+            balance = self.account.get_balance(coin)  # 체결 대기 중인 매도 수량 제외
             if balance <= coin_config.min_unit:
                 self.logger.info(f"매도 검토 제외 - {coin_config.ticker}: 최소 거래량({coin_config.min_unit}) 미만")
-                return
+                return False
 
             avg_price = self.account.get_average_buy_price(coin_config.ticker)
             if avg_price == 0:
                 self.logger.info(f"매도 검토 제외 - {coin_config.ticker}: 평균 매수가 없음")
-                return
-
-            profit_rate = ((current_price - avg_price) / avg_price) * 100
-            profit_krw = (current_price - avg_price) * balance
-
-            # 익절
-            if profit_rate >= coin_config.take_profit:
-                if profit_krw >= self.config.trade_settings.min_profit_krw:
-                    sell_amount = balance * coin_config.profit_sell
-                    if sell_amount >= coin_config.min_unit:
-                        self.upbit.sell_market_order(coin_config.ticker, sell_amount)
-                        self.logger.info(f"익절 매도: {coin_config.ticker} - 수익률: {profit_rate:.2f}%, 수익금액: {profit_krw:,.0f}원")
-                return
-
-            # 손절
-            if profit_rate <= coin_config.stop_loss and abs(profit_krw) >= self.config.trade_settings.min_loss_krw:
-                self.upbit.sell_market_order(coin_config.ticker, balance)
-                self.logger.info(f"손절 매도: {coin_config.ticker} - 수익률: {profit_rate:.2f}%, 손실금액: {profit_krw:,.0f}원")
-                return
-
-            # 부분 손절
-            if profit_rate <= coin_config.partial_stop and abs(profit_krw) >= self.config.trade_settings.min_loss_krw:
-                sell_amount = balance * coin_config.partial_sell
-                if sell_amount >= coin_config.min_unit:
-                    self.upbit.sell_market_order(coin_config.ticker, sell_amount)
-                    self.logger.info(f"부분 손절: {coin_config.ticker} - 수익률: {profit_rate:.2f}%, 손실금액: {profit_krw:,.0f}원")
-                return
+                return False
+
+            decision = decide_exit(coin_config, self.config.trade_settings,
+                                   balance, avg_price, current_price)
+            if decision is None:
+                return False
+            return self._send_exit(coin_config, decision, current_price)
 
         except Exception as e:
             self.logger.error(f"매도 실패 - {coin_config.ticker}: {e}")
+            return False
+
+    def _send_exit(self, coin_config: CoinConfig, decision: ExitDecision,
+                   current_price: float) -> bool:
+        """청산 매도 주문 - 주문을 냈으면 True"""
+        ticker = coin_config.ticker
+        if exit_cooling_down(coin_config, decision, self.last_exit.get(ticker), time.time(),
+                             self.exit_cooldown):
+            return False
+        if self._send_order('ask', self.account.sell_market_order,
+                            coin_config.ticker, decision.volume) is None:
+            self.logger.error(f"매도 주문 실패 - {coin_config.ticker}: 주문이 접수되지 않음")
+            return False
+        if self.coordinator is not None:
+            self.coordinator.credit(decision.volume * current_price * (1 - self.FEE_RATE))
+        if decision.action == 'stop_loss':
+            self.last_exit.pop(ticker, None)
+        else:
+            self.last_exit[ticker] = (decision.action, time.time(), decision.profit_rate)
+        self._save_exit(ticker)
+        get_journal().record('exit', ticker=coin_config.ticker, action=decision.action,
+                             volume=decision.volume, price=current_price,
+                             profit_rate=decision.profit_rate, profit_krw=decision.profit_krw)
+        if decision.action == 'take_profit':
+            self.logger.info(f"익절 매도: {coin_config.ticker} - 수익률: {decision.profit_rate:.2f}%, 수익금액: {decision.profit_krw:,.0f}원")
+        elif decision.action == 'stop_loss':
+            self.logger.info(f"손절 매도: {coin_config.ticker} - 수익률: {decision.profit_rate:.2f}%, 손실금액: {decision.profit_krw:,.0f}원")
+        else:
+            self.logger.info(f"부분 손절: {coin_config.ticker} - 수익률: {decision.profit_rate:.2f}%, 손실금액: {decision.profit_krw:,.0f}원")
+        return True
+
+    def execute_exits(self, orders) -> int:
+        """
+        청산 엔진이 일괄 판단한 매도 실행
+        - 판단 이후 다른 스레드가 같은 코인을 매매해 주문 가능 수량이 바뀌었으면 개별 규칙으로 다시 판단
+        :param orders: ExitEngine.check() 결과
+        :return: 낸 매도 주문 수
+        """
+        sent = 0
+        for coin, coin_config, current_price, balance, decision in orders:
+            with self.ticker_lock(coin_config.ticker):
+                try:
+                    if self.account.get_balance(coin) != balance:
+                        sent += self._execute_sell(coin, coin_config, current_price)
+                    elif self._send_exit(coin_config, decision, current_price):
+                        sent += 1
+                except Exception as e:
+                    self.logger.error(f"매도 실패 - {coin_config.ticker}: {e}")
+        return sent
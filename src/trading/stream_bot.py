@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Dict, Set
+
+from src.data.stream import UPBIT_WEBSOCKET_URL, MarketStream
+from src.strategies.base import TradingStrategy
+from src.strategies.context import MarketContext
+from src.trading.async_bot import AsyncTradingBot
+from src.trading.bot import CYCLE_ERRORS, CYCLE_SECONDS
+from src.utils.journal import get_journal
+
+class StreamingTradingBot(AsyncTradingBot):
+    """
+    WebSocket 실시간 시세 기반 이벤트 구동 봇 (모의 거래는 모의 거래소의 시세 소스로 구동)
+    - 가격이 바뀐 티커에 대해서만 청산 규칙과 매수 신호를 평가
+    - 평가 중 들어온 변경은 모아서 다음 회차에 한 번에 처리
+    """
+    CANDLE_RESYNC_INTERVAL = 300  # 실시간으로 갱신한 캔들을 REST로 재동기화하는 간격 (초)
+
+    def __init__(self, strategy_type: TradingStrategy, url: str = UPBIT_WEBSOCKET_URL,
+                 paper: bool = False):
+        super().__init__(strategy_type, paper)
+        self.candle_store.refresh_interval = self.CANDLE_RESYNC_INTERVAL
+        if paper:
+            # 신호 판단과 모의 체결이 같은 시세를 보도록 모의 거래소의 시세 소스로 구동
+            from src.exchange.simulated import QuoteStream
+            self.stream = QuoteStream(self.exchange.quotes, self.config.get_ticker_list(),
+                                      self.candle_store, market=self.market)
+        else:
+            self.stream = MarketStream(self.config.get_ticker_list(), self.candle_store,
+                                       url=url, market=self.market)
+        self._index_coins()
+
+    def _index_coins(self) -> None:
+        self.coins_by_ticker: Dict[str, str] = {
+            coin_config.ticker: coin for coin, coin_config in self.config.coin_settings.items()
+        }
+
+    async def run_async(self) -> None:
+        """실시간 시세 수신과 신호 평가 루프"""
+        self.logger.info(f"자동매매 프로그램 시작(stream) - 전략: {self.strategy_type.value}")
+        self.semaphore = asyncio.Semaphore(self.config.trade_settings.max_concurrency)
+        self._start_reporting()
+
+        if not await self._call(self.check_system_status):
+            self.logger.error("시스템 상태 체크 실패. 프로그램을 종료합니다.")
+            return
+
+        # 청산은 틱마다 _evaluate_changed에서 점검하므로 포지션 감시 스레드는 시작하지 않음
+        if self.scanner is not None:
+            # 구독 대상은 연결 시점에 정해지므로 시장 스캔은 시작 시 한 번만 수행
+            await self._call(self._refresh_universe)
+            self.stream.tickers = self.config.get_ticker_list()
+            self._index_coins()
+
+        stream_task = asyncio.create_task(self.stream.run())
+        try:
+            while True:
+                changed = await self.stream.wait_changed()
+                try:
+                    if self._daily_limit_reached():
+                        continue
+                    if not self.market.is_trade_time():
+                        continue
+                    started = time.perf_counter()
+                    trades_executed = await self._evaluate_changed(changed)
+                    elapsed = time.perf_counter() - started
+                    CYCLE_SECONDS.observe(elapsed, mode='stream')
+                    get_journal().record('cycle', mode='stream', seconds=elapsed, tickers=len(changed))
+                    if trades_executed:
+                        self._count_trade()
+                except Exception as e:
+                    CYCLE_ERRORS.inc(mode='stream')
+                    self.logger.error(f"실시간 평가 중 에러 발생: {e}")
+        finally:
+            self.stream.stop()
+            stream_task.cancel()
+
+    async def _evaluate_changed(self, tickers: Set[str]) -> bool:
+        """가격이 바뀐 티커들의 청산/매수 평가"""
+        trades_executed = False
+        if self.config.reload_if_changed(self._held_tickers):
+            self._index_coins()
+        targets = [(self.coins_by_ticker[t], t, self.stream.prices[t])
+                   for t in tickers if t in self.coins_by_ticker]
+
+        # 청산 규칙은 계좌 스냅샷만 쓰므로 먼저 실행 (가격이 바뀐 티커만 판단 대상)
+        if await self._call(self._check_exits, {ticker: price for _, ticker, price in targets}):
+            trades_executed = True
+
+        context = MarketContext(self, dict(self.stream.prices))
+        signals = await asyncio.gather(*(self._evaluate(ticker, price, context)
+                                         for _, ticker, price in targets))
+        for (_, ticker, price), signal in zip(targets, signals):
+            try:
+                if signal and await self._call(self.order_manager.place_buy, ticker, price):
+                    trades_executed = True
+            except Exception as e:
+                self.logger.error(f"매수 실패 - {ticker}: {e}")
+
+        return trades_executed
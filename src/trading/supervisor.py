@@ -0,0 +1,436 @@
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.trading_config import CoinConfig, TradingConfig
+from src.data.candle_store import CandleStore
+from src.data.history import HistoryStore
+from src.data.shared_market import SharedCandleStore, SharedMarketData, SharedPrices, SharedQuotes
+from src.data.state_store import StateStore
+from src.exchange.base import ExchangeBackend
+from src.strategies.base import TradingStrategy
+from src.strategies.factory import create_strategy
+from src.trading.bot import TradingBot
+from src.trading.coordinator import TradeCoordinator
+from src.trading.market import Market
+from src.trading.universe import UniverseScanner
+from src.api.gateway import get_gateway
+from src.utils.logger import setup_logger, get_logger
+from src.utils.metrics import get_metrics, start_exporter
+
+WORKERS_ALIVE = get_metrics().gauge('supervisor_workers_alive', "실행 중인 워커 프로세스 수")
+WORKER_RESTARTS = get_metrics().counter('supervisor_worker_restarts_total',
+                                        "비정상 종료 후 재시작한 워커/feed 프로세스 수")
+POOL_KRW = get_metrics().gauge('supervisor_pool_krw', "워커들이 공유하는 사용 가능 원화")
+
+def create_exchange(config: TradingConfig, paper: bool) -> ExchangeBackend:
+    """실거래(업비트) 또는 모의 거래소 백엔드 생성"""
+    if paper:
+        from src.exchange.simulated import create_paper_exchange
+        return create_paper_exchange(config.paper_settings)
+    from src.exchange.upbit import UpbitExchange
+    return UpbitExchange(config.api_keys)
+
+def split_shards(coin_settings: Dict[str, CoinConfig], workers: int) -> List[Dict[str, CoinConfig]]:
+    """거래 대상을 워커 수만큼 라운드로빈으로 분배 (빈 샤드는 제외)"""
+    shards: List[Dict[str, CoinConfig]] = [{} for _ in range(workers)]
+    for i, (coin, coin_config) in enumerate(coin_settings.items()):
+        shards[i % workers][coin] = coin_config
+    return [s for s in shards if s]
+
+def candle_needs(strategy_type: TradingStrategy, config: TradingConfig) -> List[Tuple[str, int]]:
+    """전략이 사용하는 (봉 간격, 캔들 수) - 간격별 최대 개수"""
+    strategy = create_strategy(strategy_type, None, config.strategy_settings.get(strategy_type.value))
+    needs: Dict[str, int] = {}
+    for kind, interval, count in strategy.data_needs():
+        if kind == 'candles':
+            needs[interval] = max(needs.get(interval, 0), count)
+    return list(needs.items())
+
+class SharedMarket(Market):
+    """
+    워커용 Market - 현재가는 feed 프로세스가 공유한 테이블에서 읽음
+    - 공유 대상이 아닌 티커만 거래소에 직접 조회
+    - 갱신이 max_age보다 오래됐으면(feed 중단) 공유 현재가를 쓰지 않음
+    """
+
+    def __init__(self, exchange: ExchangeBackend, prices: SharedPrices, max_age: float):
+        super().__init__(exchange)
+        self.shared_prices = prices
+        self.max_age = max_age
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        table, updated = self.shared_prices.read()
+        fresh = time.time() - updated <= self.max_age
+        prices, missing = {}, []
+        for ticker in tickers:
+            i = self.shared_prices.index.get(ticker)
+            if i is None:
+                missing.append(ticker)
+            elif fresh and not np.isnan(table[i]):
+                prices[ticker] = float(table[i])
+        if not fresh:
+            get_logger(__name__).warning(f"공유 현재가 갱신 지연 - {time.time() - updated:.0f}초 전 값")
+        if missing:
+            prices.update(super().get_current_prices(missing))
+        return prices
+
+class ShardConfig(TradingConfig):
+    """
+    워커용 설정 - 거래 대상을 배정받은 코인으로 제한
+    - config.yaml 재적재 시에도 같은 코인만 유지 (YAML에서 빠진 스캔 코인은 배정 시 설정 유지)
+    - 시장 스캔과 지표 HTTP 노출은 감독 프로세스만 수행
+    """
+
+    def __init__(self, shard: Dict[str, CoinConfig]):
+        self.shard = dict(shard)
+        super().__init__()
+        self.universe_settings.enabled = False
+        self.metrics_settings.port = 0
+        self.metrics_settings.snapshot_path = None
+        self._restrict()
+
+    def reload(self, held: Iterable[str] = ()) -> None:
+        super().reload(held)
+        self._restrict()
+
+    def _restrict(self) -> None:
+        self.coin_settings = {coin: self.coin_settings.get(coin, coin_config)
+                              for coin, coin_config in self.shard.items()}
+
+class ShardWorkerBot(TradingBot):
+    """
+    배정받은 티커만 거래하는 워커 봇
+    - 현재가/캔들은 공유 메모리에서 읽고 거래소 조회는 주문/잔고/호가만
+    - 원화 한도와 일일 거래 횟수는 TradeCoordinator로 전체 워커가 함께 지킴
+    """
+
+    def __init__(self, index: int, strategy_type: TradingStrategy, paper: bool,
+                 config: ShardConfig, shared: SharedMarketData, coordinator: TradeCoordinator,
+                 max_price_age: float):
+        self.index = index
+        self.shared = shared
+        self.coordinator = coordinator
+        self.max_price_age = max_price_age
+        super().__init__(strategy_type, paper, config)
+        self.order_manager.coordinator = coordinator
+
+    def _create_exchange(self) -> ExchangeBackend:
+        """모의 거래는 feed 프로세스가 공유한 현재가로 체결"""
+        if not self.paper:
+            return super()._create_exchange()
+        from src.exchange.simulated import create_paper_exchange
+        settings = self.config.paper_settings
+        quotes = SharedQuotes(self.shared.prices, volatility=settings.volatility,
+                              seed=settings.seed + self.index, universe_size=settings.universe_size)
+        return create_paper_exchange(settings, quotes)
+
+    def _create_market(self) -> Market:
+        return SharedMarket(self.exchange, self.shared.prices, self.max_price_age)
+
+    def _create_candle_store(self) -> SharedCandleStore:
+        return SharedCandleStore(self.shared)
+
+    def _create_history(self) -> Optional[HistoryStore]:
+        return None
+
+    def _state_path(self, path):
+        """워커별 상태 파일 (*_w{번호})"""
+        path = super()._state_path(path)
+        if not path:
+            return path
+        p = Path(path)
+        return str(p.with_name(f"{p.stem}_w{self.index}{p.suffix}"))
+
+    def _journal_source(self) -> str:
+        return f"{super()._journal_source()}_w{self.index}"
+
+    def _load_daily(self) -> None:
+        """일일 거래 횟수는 감독 프로세스가 복원"""
+
+    def _count_trade(self) -> None:
+        cycle = int(time.time() // self.config.trade_settings.trade_interval)
+        self.daily_trade_count = self.coordinator.count_trade(cycle)
+
+    def _daily_limit_reached(self) -> bool:
+        return self.coordinator.daily_limit_reached()
+
+class MarketDataFeed:
+    """
+    feed 프로세스 - 전체 티커의 현재가와 캔들을 조회해 공유 메모리에 기록
+    - 현재가는 feed_interval마다 일괄 조회 1회
+    - 캔들은 별도 스레드에서 CandleStore 갱신 주기에 맞춰 (티커, 간격)별 추가분만 조회
+    - 실거래는 reconcile_interval마다 거래소 원화 잔고로 원화 풀 보정
+    """
+
+    def __init__(self, config: TradingConfig, paper: bool, shared: SharedMarketData,
+                 coordinator: TradeCoordinator, interval: float):
+        self.config = config
+        self.paper = paper
+        self.shared = shared
+        self.coordinator = coordinator
+        self.interval = interval
+        self.logger = get_logger(__name__)
+        self.exchange = create_exchange(config, paper)
+        self.market = Market(self.exchange)
+        history_path = config.history_settings.path
+        history = (HistoryStore(history_path)
+                   if history_path and not paper and Path(history_path).exists() else None)
+        self.candle_store = CandleStore(exchange=self.exchange, history=history,
+                                        buffer_factory=lambda t, i, c: shared.buffer(t, i))
+        self.stop = threading.Event()
+
+    def refresh_prices(self) -> None:
+        self.shared.prices.write(self.market.get_current_prices(self.shared.tickers))
+
+    def refresh_candles(self) -> None:
+        for ticker in self.shared.tickers:
+            for interval, count in self.shared.needs.items():
+                self.candle_store.get_candles(ticker, interval, count)
+
+    def sync_krw(self) -> None:
+        """실거래 원화 잔고로 원화 풀 보정 (모의 거래는 워커 주문 기록만 사용)"""
+        if self.paper:
+            return
+        try:
+            marker = self.coordinator.sync_marker()
+            balances = {b['currency']: b for b in self.exchange.get_balances()}
+            krw = balances.get('KRW')
+            self.coordinator.sync_krw(float(krw['balance']) if krw else 0.0, marker)
+        except Exception as e:
+            self.logger.error(f"원화 잔고 보정 실패: {e}")
+
+    def _candle_loop(self) -> None:
+        while not self.stop.is_set():
+            try:
+                self.refresh_candles()
+            except Exception as e:
+                self.logger.error(f"공유 캔들 갱신 실패: {e}")
+            self.stop.wait(1.0)
+
+    def run(self, ready) -> None:
+        """첫 현재가/캔들/원화 보정을 마치면 ready 설정 후 주기 갱신"""
+        self.refresh_prices()
+        self.refresh_candles()
+        self.sync_krw()
+        ready.set()
+        self.logger.info(f"시세 공유 시작 - 티커 {len(self.shared.tickers)}개, "
+                         f"캔들 {dict(self.shared.needs)}")
+        threading.Thread(target=self._candle_loop, daemon=True).start()
+        reconcile_interval = self.config.trade_settings.reconcile_interval
+        last_sync = time.monotonic()
+        while not self.stop.is_set():
+            started = time.monotonic()
+            try:
+                self.refresh_prices()
+            except Exception as e:
+                self.logger.error(f"공유 현재가 갱신 실패: {e}")
+            if started - last_sync >= reconcile_interval:
+                self.sync_krw()
+                last_sync = started
+            self.stop.wait(max(self.interval - (time.monotonic() - started), 0.0))
+
+def _exit_on_terminate() -> None:
+    """SIGTERM을 정상 종료로 처리 - 대기 중인 로그/이벤트 기록을 남기고 종료"""
+    def terminate(*_):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)  # 종료 처리 중 다시 받은 SIGTERM 무시
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, terminate)
+
+def _run_feed(prefix: str, tickers: List[str], needs: List[Tuple[str, int]], paper: bool,
+              coordinator: TradeCoordinator, interval: float, processes: int, ready) -> None:
+    """feed 프로세스 시작점"""
+    setup_logger('logs/feed.log')
+    _exit_on_terminate()
+    get_gateway().share(processes)
+    shared = SharedMarketData(prefix, tickers, needs, writer=True)
+    try:
+        MarketDataFeed(TradingConfig(), paper, shared, coordinator, interval).run(ready)
+    finally:
+        shared.close()
+
+def _run_worker(index: int, shard: Dict[str, CoinConfig], strategy_type: TradingStrategy,
+                paper: bool, prefix: str, tickers: List[str], needs: List[Tuple[str, int]],
+                coordinator: TradeCoordinator, processes: int, max_price_age: float) -> None:
+    """워커 프로세스 시작점"""
+    setup_logger(f'logs/worker_{index}.log')
+    _exit_on_terminate()
+    get_gateway().share(processes)  # 같은 계정/IP 요청 한도를 프로세스 수로 나눔
+    shared = SharedMarketData(prefix, tickers, needs)
+    try:
+        ShardWorkerBot(index, strategy_type, paper, ShardConfig(shard), shared, coordinator,
+                       max_price_age).run()
+    finally:
+        shared.close()
+
+class Supervisor:
+    """
+    다중 프로세스 실행 감독
+    - 거래 대상 티커를 워커 수만큼 나눠 워커 프로세스마다 독립된 거래 루프 실행
+    - feed 프로세스 하나가 시세/캔들을 조회해 공유 메모리에 기록하고 워커들은 읽기만 함
+    - 원화 한도(min_krw_balance)와 일일 거래 한도는 워커 전체 합계로 적용
+    - 종료된 워커/feed는 restart_delay 후 다시 시작
+    """
+
+    def __init__(self, strategy_type: TradingStrategy, paper: bool = False,
+                 workers: Optional[int] = None, config: Optional[TradingConfig] = None):
+        """
+        :param workers: 워커 프로세스 수 (없으면 설정값, 설정도 0이면 CPU 코어 수)
+        """
+        setup_logger()
+        self.logger = get_logger(__name__)
+        self.strategy_type = strategy_type
+        self.paper = paper
+        self.config = config or TradingConfig()
+        self.settings = self.config.supervisor_settings
+        self.workers = workers or self.settings.workers or os.cpu_count() or 1
+        self.ctx = multiprocessing.get_context('spawn')  # 워커는 부모 상태를 물려받지 않음
+        self.prefix = f"upbit_{os.getpid()}"
+        trade_settings = self.config.trade_settings
+        self.coordinator = TradeCoordinator(
+            trade_settings.max_daily_trades, trade_settings.min_krw_balance,
+            krw=self.config.paper_settings.initial_krw if paper else 0.0, context=self.ctx)
+        self.state = self._create_state()
+        self.stop = threading.Event()
+        self.feed: Optional[multiprocessing.Process] = None
+        self.procs: Dict[int, multiprocessing.Process] = {}
+        self.shards: List[Dict[str, CoinConfig]] = []
+        self.processes = self.workers + 1  # 요청 한도를 나눠 쓰는 프로세스 수 (워커 + feed)
+
+    def _create_state(self) -> Optional[StateStore]:
+        """일일 거래 횟수 저장소 (모의 거래는 *_paper 경로)"""
+        path = self.config.state_settings.path
+        if not path:
+            return None
+        if self.paper:
+            p = Path(path)
+            path = str(p.with_name(f"{p.stem}_paper{p.suffix}"))
+        return StateStore(path)
+
+    def _plan_universe(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        시작 시 1회 전체 시장 스캔 (비활성이면 빈 결과)
+        :return: (스캔 후보, 보유 중인 코인) - 티커별 스캔 시점 현재가
+        """
+        if not self.config.universe_settings.enabled:
+            return {}, {}
+        try:
+            market = Market(create_exchange(self.config, self.paper))
+            scanner = UniverseScanner(market, self.config.universe_settings)
+            shortlist = scanner.scan()
+            held = {}
+            if not self.paper:
+                balances = {b['currency']: b for b in market.exchange.get_balances()}
+                held = scanner.held_tickers(balances, shortlist)
+            return shortlist, held
+        except Exception as e:
+            self.logger.error(f"시장 스캔 실패 - YAML 코인만 거래: {e}")
+            return {}, {}
+
+    def _start_feed(self, tickers: List[str], needs: List[Tuple[str, int]]) -> bool:
+        """feed 프로세스 시작 - 첫 공유가 끝날 때까지 대기"""
+        ready = self.ctx.Event()
+        self.feed = self.ctx.Process(
+            target=_run_feed, name='feed', daemon=True,
+            args=(self.prefix, tickers, needs, self.paper, self.coordinator,
+                  self.settings.feed_interval, self.processes, ready))
+        self.feed.start()
+        if not ready.wait(self.settings.ready_timeout):
+            self.logger.error(f"시세 공유 준비 실패 - {self.settings.ready_timeout:.0f}초 초과")
+            return False
+        return True
+
+    def _start_worker(self, index: int, tickers: List[str], needs: List[Tuple[str, int]]) -> None:
+        proc = self.ctx.Process(
+            target=_run_worker, name=f'worker_{index}', daemon=True,
+            args=(index, self.shards[index], self.strategy_type, self.paper, self.prefix, tickers,
+                  needs, self.coordinator, self.processes, self.settings.max_price_age))
+        proc.start()
+        self.procs[index] = proc
+        self.logger.info(f"워커 {index} 시작 (PID {proc.pid}) - {', '.join(self.shards[index])}")
+
+    def _save_daily(self, saved: Tuple) -> Tuple:
+        daily = self.coordinator.daily()
+        if self.state is not None and daily != saved:
+            try:
+                self.state.save_daily(*daily)
+            except Exception as e:
+                self.logger.error(f"거래 횟수 저장 실패: {e}")
+        return daily
+
+    def run(self) -> None:
+        """메인 실행 함수 - 중단(SIGINT/SIGTERM)까지 워커 감시"""
+        self.logger.info(f"다중 프로세스 자동매매 시작 - 전략: {self.strategy_type.value}, "
+                         f"워커 {self.workers}개")
+        signal.signal(signal.SIGTERM, lambda *_: self.stop.set())
+        start_exporter(self.config.metrics_settings)
+        if self.state is not None:
+            saved = self.state.load_daily()
+            if saved is not None:
+                self.coordinator.restore_daily(*saved)
+        saved = self.coordinator.daily()
+
+        shortlist, held = self._plan_universe()
+        needs = candle_needs(self.strategy_type, self.config)
+        tickers = list(dict.fromkeys(self.config.get_ticker_list() + list(held) + list(shortlist)))
+        shared = SharedMarketData(self.prefix, tickers, needs, create=True)
+        try:
+            if not self._start_feed(tickers, needs):
+                return
+            if shortlist or held:
+                # 스캔 코인의 최소 거래량은 공유 현재가 기준 (모의 거래는 feed 시세가 체결가)
+                table, _ = shared.prices.read()
+                current = {t: float(table[i]) for t, i in shared.prices.index.items()
+                           if not np.isnan(table[i])}
+                self.config.apply_universe({t: current.get(t, p) for t, p in shortlist.items()},
+                                           {t: current.get(t, p) for t, p in held.items()})
+            self.shards = split_shards(self.config.coin_settings, self.workers)
+            for index in range(len(self.shards)):
+                self._start_worker(index, tickers, needs)
+
+            restart_at: Dict[int, float] = {}
+            while not self.stop.wait(1.0):
+                saved = self._save_daily(saved)
+                POOL_KRW.set(self.coordinator.krw())
+                if not self.feed.is_alive():
+                    WORKER_RESTARTS.inc(process='feed')
+                    self.logger.error(f"feed 프로세스 종료 (코드 {self.feed.exitcode}) - 다시 시작")
+                    self._start_feed(tickers, needs)
+                for index, proc in list(self.procs.items()):
+                    if proc.is_alive():
+                        continue
+                    if index not in restart_at:
+                        self.logger.error(f"워커 {index} 종료 (코드 {proc.exitcode}) - "
+                                          f"{self.settings.restart_delay:.0f}초 후 재시작")
+                        restart_at[index] = time.monotonic() + self.settings.restart_delay
+                    elif time.monotonic() >= restart_at[index]:
+                        del restart_at[index]
+                        WORKER_RESTARTS.inc(process='worker')
+                        self._start_worker(index, tickers, needs)
+                WORKERS_ALIVE.set(sum(p.is_alive() for p in self.procs.values()))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.logger.info("다중 프로세스 자동매매 종료 - 워커 정리")
+            self._save_daily(None)
+            self._shutdown()
+            shared.close()
+            shared.unlink()
+
+    def _shutdown(self) -> None:
+        """워커와 feed 종료 (응답 없으면 강제 종료)"""
+        procs = list(self.procs.values()) + ([self.feed] if self.feed is not None else [])
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        for proc in procs:
+            proc.join(5)
+            if proc.is_alive():
+                proc.kill()
@@ -0,0 +1,97 @@
+import time
+from typing import Dict, List, Optional
+import numpy as np
+from src.config.trading_config import UniverseSettings
+from src.trading.market import Market
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+SCAN_SECONDS = get_metrics().histogram('universe_scan_seconds', "전체 시장 스캔 소요 시간 (초)")
+SHORTLISTED = get_metrics().gauge('universe_shortlisted', "스캔 후보 티커 수")
+
+# 스캔에 사용하는 /v1/ticker 응답 필드 (배열 열 순서)
+STAT_FIELDS = ('trade_price', 'opening_price', 'high_price', 'low_price',
+               'prev_closing_price', 'acc_trade_price_24h')
+
+class UniverseScanner:
+    """
+    전체 KRW 시장 스캐너
+    - 티커 목록과 24시간 통계를 일괄 요청(100개 단위)으로 조회
+    - 거래대금/변동성/일봉 하이킨아시 추세 필터를 NumPy 배열 연산으로 한 번에 적용
+    - 통과한 티커만 거래대금 순으로 max_tickers개 반환
+    """
+
+    def __init__(self, market: Market, settings: UniverseSettings):
+        self.market = market
+        self.settings = settings
+        self.logger = get_logger(__name__)
+        self.last_scan = 0.0
+        self.shortlist: Dict[str, float] = {}
+
+    def due(self) -> bool:
+        """재스캔 시점 여부"""
+        return time.monotonic() - self.last_scan >= self.settings.scan_interval
+
+    def scan(self) -> Dict[str, float]:
+        """
+        전체 시장 스캔
+        :return: 후보 티커별 현재가 (거래대금 내림차순)
+        """
+        with SCAN_SECONDS.time():
+            tickers = [t for t in self.market.exchange.get_tickers(self.settings.fiat)
+                       if t not in self.settings.exclude]
+            stats = self.market.get_ticker_stats(tickers)
+            cpu_started = time.process_time()
+            self.shortlist = self.screen(stats)
+            cpu = time.process_time() - cpu_started
+        self.last_scan = time.monotonic()
+        SHORTLISTED.set(len(self.shortlist))
+        self.logger.info(f"시장 스캔 - 전체 {len(stats)}개 중 {len(self.shortlist)}개 선정 "
+                         f"(필터 CPU {cpu * 1000:.1f}ms): {', '.join(self.shortlist)}")
+        return self.shortlist
+
+    def screen(self, stats: List[Dict]) -> Dict[str, float]:
+        """24시간 통계 목록에 필터 적용"""
+        markets = [s['market'] for s in stats]
+        if not markets:
+            return {}
+        data = self._to_array(stats)
+        price, open_, high, low, prev_close, value = data
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility = (high - low) / prev_close
+        s = self.settings
+        mask = ((value >= s.min_trade_value_24h)
+                & (volatility >= s.min_volatility)
+                & (volatility <= s.max_volatility)
+                & (price >= s.min_price))
+        if s.require_ha_uptrend:
+            # 전일 종가를 직전 봉 대용으로 쓴 일봉 하이킨아시 양봉 여부
+            ha_close = (open_ + high + low + price) / 4
+            ha_open = (open_ + prev_close) / 2
+            mask &= ha_close > ha_open
+
+        selected = np.flatnonzero(mask)
+        selected = selected[np.argsort(-value[selected], kind='stable')][:s.max_tickers]
+        return {markets[i]: float(price[i]) for i in selected}
+
+    @staticmethod
+    def _to_array(stats: List[Dict]) -> np.ndarray:
+        """필드별 열 배열 (누락 값은 NaN - 모든 비교에서 탈락)"""
+        data = np.array([[s.get(f) for f in STAT_FIELDS] for s in stats], dtype=float)
+        return data.T
+
+    def held_tickers(self, balances: Dict[str, Dict], prices: Optional[Dict[str, float]] = None
+                     ) -> Dict[str, float]:
+        """
+        보유 중인 코인 티커 - 후보에서 빠져도 청산 관리를 위해 유지
+        :param balances: 화폐별 잔고 스냅샷
+        :param prices: 알려진 현재가 (없으면 평균 매수가)
+        """
+        held = {}
+        for currency, b in balances.items():
+            if currency == self.settings.fiat or float(b.get('balance', 0)) <= 0:
+                continue
+            ticker = f"{self.settings.fiat}-{currency}"
+            held[ticker] = (prices or {}).get(ticker) or float(b.get('avg_buy_price', 0))
+        return held
@@ -0,0 +1,221 @@
+import atexit
+import json
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+JOURNAL_EVENTS = get_metrics().counter('journal_events_total', "기록한 이벤트 수 (kind)")
+JOURNAL_DROPPED = get_metrics().counter('journal_dropped_total', "대기열이 가득 차 버린 이벤트 수")
+JOURNAL_FLUSH = get_metrics().histogram('journal_flush_seconds', "이벤트 묶음 기록 소요 시간 (초)")
+
+class EventJournal:
+    """
+    구조화 이벤트 기록 (신호/주문/체결/사이클 소요 시간)
+    - record()는 (시각, 종류, 필드)를 대기열에 넣기만 하고 바로 반환 (직렬화/파일 기록 없음)
+    - 백그라운드 스레드가 flush_interval마다 쌓인 이벤트를 JSON 줄로 묶어 한 번에 추가
+    - 파일: {root}/{YYYYMMDD}/{source}.jsonl (날짜별로 교체, keep_days 지난 날짜 디렉터리 삭제)
+    - 시작 전(start 호출 전)에는 record()가 아무것도 하지 않음
+    """
+
+    def __init__(self):
+        self.root: Optional[Path] = None
+        self.source = 'live'
+        self.debug = False
+        self.flush_interval = 1.0
+        self.max_queue = 100000
+        self.keep_days = 0
+        self._queue: Optional[deque] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._day: Optional[str] = None
+        self.logger = get_logger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self._queue is not None
+
+    def record(self, kind: str, **fields) -> None:
+        """
+        이벤트 1건 기록 요청 (호출 스레드에서는 대기열 추가만)
+        :param kind: signal / order / exit / fill / cycle 등
+        """
+        events = self._queue
+        if events is None:
+            return
+        if len(events) >= self.max_queue:
+            JOURNAL_DROPPED.inc()
+            return
+        events.append((time.time(), kind, fields))
+
+    def start(self, root: str, source: str = 'live', flush_interval: float = 1.0,
+              max_queue: int = 100000, keep_days: int = 0, debug: bool = False) -> None:
+        """
+        :param source: 파일 이름 (실거래/모의/워커 구분)
+        :param debug: True면 매수 신호가 아닌 판단까지 기록
+        """
+        if self._thread is not None:
+            return
+        self.root = Path(root)
+        self.source = source
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.keep_days = keep_days
+        self.debug = debug
+        self._queue = deque()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._writer_loop, name='journal', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        self.logger.info(f"이벤트 기록 시작 - {self.root}/{{날짜}}/{source}.jsonl")
+
+    def stop(self) -> None:
+        """남은 이벤트를 기록하고 중지"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._day = None
+
+    def _writer_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        대기 중인 이벤트를 날짜별 파일에 추가 (기록 스레드에서 호출)
+        :return: 기록한 이벤트 수
+        """
+        events = self._queue
+        if not events:
+            return 0
+        started = time.perf_counter()
+        lines: List[str] = []
+        day = None
+        written = 0
+        for _ in range(len(events)):
+            ts, kind, fields = events.popleft()
+            event_day = datetime.fromtimestamp(ts).strftime('%Y%m%d')
+            if event_day != day and lines:
+                self._write(day, lines)
+                lines = []
+            day = event_day
+            lines.append(json.dumps({'ts': ts, 'kind': kind, **fields}, ensure_ascii=False,
+                                    separators=(',', ':'), default=_to_json))
+            JOURNAL_EVENTS.inc(kind=kind)
+            written += 1
+        if lines:
+            self._write(day, lines)
+        JOURNAL_FLUSH.observe(time.perf_counter() - started)
+        return written
+
+    def _write(self, day: str, lines: List[str]) -> None:
+        try:
+            if day != self._day:
+                self._rotate(day)
+            self._file.write('\n'.join(lines) + '\n')
+            self._file.flush()
+        except Exception as e:
+            self.logger.error(f"이벤트 기록 실패 ({len(lines)}건 버림): {e}")
+
+    def _rotate(self, day: str) -> None:
+        """날짜가 바뀌면 새 파일로 교체하고 보관 기간이 지난 날짜 삭제"""
+        if self._file is not None:
+            self._file.close()
+        directory = self.root / day
+        directory.mkdir(parents=True, exist_ok=True)
+        self._file = open(directory / f"{self.source}.jsonl", 'a', encoding='utf-8')
+        self._day = day
+        if self.keep_days > 0:
+            cutoff = (datetime.strptime(day, '%Y%m%d') - timedelta(days=self.keep_days)).strftime('%Y%m%d')
+            for old in self.root.iterdir():
+                if old.is_dir() and old.name.isdigit() and old.name < cutoff:
+                    shutil.rmtree(old, ignore_errors=True)
+
+def _to_json(value):
+    """NumPy 스칼라 등 JSON 기본형이 아닌 값 변환"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+_journal = EventJournal()
+
+def get_journal() -> EventJournal:
+    """
+    프로세스 공용 이벤트 기록기 반환
+    :return: 이벤트 기록기 (시작 전에는 기록하지 않음)
+    """
+    return _journal
+
+def start_journal(settings, source: str = 'live') -> EventJournal:
+    """
+    설정에 따라 이벤트 기록 시작 (프로세스당 1회)
+    :param settings: JournalSettings
+    """
+    if settings.path:
+        _journal.start(settings.path, source, settings.flush_interval, settings.max_queue,
+                       settings.keep_days, settings.debug)
+    return _journal
+
+def read_events(root: str, day: date, kinds: Optional[Iterable[str]] = None,
+                source: Optional[str] = None) -> List[Dict]:
+    """
+    하루치 이벤트 (시각순)
+    :param kinds: 읽을 이벤트 종류 (없으면 전체)
+    :param source: 파일 이름 접두사 (예: paper - paper, paper_w0 ... 모두 포함, 없으면 전체)
+    :return: 이벤트 목록 - 각 이벤트에 source 필드 추가
+    """
+    directory = Path(root) / day.strftime('%Y%m%d')
+    kinds = set(kinds) if kinds is not None else None
+    events = []
+    for path in sorted(directory.glob(f"{source or ''}*.jsonl")):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 마지막 줄이 잘린 경우
+                if kinds is None or event.get('kind') in kinds:
+                    event['source'] = path.stem
+                    events.append(event)
+    events.sort(key=lambda e: e['ts'])
+    return events
+
+def load_events(root: str, day: date, kinds: Optional[Iterable[str]] = None,
+                source: Optional[str] = None):
+    """
+    하루치 이벤트를 DataFrame으로 (index: 이벤트 시각, 종류별로 없는 필드는 NaN)
+    """
+    import pandas as pd
+    df = pd.DataFrame.from_records(read_events(root, day, kinds, source))
+    if df.empty:
+        return df
+    return df.set_index(pd.to_datetime(df['ts'], unit='s').rename('time'))
+
+def load_arrays(root: str, day: date, kind: str, fields: Sequence[str],
+                source: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    한 종류 이벤트의 필드별 NumPy 배열 (ts 포함, 없는 값은 NaN/None)
+    - 예: load_arrays('logs/journal', date.today(), 'cycle', ['seconds'])
+    """
+    events = read_events(root, day, [kind], source)
+    columns = {'ts': np.array([e['ts'] for e in events], dtype=np.float64)}
+    for field in fields:
+        values = [e.get(field) for e in events]
+        numeric = all(v is None or isinstance(v, (int, float)) for v in values)
+        columns[field] = (np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+                          if numeric else np.array(values, dtype=object))
+    return columns
@@ -1,16 +1,35 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+_listener: Optional[QueueListener] = None
+
+class _InProcessQueueHandler(QueueHandler):
+    """같은 프로세스의 리스너로 넘기므로 레코드 복사/메시지 포맷은 기록 스레드에서 수행"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 def setup_logger(filename: str = 'logs/trading.log') -> None:
     """
-    로깅 설정 초기화
+    로깅 설정 초기화 (프로세스당 1회, 이미 설정돼 있으면 무시)
+    - 호출 스레드는 레코드를 대기열에 넣기만 하고 파일 기록은 QueueListener 스레드가 담당
     :param filename: 로그 파일 이름
     """
-    logging.basicConfig(
-        filename=filename,
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handler = logging.FileHandler(filename)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    records = queue.SimpleQueue()
+    root.addHandler(_InProcessQueueHandler(records))
+    root.setLevel(logging.INFO)
+    _listener = QueueListener(records, handler)
+    _listener.start()
+    atexit.register(_listener.stop)  # 종료 시 남은 레코드 기록
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
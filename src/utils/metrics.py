@@ -0,0 +1,256 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.utils.logger import get_logger
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    body = ','.join(f'{k}="{v}"' for k, v in pairs)
+    return '{' + body + '}'
+
+class Metric:
+    """라벨별 값을 가지는 지표 (Prometheus 텍스트 형식으로 출력)"""
+    kind = 'untyped'
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self.values.items())
+        return super().render() + [f"{self.name}{_format_labels(k)} {v}" for k, v in items]
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {_format_labels(k) or '_': v for k, v in self.values.items()}
+
+class Gauge(Counter):
+    """현재 값 게이지"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self.values[_label_key(labels)] = value
+
+class Histogram(Metric):
+    """구간별 누적 건수 히스토그램"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = tuple(buckets)
+        self.series: Dict[LabelKey, List] = {}  # 라벨 -> [구간별 건수, 합계, 건수]
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [[0] * len(self.buckets), 0.0, 0]
+            i = bisect.bisect_left(self.buckets, value)
+            if i < len(self.buckets):
+                series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """with 블록 실행 시간(초) 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            items = [(k, list(s[0]), s[1], s[2]) for k, s in self.series.items()]
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', str(bound)))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+    def snapshot(self) -> Dict:
+        result = {}
+        with self._lock:
+            for key, (counts, total, count) in self.series.items():
+                result[_format_labels(key) or '_'] = {
+                    'count': count, 'sum': total,
+                    'mean': total / count if count else 0.0,
+                    'p50': self._quantile(counts, count, 0.5),
+                    'p99': self._quantile(counts, count, 0.99),
+                }
+        return result
+
+    def _quantile(self, counts: List[int], count: int, q: float) -> Optional[float]:
+        """q 분위가 속한 구간의 상한 (마지막 구간을 넘으면 None)"""
+        seen = 0
+        for bound, n in zip(self.buckets, counts):
+            seen += n
+            if count and seen >= q * count:
+                return bound
+        return None
+
+class MetricsRegistry:
+    """프로세스 내 지표 저장소"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help: str, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, **kwargs)
+            return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._get(Counter, name, help)
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        return self._get(Gauge, name, help)
+
+    def histogram(self, name: str, help: str, buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(line for m in metrics for line in m.render()) + '\n'
+
+    def snapshot(self) -> Dict:
+        """지표별 현재 값"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {m.name: m.snapshot() for m in metrics}
+
+class MetricsExporter:
+    """
+    지표 외부 노출
+    - port > 0이면 /metrics HTTP 엔드포인트 (Prometheus 수집용)
+    - snapshot_path가 있으면 snapshot_interval초마다 JSON 파일 기록
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str = '127.0.0.1', port: int = 0,
+                 snapshot_path: Optional[str] = None, snapshot_interval: float = 60.0):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_interval = snapshot_interval
+        self.logger = get_logger(__name__)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if self.port:
+            registry = self.registry
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split('?')[0] != '/metrics':
+                        self.send_error(404)
+                        return
+                    body = registry.render().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self.port = self._server.server_address[1]
+            threading.Thread(target=self._server.serve_forever, daemon=True,
+                             name='metrics-http').start()
+            self.logger.info(f"지표 엔드포인트 시작 - http://{self.host}:{self.port}/metrics")
+        if self.snapshot_path:
+            threading.Thread(target=self._snapshot_loop, daemon=True, name='metrics-snapshot').start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+        if self.snapshot_path:
+            self.write_snapshot()
+
+    def write_snapshot(self) -> None:
+        """스냅샷 파일 원자적 기록"""
+        data = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'metrics': self.registry.snapshot()}
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(self.snapshot_path.suffix + '.tmp')
+        tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, self.snapshot_path)
+
+    def _snapshot_loop(self) -> None:
+        while not self._stop.wait(self.snapshot_interval):
+            try:
+                self.write_snapshot()
+            except Exception as e:
+                self.logger.error(f"지표 스냅샷 기록 실패: {e}")
+
+_registry = MetricsRegistry()
+_exporter: Optional[MetricsExporter] = None
+
+def get_metrics() -> MetricsRegistry:
+    """
+    프로세스 공용 지표 저장소 반환
+    :return: 지표 저장소
+    """
+    return _registry
+
+def start_exporter(settings) -> Optional[MetricsExporter]:
+    """
+    설정에 따라 지표 노출 시작 (프로세스당 1회)
+    :param settings: MetricsSettings
+    """
+    global _exporter
+    if _exporter is None and (settings.port or settings.snapshot_path):
+        _exporter = MetricsExporter(_registry, settings.host, settings.port,
+                                    settings.snapshot_path, settings.snapshot_interval)
+        _exporter.start()
+    return _exporter
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from src.exchange.simulated import SimulatedExchange, SyntheticQuotes
+from src.trading.account import TradingAccount
+
+def make_account():
+    quotes = SyntheticQuotes(volatility=0.0)
+    quotes._prices['KRW-BTC'] = (100_000_000.0, time.time())
+    exchange = SimulatedExchange(quotes, initial_krw=4_000_000)
+    calls = []
+    get_balances = exchange.get_balances
+    exchange.get_balances = lambda: calls.append(1) or get_balances()
+    account = TradingAccount(exchange)
+    account.ORDER_POLL_INTERVAL = 0.0
+    return account, exchange, calls
+
+def test_balance_lookups_share_one_snapshot():
+    account, _, calls = make_account()
+
+    for _ in range(5):
+        assert account.get_balance('KRW') == pytest.approx(4_000_000)
+        assert account.get_balance('BTC') == 0
+        assert account.get_average_buy_price('KRW-BTC') == 0
+
+    assert len(calls) == 1
+
+def test_orders_update_balances_without_refetching():
+    account, exchange, calls = make_account()
+    account.get_balance('KRW')
+
+    assert account.buy_market_order('KRW-BTC', 100_000)
+    assert account.get_balance('BTC') == pytest.approx(float(exchange.balances['BTC']['balance']))
+    assert account.get_balance('KRW') == pytest.approx(float(exchange.balances['KRW']['balance']))
+    assert len(calls) == 1
+
+def test_invalidate_and_reconcile_interval_refetch():
+    account, _, calls = make_account()
+    account.get_balance('KRW')
+
+    account.invalidate_snapshot()
+    account.get_balance('KRW')
+    assert len(calls) == 2
+
+    account.RECONCILE_INTERVAL = 0.0
+    time.sleep(0.01)
+    account.get_balance('KRW')
+    assert len(calls) == 3
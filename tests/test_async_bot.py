@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+from src.config.trading_config import StateSettings, TradingConfig
+from src.strategies.base import TradingStrategy
+from src.trading.async_bot import AsyncTradingBot
+
+TICKERS = [f"KRW-C{i:02d}" for i in range(6)]
+
+@pytest.fixture
+def bot():
+    config = TradingConfig()
+    config.state_settings = StateSettings()  # 상태 파일 없이 실행
+    config.trade_settings = replace(config.trade_settings, max_concurrency=2, guard_interval=0)
+    template = next(iter(config.coin_settings.values()))
+    config.coin_settings = {t[4:]: replace(template, ticker=t) for t in TICKERS}
+    return AsyncTradingBot(TradingStrategy.VOLATILITY, paper=True, config=config)
+
+def run_cycle(bot):
+    async def cycle():
+        bot.semaphore = asyncio.Semaphore(bot.config.trade_settings.max_concurrency)
+        return await bot._execute_trading_cycle_async()
+    return asyncio.run(cycle())
+
+class Tracker:
+    """동시에 실행 중인 호출 수 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def enter(self, name):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(name)
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+def test_signals_evaluated_concurrently_up_to_limit(bot):
+    tracker = Tracker()
+
+    def check_buy(ticker, price, strategy, context):
+        tracker.enter(ticker)
+        time.sleep(0.05)
+        tracker.leave()
+        return False
+
+    bot.order_manager.check_buy = check_buy
+    started = time.perf_counter()
+    assert run_cycle(bot) is False
+    elapsed = time.perf_counter() - started
+
+    assert sorted(tracker.calls) == TICKERS
+    assert tracker.peak == 2
+    assert elapsed < 0.05 * len(TICKERS)  # 순차 평가보다 빠름
+
+def test_orders_placed_one_at_a_time(bot):
+    orders = Tracker()
+
+    def check_buy(ticker, price, strategy, context):
+        if ticker == 'KRW-C01':
+            raise RuntimeError("평가 실패")
+        return ticker in ('KRW-C02', 'KRW-C04')
+
+    def place_buy(ticker, price):
+        orders.enter(ticker)
+        time.sleep(0.02)
+        orders.leave()
+        return True
+
+    bot.order_manager.check_buy = check_buy
+    bot.order_manager.place_buy = place_buy
+
+    assert run_cycle(bot) is True
+    assert orders.calls == ['KRW-C02', 'KRW-C04']
+    assert orders.peak == 1
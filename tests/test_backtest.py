@@ -0,0 +1,68 @@
+import numpy as np
+
+from src.backtest.data import BarSeries
+from src.backtest.engine import BacktestEngine
+from src.config.trading_config import CoinConfig, TradeSettings
+from src.strategies.base import TradingStrategy
+
+TICKER = 'KRW-BTC'
+COIN = CoinConfig(ticker=TICKER, min_unit=0.00001, take_profit=1.5, profit_sell=0.5,
+                  stop_loss=-2.0, partial_stop=-1.2, partial_sell=0.4)
+
+def run(closes, buy_bars, max_daily_trades=20, exit_cooldown=None):
+    """1분봉 종가와 매수 신호 위치로 백테스트 실행"""
+    closes = np.asarray(closes, dtype=np.float64)
+    timestamps = np.arange(len(closes), dtype=np.int64) * 60
+    values = np.column_stack([closes, closes, closes, closes, np.ones(len(closes))])
+    signals = np.zeros(len(closes), dtype=bool)
+    signals[buy_bars] = True
+    settings = TradeSettings(max_daily_trades=max_daily_trades, trade_interval=120,
+                             min_krw_balance=0, min_profit_krw=0, min_loss_krw=0,
+                             exit_cooldown=exit_cooldown)
+    engine = BacktestEngine(settings, {'BTC': COIN}, TradingStrategy.HEIKIN_ASHI)
+    return engine.run({TICKER: BarSeries(TICKER, 'minute1', timestamps, values)},
+                      signals={TICKER: signals})
+
+def sells(result):
+    return [(t.timestamp // 60, t.reason) for t in result.trades if t.side == 'sell']
+
+def test_sustained_partial_stop_sells_once_within_cooldown():
+    result = run([100] + [98.5] * 9, [0], exit_cooldown=600)
+    assert sells(result) == [(1, 'partial_stop')]
+
+def test_partial_stop_repeats_after_cooldown():
+    result = run([100] + [98.5] * 5, [0])  # 기본 재실행 제한 = trade_interval (120초)
+    assert sells(result) == [(1, 'partial_stop'), (3, 'partial_stop'), (5, 'partial_stop')]
+
+def test_stop_loss_fires_during_partial_cooldown():
+    result = run([100, 98.5, 98.5, 97], [0], exit_cooldown=600)
+    assert sells(result) == [(1, 'partial_stop'), (3, 'stop_loss')]
+
+def test_exits_ignore_daily_trade_limit():
+    result = run([100, 100, 97, 97], [0, 1], max_daily_trades=1)
+    assert [t.side for t in result.trades] == ['buy', 'sell']
+    assert sells(result) == [(2, 'stop_loss')]
+
+def run_many(closes, buy_bars, max_daily_trades):
+    """같은 시세와 신호의 코인 여러 개 - 한 봉의 거래는 거래 사이클 1회"""
+    closes = np.asarray(closes, dtype=np.float64)
+    timestamps = np.arange(len(closes), dtype=np.int64) * 60
+    values = np.column_stack([closes, closes, closes, closes, np.ones(len(closes))])
+    signals = np.zeros(len(closes), dtype=bool)
+    signals[buy_bars] = True
+    coins = {f"C{i}": CoinConfig(**{**COIN.__dict__, 'ticker': f"KRW-C{i}"}) for i in range(3)}
+    settings = TradeSettings(max_daily_trades=max_daily_trades, trade_interval=120,
+                             min_krw_balance=0, min_profit_krw=0, min_loss_krw=0)
+    engine = BacktestEngine(settings, coins, TradingStrategy.HEIKIN_ASHI)
+    data = {c.ticker: BarSeries(c.ticker, 'minute1', timestamps, values) for c in coins.values()}
+    return engine.run(data, signals={t: signals for t in data})
+
+def test_daily_limit_counts_trading_cycles_not_fills():
+    # 봉 0: 3종목 매수 (사이클 1회), 봉 1: 3종목 부분 손절 (사이클 2회째)
+    result = run_many([100, 98.5, 98.5], [0], max_daily_trades=2)
+    assert [(t.timestamp // 60, t.side) for t in result.trades].count((0, 'buy')) == 3
+    assert [(t.timestamp // 60, t.side) for t in result.trades].count((1, 'sell')) == 3
+
+def test_daily_limit_reached_by_one_cycle_still_exits():
+    result = run_many([100, 98.5, 98.5], [0], max_daily_trades=1)
+    assert [t.side for t in result.trades] == ['buy'] * 3 + ['sell'] * 3
@@ -0,0 +1,61 @@
+import copy
+import time
+
+import pyupbit
+import pytest
+from pyupbit import request_api
+
+from src.api.gateway import get_gateway
+from src.benchmark.suite import compare, run_suite, stub_upbit
+from src.strategies.base import TradingStrategy
+from src.trading.bot import TradingBot
+
+@pytest.fixture(scope='module')
+def result():
+    return run_suite(TradingStrategy.HEIKIN_ASHI, [3], cycles=2)
+
+def test_injected_regression_is_reported(result, monkeypatch):
+    cycle = TradingBot._execute_trading_cycle
+
+    def slower_cycle(self):
+        time.sleep(0.05)
+        pyupbit.get_current_price('KRW-C000')  # 사이클마다 불필요한 API 호출 1회 추가
+        return cycle(self)
+
+    monkeypatch.setattr(TradingBot, '_execute_trading_cycle', slower_cycle)
+    slower = run_suite(TradingStrategy.HEIKIN_ASHI, [3], cycles=2)
+
+    regressions = {r['metric'] for r in compare(result, slower) if r['regression']}
+    assert {'cycles.3.cycle.mean_ms', 'cycles.3.api_calls_per_cycle'} <= regressions
+
+def test_stub_restores_gateway():
+    gateway = get_gateway()
+    buckets = {group: vars(bucket).copy() for group, bucket in gateway.buckets.items()}
+    backend = request_api.requests.backend
+
+    with stub_upbit() as stub:
+        assert request_api.requests.backend is stub
+        assert all(b.rate == 1e9 for b in gateway.buckets.values())
+
+    assert request_api.requests.backend is backend
+    assert {group: vars(bucket) for group, bucket in gateway.buckets.items()} == buckets
+
+def test_compare_ignores_noisy_fields(result):
+    noisy = copy.deepcopy(result)
+    cycles = noisy['cycles']['3']
+    cycles['cold_cycle_ms'] *= 3
+    cycles['cold_api_calls'] *= 3
+    cycles['cycle']['max_ms'] *= 3
+    cycles['cycle']['total_ms'] *= 3
+    for stats in cycles['functions'].values():
+        stats['mean_ms'] *= 3
+
+    metrics = {r['metric'] for r in compare(result, noisy)}
+    assert metrics == {'cycles.3.cycle.mean_ms', 'cycles.3.cycle.p50_ms',
+                       'cycles.3.api_calls_per_cycle', 'cycles.3.memory_bytes',
+                       *(f"indicators.{k}" for k in result['indicators']),
+                       *(f"strategy.{k}" for k in result['strategy'])}
+    assert not [r for r in compare(result, noisy) if r['regression']]
+
+    cycles['cycle']['mean_ms'] *= 3
+    assert [r['metric'] for r in compare(result, noisy) if r['regression']] == ['cycles.3.cycle.mean_ms']
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.candle_store import (CLOSE, HIGH, VOLUME, CandleBuffer, CandleStore,
+                                   MappedCandleBuffer, now_kst)
+
+def bars(start, n, step=60):
+    timestamps = start + np.arange(n, dtype=np.int64) * step
+    values = np.column_stack([np.arange(n, dtype=float) + k for k in range(5)])
+    return timestamps, values
+
+class MinuteExchange:
+    """현재 시각까지의 1분봉을 돌려주는 캔들 조회 대역"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_ohlcv(self, ticker, interval, count):
+        self.requests.append(count)
+        last = now_kst() // 60 * 60
+        index = pd.to_datetime(last - np.arange(count)[::-1] * 60, unit='s')
+        close = (index.astype('int64') // 10**9 // 60 % 1000).astype(float)
+        return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                             'close': close, 'volume': 1.0}, index=index)
+
+def test_buffer_overwrites_forming_bar_and_wraps():
+    buffer = CandleBuffer(4)
+    ts, values = bars(0, 3)
+    buffer.upsert(ts, values)
+
+    forming = values[-1:] * 10
+    buffer.upsert(ts[-1:], forming)
+    assert buffer.size == 3
+    np.testing.assert_array_equal(buffer.latest(1)[1], forming)
+
+    more_ts, more_values = bars(180, 3)
+    buffer.upsert(more_ts, more_values)
+    timestamps, latest = buffer.latest(10)
+    assert buffer.size == 4
+    np.testing.assert_array_equal(timestamps, [120, 180, 240, 300])
+    np.testing.assert_array_equal(latest[1:], more_values)
+
+def test_store_fetches_only_new_bars_after_backfill():
+    exchange = MinuteExchange()
+    store = CandleStore(capacity=50, refresh_interval=0, exchange=exchange)
+
+    timestamps, values = store.get_candles('KRW-BTC', 'minute1', 30)
+    assert len(timestamps) == 30
+    assert np.all(np.diff(timestamps) == 60)
+
+    store.get_candles('KRW-BTC', 'minute1', 30)
+    assert exchange.requests[0] == 30
+    assert exchange.requests[1] <= 2  # 진행 중인 봉과 그 사이 확정된 봉만
+
+def test_apply_trade_updates_forming_bar():
+    store = CandleStore(capacity=10, refresh_interval=3600, exchange=MinuteExchange())
+    timestamps, _ = store.get_candles('KRW-BTC', 'minute1', 5)
+    last = int(timestamps[-1])
+
+    store.apply_trade('KRW-BTC', last + 30, 5000.0, 2.0)
+    row = store.get_candles('KRW-BTC', 'minute1', 5)[1][-1]
+    assert row[CLOSE] == 5000.0 and row[HIGH] == 5000.0 and row[VOLUME] == 3.0
+
+    store.apply_trade('KRW-BTC', last + 60, 10.0, 1.0)
+    timestamps, values = store.get_candles('KRW-BTC', 'minute1', 5)
+    assert timestamps[-1] == last + 60
+    np.testing.assert_array_equal(values[-1], [10.0, 10.0, 10.0, 10.0, 1.0])
+
+def test_mapped_buffer_round_trip(tmp_path):
+    buffer = MappedCandleBuffer(4, tmp_path / 'KRW-BTC_minute1')
+    ts, values = bars(0, 6)
+    buffer.upsert(ts[:3], values[:3])
+    buffer.upsert(ts[3:], values[3:])  # 링 버퍼 끝을 넘어 앞으로 감김
+    buffer.exhausted = True
+    del buffer
+
+    reopened = MappedCandleBuffer(4, tmp_path / 'KRW-BTC_minute1')
+    assert (reopened.size, reopened.head, reopened.exhausted) == (4, 2, True)
+    timestamps, latest = reopened.latest(4)
+    np.testing.assert_array_equal(timestamps, ts[-4:])
+    np.testing.assert_array_equal(latest, values[-4:])
+
+    resized = MappedCandleBuffer(8, tmp_path / 'KRW-BTC_minute1')  # 크기가 바뀌면 새로 만듦
+    assert resized.size == 0
+
+def test_restart_resumes_from_cached_buffers(tmp_path):
+    first = MinuteExchange()
+    store = CandleStore(capacity=50, exchange=first, cache_dir=str(tmp_path))
+    before = store.get_candles('KRW-BTC', 'minute1', 30)
+
+    restarted = MinuteExchange()
+    store = CandleStore(capacity=50, exchange=restarted, cache_dir=str(tmp_path))
+    after = store.get_candles('KRW-BTC', 'minute1', 30)
+
+    assert restarted.requests[0] <= 2  # 전체 재조회 없이 빠진 봉만
+    assert after[0][0] >= before[0][0]
+    assert len(after[0]) == 30
@@ -0,0 +1,71 @@
+import copy
+
+import yaml
+
+from src.config.trading_config import TradingConfig
+
+BASE = {
+    'trade_settings': {'max_daily_trades': 20, 'trade_interval': 120, 'min_krw_balance': 5000,
+                       'min_profit_krw': 0, 'min_loss_krw': 0},
+    'coins': {
+        'BTC': {'ticker': 'KRW-BTC', 'min_unit': 0.0001, 'take_profit': 1.5, 'profit_sell': 0.5,
+                'stop_loss': -2.0, 'partial_stop': -1.2, 'partial_sell': 0.4},
+        'ETH': {'ticker': 'KRW-ETH', 'min_unit': 0.001, 'take_profit': 2.0, 'profit_sell': 0.5,
+                'stop_loss': -2.5, 'partial_stop': -1.5, 'partial_sell': 0.4},
+    },
+    'default_coin': {'min_unit': 0, 'take_profit': 2.0, 'profit_sell': 0.5, 'stop_loss': -2.5,
+                     'partial_stop': -1.5, 'partial_sell': 0.4},
+}
+
+class FileConfig(TradingConfig):
+    """config.yaml 대신 임시 파일을 읽는 설정"""
+
+    def __init__(self, path):
+        self.path = path
+        super().__init__()
+
+    def _read_yaml(self):
+        self.config_path = self.path
+        self._config_mtime = self.path.stat().st_mtime
+        return yaml.safe_load(self.path.read_text(encoding='utf-8'))
+
+def write(path, config):
+    path.write_text(yaml.safe_dump(config), encoding='utf-8')
+
+def test_reload_keeps_held_coin_removed_from_yaml(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, BASE)
+    config = FileConfig(path)
+
+    changed = copy.deepcopy(BASE)
+    changed['coins'] = {'ETH': BASE['coins']['ETH']}
+    write(path, changed)
+    config.reload(held=['KRW-BTC'])
+
+    btc = config.coin_settings['BTC']
+    assert btc.ticker == 'KRW-BTC'
+    assert btc.stop_loss == -2.5 and btc.min_unit == 0.0001  # default_coin 규칙, 최소 수량은 유지
+
+def test_reload_drops_removed_coin_not_held(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, BASE)
+    config = FileConfig(path)
+
+    write(path, {**BASE, 'coins': {'ETH': BASE['coins']['ETH']}})
+    config.reload(held=[])
+
+    assert list(config.coin_settings) == ['ETH']
+
+def test_reload_rebuilds_default_coins(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, BASE)
+    config = FileConfig(path)
+    config.apply_universe({'KRW-XRP': 1000.0})
+    assert config.coin_settings['XRP'].stop_loss == -2.5
+
+    write(path, {**BASE, 'default_coin': {**BASE['default_coin'], 'stop_loss': -4.0}})
+    config.reload()
+
+    xrp = config.coin_settings['XRP']
+    assert xrp.stop_loss == -4.0
+    assert xrp.min_unit == 5000 / 1000.0
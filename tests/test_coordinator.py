@@ -0,0 +1,28 @@
+from src.trading.coordinator import TradeCoordinator
+
+def test_workers_trading_in_same_cycle_count_once():
+    coordinator = TradeCoordinator(max_daily_trades=2, min_krw_balance=0)
+    assert [coordinator.count_trade(100) for _ in range(4)] == [1, 1, 1, 1]  # 워커 4개
+    assert not coordinator.daily_limit_reached()
+    assert coordinator.count_trade(101) == 2
+    assert coordinator.daily_limit_reached()
+
+def test_reserve_respects_min_krw_balance():
+    coordinator = TradeCoordinator(max_daily_trades=10, min_krw_balance=50_000, krw=200_000)
+    assert coordinator.reserve(100_000)
+    assert not coordinator.reserve(100_000)
+    coordinator.release(100_000)
+    assert coordinator.krw() == 200_000
+
+def test_sync_keeps_orders_placed_during_balance_read():
+    coordinator = TradeCoordinator(max_daily_trades=10, min_krw_balance=0, krw=1_000_000)
+    marker = coordinator.sync_marker()
+    # 잔고 조회 중에 매수 접수, 매도 대금 반영
+    assert coordinator.reserve(100_000)
+    coordinator.commit(100_000)
+    coordinator.credit(30_000)
+    coordinator.sync_krw(1_000_000, marker)  # 조회 결과에는 아직 없음
+    assert coordinator.krw() == 930_000
+
+    coordinator.sync_krw(930_000, coordinator.sync_marker())
+    assert coordinator.krw() == 930_000
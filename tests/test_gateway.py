@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from src.api.gateway import Priority, RequestGateway, TokenBucket
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=10, capacity=2)
+    now = bucket.updated
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) == pytest.approx(0.1)
+    assert bucket.reserve(now + 0.1) == 0.0
+
+def test_token_bucket_follows_server_remaining():
+    bucket = TokenBucket(rate=10, capacity=5)
+    now = bucket.updated
+    bucket.observe(1, now)
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) > 0
+
+    bucket.observe(0, now + 1)  # 남은 요청이 없으면 다음 토큰까지 멈춤
+    assert bucket.reserve(now + 1) == pytest.approx(0.1)
+
+def test_calls_are_spaced_by_rate_limit():
+    gateway = RequestGateway({'default': 50})
+    started = time.monotonic()
+    for _ in range(6):
+        gateway.call('default', lambda: None)
+    assert time.monotonic() - started >= 0.09  # 첫 토큰 이후 5개는 0.02초 간격
+    assert gateway.stats['default']['calls'] == 6
+
+def test_throttled_call_is_retried_with_backoff():
+    gateway = RequestGateway({'default': 1000}, max_retries=4, backoff=0.01)
+    attempts = []
+
+    def request():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            gateway.observe(429, '')
+            raise RuntimeError("429 Too Many Requests")
+        return 'ok'
+
+    assert gateway.call('default', request) == 'ok'
+    assert len(attempts) == 3
+    assert gateway.stats['default']['throttled'] == 2
+    assert attempts[2] - attempts[1] >= 0.02 * 0.9  # 지수 백오프
+
+def test_throttling_gives_up_after_max_retries():
+    gateway = RequestGateway({'default': 1000}, max_retries=2, backoff=0.001)
+    attempts = []
+
+    def request():
+        attempts.append(1)
+        gateway.observe(429, '')
+        raise RuntimeError("429 Too Many Requests")
+
+    with pytest.raises(RuntimeError):
+        gateway.call('default', request)
+    assert len(attempts) == 3
+
+def test_errors_other_than_throttling_are_not_retried():
+    gateway = RequestGateway({'default': 1000})
+    calls = []
+
+    def request():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        gateway.call('default', request)
+    assert len(calls) == 1
+
+def test_higher_priority_waiter_goes_first():
+    gateway = RequestGateway({'order': 20})
+    gateway.acquire('order')  # 토큰 소진 - 이후 요청은 대기
+    order = []
+
+    def request(name, priority):
+        gateway.call('order', order.append, name, priority=priority)
+
+    low = threading.Thread(target=request, args=('low', Priority.LOW))
+    low.start()
+    time.sleep(0.01)
+    critical = threading.Thread(target=request, args=('critical', Priority.CRITICAL))
+    critical.start()
+    low.join()
+    critical.join()
+
+    assert order == ['critical', 'low']
@@ -0,0 +1,91 @@
+import time
+from types import SimpleNamespace
+
+from src.config.trading_config import CoinConfig, TradeSettings
+from src.data.state_store import StateStore
+from src.exchange.simulated import SimulatedExchange, SyntheticQuotes
+from src.trading.account import TradingAccount
+from src.trading.exits import ExitEngine
+from src.trading.guard import PositionGuard
+from src.trading.market import Market
+from src.trading.order import OrderManager
+
+TICKER = 'KRW-BTC'
+
+def make_bot(state=None, exit_cooldown=None):
+    """고정 시세 모의 거래소로 포지션 감시에 필요한 구성만 만든 봇"""
+    quotes = SyntheticQuotes(volatility=0.0)  # 가격을 직접 지정하면 움직이지 않음
+    quotes._prices[TICKER] = (100_000_000.0, time.time())
+    exchange = SimulatedExchange(quotes, initial_krw=4_000_000)
+    config = SimpleNamespace(
+        trade_settings=TradeSettings(max_daily_trades=10, trade_interval=60, min_krw_balance=0,
+                                     min_profit_krw=0, min_loss_krw=0, exit_cooldown=exit_cooldown),
+        coin_settings={'BTC': CoinConfig(ticker=TICKER, min_unit=0.00001, take_profit=1.5,
+                                         profit_sell=0.5, stop_loss=-2.0, partial_stop=-1.2,
+                                         partial_sell=0.4)},
+        reload_if_changed=lambda held=None: False,
+    )
+    account = TradingAccount(exchange)
+    account.ORDER_POLL_INTERVAL = 0.0  # 체결을 매 점검마다 장부에 반영
+    market = Market(exchange)
+    bot = SimpleNamespace(config=config, account=account, market=market,
+                          order_manager=OrderManager(config, account, market, state),
+                          exits=ExitEngine(config))
+    assert bot.order_manager.place_buy(TICKER, quotes.price(TICKER))
+    return bot, quotes, exchange
+
+def set_profit_rate(bot, quotes, rate):
+    avg_price = bot.account.get_average_buy_price(TICKER)
+    quotes._prices[TICKER] = (avg_price * (1 + rate / 100), time.time())
+
+def sells(exchange):
+    return [o for o in exchange.orders.values() if o['side'] == 'ask']
+
+def test_sustained_partial_stop_sells_once():
+    bot, quotes, exchange = make_bot()
+    guard = PositionGuard(bot)
+    set_profit_rate(bot, quotes, -1.5)
+
+    exits = [guard.check() for _ in range(5)]
+
+    assert exits == [1, 0, 0, 0, 0]
+    assert len(sells(exchange)) == 1
+
+def test_stop_loss_fires_during_partial_cooldown():
+    bot, quotes, exchange = make_bot()
+    guard = PositionGuard(bot)
+    set_profit_rate(bot, quotes, -1.5)
+    assert guard.check() == 1
+
+    set_profit_rate(bot, quotes, -2.5)
+    assert guard.check() == 1
+    assert 'BTC' not in exchange.balances  # 전량 매도
+
+def test_exit_cooldown_defaults_to_trade_interval():
+    bot, _, _ = make_bot()
+    assert bot.order_manager.exit_cooldown == 60
+    bot, _, _ = make_bot(exit_cooldown=300)
+    assert bot.order_manager.exit_cooldown == 300
+
+def test_partial_stop_fires_again_after_cooldown():
+    bot, quotes, exchange = make_bot()
+    guard = PositionGuard(bot)
+    set_profit_rate(bot, quotes, -1.5)
+    assert guard.check() == 1
+
+    action, fired_at, rate = bot.order_manager.last_exit[TICKER]
+    bot.order_manager.last_exit[TICKER] = (action, fired_at - 61, rate)
+    assert guard.check() == 1
+    assert len(sells(exchange)) == 2
+
+def test_exit_cooldown_survives_restart(tmp_path):
+    state = StateStore(str(tmp_path / 'state.db'))
+    bot, quotes, exchange = make_bot(state)
+    set_profit_rate(bot, quotes, -1.5)
+    assert PositionGuard(bot).check() == 1
+
+    restarted = OrderManager(bot.config, bot.account, bot.market, StateStore(str(tmp_path / 'state.db')))
+    assert restarted.last_exit == bot.order_manager.last_exit
+    bot.order_manager = restarted
+    assert PositionGuard(bot).check() == 0
+    assert len(sells(exchange)) == 1
@@ -0,0 +1,85 @@
+import numpy as np
+
+from src.indicators.heikin_ashi import HeikinAshiEngine, compute_heikin_ashi
+
+def ohlc(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=n)))
+    open_ = np.append(close[0], close[:-1])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.005, size=n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.005, size=n))
+    return open_, high, low, close
+
+def engine_state(engine, ticker):
+    i = engine.rows[ticker]
+    return np.array([engine.ha_open[i], engine.ha_high[i], engine.ha_low[i], engine.ha_close[i]])
+
+def test_update_matches_batch_computation():
+    o, h, l, c = ohlc(50)
+    engine = HeikinAshiEngine(recent_candles=3)
+    for t in range(50):
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t])
+
+    expected = np.array(compute_heikin_ashi(o, h, l, c))[:, -engine.depth:]
+    np.testing.assert_allclose(engine_state(engine, 'KRW-BTC'), expected)
+
+def test_forming_bar_is_updated_in_place():
+    o, h, l, c = ohlc(10)
+    engine = HeikinAshiEngine(recent_candles=3)
+    for t in range(10):
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t])
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t] * 0.9)  # 진행 중 가격
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t])         # 확정 가격
+    engine.update('KRW-BTC', 0, 1.0, 1.0, 1.0, 1.0)  # 지난 봉은 무시
+
+    expected = np.array(compute_heikin_ashi(o, h, l, c))[:, -engine.depth:]
+    np.testing.assert_allclose(engine_state(engine, 'KRW-BTC'), expected)
+
+def test_warmup_then_update_matches_batch():
+    o, h, l, c = ohlc(40)
+    engine = HeikinAshiEngine(recent_candles=3)
+    values = np.column_stack([o, h, l, c])
+    engine.warmup('KRW-BTC', np.arange(30) * 60, values[:30])
+    for t in range(30, 40):
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t])
+
+    expected = np.array(compute_heikin_ashi(o, h, l, c))[:, -engine.depth:]
+    np.testing.assert_allclose(engine_state(engine, 'KRW-BTC'), expected)
+
+def test_update_many_matches_update_and_grows_capacity():
+    tickers = [f"KRW-C{i:03d}" for i in range(5)]
+    series = [ohlc(20, seed=i) for i in range(5)]
+    single = HeikinAshiEngine(recent_candles=3, capacity=2)
+    batch = HeikinAshiEngine(recent_candles=3, capacity=2)
+    rows = np.array([batch.row(t) for t in tickers])
+
+    for t in range(20):
+        for ticker, (o, h, l, c) in zip(tickers, series):
+            single.update(ticker, t * 60, o[t], h[t], l[t], c[t])
+        o, h, l, c = (np.array([s[k][t] for s in series]) for k in range(4))
+        batch.update_many(rows, np.full(5, t * 60), o, h, l, c)
+
+    for ticker, (o, h, l, c) in zip(tickers, series):
+        expected = np.array(compute_heikin_ashi(o, h, l, c))[:, -3:]
+        np.testing.assert_allclose(engine_state(single, ticker), expected)
+        np.testing.assert_allclose(engine_state(batch, ticker), expected)
+    np.testing.assert_array_equal(single.buy_signals(), batch.buy_signals())
+
+def test_snapshot_trend_flags_match_batch():
+    o, h, l, c = ohlc(30, seed=3)
+    engine = HeikinAshiEngine(recent_candles=3)
+    ha_open, _, _, ha_close = compute_heikin_ashi(o, h, l, c)
+    up = ha_close > ha_open
+    down = ha_close < ha_open
+    for t in range(30):
+        engine.update('KRW-BTC', t * 60, o[t], h[t], l[t], c[t])
+        snapshot = engine.snapshot('KRW-BTC')
+
+        assert snapshot['trend'] == ('up' if up[t] else 'down')
+        if t >= 1:
+            assert snapshot['prev_trend'] == ('up' if up[t - 1] else 'down')
+        if t >= 2:
+            window = slice(t - 2, t + 1)
+            assert snapshot['strong_trend'] == bool(up[window].all() or down[window].all())
+        else:
+            assert not snapshot['strong_trend']  # 봉이 모자라면 강세 판단 안 함
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.history import HistoryDownloader, HistoryStore
+
+BARS = 1000
+
+class PagedExchange:
+    """상장 후 BARS개의 1분봉이 있는 캔들 페이지 조회 대역"""
+
+    def __init__(self, fail_after=None):
+        end = HistoryDownloader._closed_until('minute1')
+        self.timestamps = end - np.arange(BARS, 0, -1, dtype=np.int64) * 60
+        self.requests = 0
+        self.fail_after = fail_after
+
+    def get_ohlcv_page(self, ticker, interval, to, count=200):
+        if self.fail_after is not None and self.requests >= self.fail_after:
+            raise ConnectionError("연결 끊김")
+        self.requests += 1
+        ts = self.timestamps[self.timestamps < to][-count:]
+        close = (ts // 60 % 10000).astype(float)
+        return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                             'close': close, 'volume': 1.0}, index=pd.to_datetime(ts, unit='s'))
+
+def assert_complete(store, exchange):
+    timestamps, values = store.load('KRW-BTC', 'minute1')
+    np.testing.assert_array_equal(timestamps, exchange.timestamps)
+    np.testing.assert_array_equal(values[:, 3], exchange.timestamps // 60 % 10000)
+    assert store.meta('KRW-BTC', 'minute1')['complete']
+
+def downloader(exchange, root):
+    loader = HistoryDownloader(exchange, HistoryStore(str(root)), workers=1)
+    loader.MAX_RETRIES = 0
+    return loader
+
+def test_download_collects_full_history(tmp_path):
+    exchange = PagedExchange()
+    result = downloader(exchange, tmp_path).download(['KRW-BTC'], ['minute1'], since=0)
+
+    assert result == {('KRW-BTC', 'minute1'): BARS}
+    assert_complete(HistoryStore(str(tmp_path)), exchange)
+    assert exchange.requests == BARS // 200 + 1
+
+    again = PagedExchange()
+    assert downloader(again, tmp_path).sync('KRW-BTC', 'minute1', 0) == 0
+    assert again.requests == 0  # 이미 완료된 저장소는 조회하지 않음
+
+def test_interrupted_download_resumes(tmp_path):
+    failing = PagedExchange(fail_after=2)
+    with pytest.raises(ConnectionError):
+        downloader(failing, tmp_path).sync('KRW-BTC', 'minute1', 0)
+    assert HistoryStore(str(tmp_path)).meta('KRW-BTC', 'minute1')['rows'] == 400
+
+    exchange = PagedExchange()
+    assert downloader(exchange, tmp_path).sync('KRW-BTC', 'minute1', 0) == BARS - 400
+    assert exchange.requests == 4  # 남은 600봉 + 빈 페이지
+    assert_complete(HistoryStore(str(tmp_path)), exchange)
+
+def test_staged_pages_are_merged_on_next_run(tmp_path):
+    exchange = PagedExchange()
+    store = HistoryStore(str(tmp_path))
+    newest = exchange.get_ohlcv_page('KRW-BTC', 'minute1', exchange.timestamps[-1] + 60)
+    timestamps = newest.index.values.astype('datetime64[s]').astype(np.int64)
+    store.stage('KRW-BTC', 'minute1', timestamps, newest.to_numpy())  # 병합 전에 프로세스 종료
+
+    assert downloader(exchange, tmp_path).sync('KRW-BTC', 'minute1', 0) == BARS
+    assert not (tmp_path / 'minute1' / 'KRW-BTC' / 'staging' / HistoryStore.META).exists()
+    assert_complete(store, exchange)
+
+def test_recent_bars_are_appended_after_last_stored(tmp_path):
+    exchange = PagedExchange()
+    store = HistoryStore(str(tmp_path))
+    old = exchange.get_ohlcv_page('KRW-BTC', 'minute1', exchange.timestamps[-300])
+    timestamps = old.index.values.astype('datetime64[s]').astype(np.int64)
+    store.append('KRW-BTC', 'minute1', timestamps, old.to_numpy())
+
+    loader = downloader(exchange, tmp_path)
+    assert loader.sync('KRW-BTC', 'minute1', since=int(timestamps[0])) == 300
+    loaded, _ = store.load('KRW-BTC', 'minute1')
+    np.testing.assert_array_equal(loaded, exchange.timestamps[-500:])
+
+def test_append_discards_bytes_past_meta_rows(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    ts = np.arange(3, dtype=np.int64) * 60
+    values = np.ones((3, 5))
+    store.append('KRW-BTC', 'minute1', ts, values)
+    with open(tmp_path / 'minute1' / 'KRW-BTC' / HistoryStore.TIMESTAMPS, 'ab') as f:
+        f.write(b'\xff' * 12)  # meta 기록 전에 중단된 쓰기
+
+    assert store.append('KRW-BTC', 'minute1', ts + 120, values) == 2  # 겹치는 봉은 제외
+    loaded, loaded_values = store.load('KRW-BTC', 'minute1')
+    np.testing.assert_array_equal(loaded, np.arange(5) * 60)
+    assert loaded_values.shape == (5, 5)
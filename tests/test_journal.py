@@ -0,0 +1,77 @@
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from src.utils.journal import EventJournal, load_arrays, read_events
+
+def today():
+    return date.today()
+
+def test_record_is_ignored_until_started():
+    journal = EventJournal()
+    journal.record('order', ticker='KRW-BTC')
+    assert not journal.enabled
+    assert journal.flush() == 0
+
+def test_events_written_and_read_back(tmp_path):
+    journal = EventJournal()
+    journal.start(str(tmp_path), 'paper', flush_interval=3600)
+    journal.record('signal', ticker='KRW-BTC', buy=True)
+    journal.record('cycle', mode='sync', seconds=np.float64(0.25), tickers=np.int64(3))
+    journal.record('cycle', mode='sync', seconds=0.5, tickers=3)
+    journal.stop()  # 남은 이벤트 기록
+
+    events = read_events(str(tmp_path), today())
+    assert [e['kind'] for e in events] == ['signal', 'cycle', 'cycle']
+    assert events[0]['ticker'] == 'KRW-BTC' and events[0]['source'] == 'paper'
+
+    arrays = load_arrays(str(tmp_path), today(), 'cycle', ['seconds', 'mode'])
+    np.testing.assert_array_equal(arrays['seconds'], [0.25, 0.5])
+    assert list(arrays['mode']) == ['sync', 'sync']
+
+def test_background_thread_flushes(tmp_path):
+    journal = EventJournal()
+    journal.start(str(tmp_path), 'live', flush_interval=0.02)
+    try:
+        journal.record('order', ticker='KRW-ETH')
+        deadline = time.monotonic() + 5
+        while not read_events(str(tmp_path), today()) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert [e['kind'] for e in read_events(str(tmp_path), today())] == ['order']
+    finally:
+        journal.stop()
+
+def test_full_queue_drops_events(tmp_path):
+    journal = EventJournal()
+    journal.start(str(tmp_path), 'live', flush_interval=3600, max_queue=2)
+    for i in range(5):
+        journal.record('fill', n=i)
+    journal.stop()
+    assert [e['n'] for e in read_events(str(tmp_path), today())] == [0, 1]
+
+def test_events_split_by_day_and_old_days_removed(tmp_path):
+    old = tmp_path / '20000101'
+    old.mkdir()
+    journal = EventJournal()
+    journal.start(str(tmp_path), 'live', flush_interval=3600, keep_days=7)
+    now = time.time()
+    yesterday = (datetime.now() - timedelta(days=1)).date()
+    journal._queue.append((now - 86400, 'cycle', {'n': 1}))
+    journal._queue.append((now, 'cycle', {'n': 2}))
+    journal.stop()
+
+    assert [e['n'] for e in read_events(str(tmp_path), yesterday)] == [1]
+    assert [e['n'] for e in read_events(str(tmp_path), today())] == [2]
+    assert not old.exists()
+
+def test_read_events_merges_sources_and_skips_truncated_lines(tmp_path):
+    directory = tmp_path / today().strftime('%Y%m%d')
+    directory.mkdir()
+    (directory / 'paper_w0.jsonl').write_text('{"ts":2,"kind":"order"}\n{"ts":3,"ki')
+    (directory / 'paper_w1.jsonl').write_text('{"ts":1,"kind":"order"}\n')
+    (directory / 'live.jsonl').write_text('{"ts":0,"kind":"order"}\n')
+
+    events = read_events(str(tmp_path), today(), source='paper')
+    assert [(e['ts'], e['source']) for e in events] == [(1, 'paper_w1'), (2, 'paper_w0')]
+    assert len(read_events(str(tmp_path), today(), kinds=['order'])) == 3
@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from src.trading.ledger import OrderLedger
+
+def make_ledger(krw=1_000_000.0, btc=0.0, avg_price=0.0):
+    ledger = OrderLedger(fee_rate=0.0005)
+    balances = [{'currency': 'KRW', 'balance': str(krw), 'locked': '0', 'avg_buy_price': '0'}]
+    if btc:
+        balances.append({'currency': 'BTC', 'balance': str(btc), 'locked': '0',
+                         'avg_buy_price': str(avg_price)})
+    assert ledger.reconcile(balances, ledger.generation)
+    return ledger
+
+def order(uuid, state, volume=0.0, funds=None, fee=0.0, **extra):
+    result = {'uuid': uuid, 'state': state, 'executed_volume': str(volume),
+              'paid_fee': str(fee), **extra}
+    if funds is not None:
+        result['executed_funds'] = str(funds)
+    return result
+
+def test_buy_partial_fills_then_done():
+    ledger = make_ledger()
+    ledger.record(order('b1', 'wait'), 'bid', 'KRW-BTC', 100_000)
+    assert ledger.krw == pytest.approx(1_000_000 - 100_050)
+    assert ledger.krw_locked == pytest.approx(100_050)
+
+    ledger.update([order('b1', 'wait', 0.4, 40_000, 20)])
+    assert ledger.positions['BTC'].volume == pytest.approx(0.4)
+    assert ledger.positions['BTC'].avg_price == pytest.approx(100_000)
+    assert ledger.open_uuids() == ['b1']
+
+    ledger.update([order('b1', 'done', 0.9, 100_000, 50)])
+    position = ledger.positions['BTC']
+    assert position.volume == pytest.approx(0.9)
+    assert position.avg_price == pytest.approx(100_000 / 0.9)
+    assert ledger.krw == pytest.approx(1_000_000 - 100_050)
+    assert ledger.krw_locked == pytest.approx(0)
+    assert ledger.open_uuids() == []
+
+def test_market_buy_cancel_refunds_unspent_krw():
+    ledger = make_ledger()
+    ledger.record(order('b1', 'wait'), 'bid', 'KRW-BTC', 100_000)
+
+    # 시장가 매수는 남은 금액이 취소(cancel) 상태로 끝나며 환불됨
+    ledger.update([order('b1', 'cancel', 0.9, 90_000, 45)])
+
+    assert ledger.krw == pytest.approx(1_000_000 - 90_045)
+    assert ledger.krw_locked == pytest.approx(0)
+    assert ledger.positions['BTC'].volume == pytest.approx(0.9)
+    assert ledger.positions['BTC'].avg_price == pytest.approx(100_000)
+
+def test_sell_without_executed_funds_uses_avg_price():
+    ledger = make_ledger(btc=1.0, avg_price=100_000)
+    ledger.record(order('s1', 'wait'), 'ask', 'KRW-BTC', 0.4)
+    assert ledger.positions['BTC'].pending_sell == pytest.approx(0.4)
+    assert float(ledger.snapshot()['BTC']['balance']) == pytest.approx(0.6)
+
+    ledger.update([order('s1', 'done', 0.4, fee=22, avg_price='110000')])
+
+    position = ledger.positions['BTC']
+    assert position.volume == pytest.approx(0.6)
+    assert position.pending_sell == pytest.approx(0)
+    assert position.avg_price == pytest.approx(100_000)
+    assert position.realized_pnl == pytest.approx(44_000 - 22 - 40_000)
+    assert ledger.krw == pytest.approx(1_000_000 + 44_000 - 22)
+
+def test_sell_partial_fill_then_cancel_releases_pending():
+    ledger = make_ledger(btc=1.0, avg_price=100_000)
+    ledger.record(order('s1', 'wait'), 'ask', 'KRW-BTC', 0.4)
+
+    ledger.update([order('s1', 'wait', 0.1, 10_000, 5)])
+    assert ledger.positions['BTC'].pending_sell == pytest.approx(0.3)
+    ledger.update([order('s1', 'cancel', 0.1, 10_000, 5)])
+
+    position = ledger.positions['BTC']
+    assert position.volume == pytest.approx(0.9)
+    assert position.pending_sell == pytest.approx(0)
+    assert ledger.krw == pytest.approx(1_000_000 + 10_000 - 5)
+
+def test_reconcile_skips_currencies_with_open_orders():
+    ledger = make_ledger(btc=1.0, avg_price=100_000)
+    ledger.record(order('s1', 'wait'), 'ask', 'KRW-BTC', 0.4)
+
+    balances = [{'currency': 'KRW', 'balance': '5', 'locked': '0', 'avg_buy_price': '0'},
+                {'currency': 'BTC', 'balance': '0.6', 'locked': '0.4', 'avg_buy_price': '1'},
+                {'currency': 'ETH', 'balance': '2', 'locked': '0', 'avg_buy_price': '3000'}]
+    assert ledger.reconcile(balances, ledger.generation)
+
+    assert ledger.positions['BTC'].avg_price == pytest.approx(100_000)  # 체결 대기 중 - 그대로
+    assert ledger.positions['BTC'].pending_sell == pytest.approx(0.4)
+    assert ledger.positions['ETH'].volume == pytest.approx(2)
+    assert ledger.krw == pytest.approx(1_000_000)  # 미체결 주문이 있으면 원화도 그대로
+
+def test_reconcile_rejects_stale_balances():
+    ledger = make_ledger()
+    generation = ledger.generation
+    ledger.record(order('b1', 'wait'), 'bid', 'KRW-BTC', 100_000)  # 잔고 조회 중 주문
+    assert not ledger.reconcile([{'currency': 'KRW', 'balance': '0'}], generation)
+    assert ledger.krw == pytest.approx(1_000_000 - 100_050)
+
+def test_missing_orders_are_dropped_after_timeout():
+    ledger = make_ledger(btc=1.0, avg_price=100_000)
+    ledger.record(order('b1', 'wait'), 'bid', 'KRW-BTC', 100_000)
+    ledger.record(order('s1', 'wait'), 'ask', 'KRW-BTC', 0.4)
+
+    assert ledger.update([]) == []  # 처음 빠진 시각만 기록
+    for record in ledger.orders.values():
+        record.missing_since = time.time() - ledger.missing_timeout - 1
+
+    assert sorted(ledger.update([])) == ['b1', 's1']
+    assert ledger.krw == pytest.approx(1_000_000)
+    assert ledger.krw_locked == pytest.approx(0)
+    assert ledger.positions['BTC'].pending_sell == pytest.approx(0)
+    assert ledger.positions['BTC'].volume == pytest.approx(1.0)
+
+def test_order_seen_again_is_not_dropped():
+    ledger = make_ledger()
+    ledger.record(order('b1', 'wait'), 'bid', 'KRW-BTC', 100_000)
+    ledger.update([])
+    ledger.orders['b1'].missing_since = time.time() - ledger.missing_timeout - 1
+
+    assert ledger.update([order('b1', 'wait')]) == []
+    assert ledger.orders['b1'].missing_since is None
@@ -0,0 +1,47 @@
+from src.trading.market import Market
+
+class CountingExchange:
+    """요청 단위를 기록하는 시세 조회 대역"""
+
+    def __init__(self):
+        self.price_requests = []
+        self.orderbook_requests = []
+
+    def get_current_prices(self, tickers):
+        self.price_requests.append(list(tickers))
+        return {t: 1000.0 + i for i, t in enumerate(tickers)}
+
+    def get_orderbooks(self, tickers):
+        self.orderbook_requests.append(list(tickers))
+        return [{'market': t, 'orderbook_units': [{'ask_price': 1001.0, 'bid_price': 999.0}]}
+                for t in tickers]
+
+TICKERS = [f"KRW-C{i:03d}" for i in range(250)]
+
+def test_refresh_fetches_prices_in_chunks():
+    exchange = CountingExchange()
+    prices = Market(exchange).refresh(TICKERS)
+
+    assert len(prices) == 250
+    assert [len(r) for r in exchange.price_requests] == [100, 100, 50]
+
+def test_orderbooks_fetched_once_per_cycle():
+    exchange = CountingExchange()
+    market = Market(exchange)
+    market.refresh(TICKERS)
+
+    for ticker in TICKERS:
+        assert market.get_current_price(ticker) == 1001.0
+    assert [len(r) for r in exchange.orderbook_requests] == [100, 100, 50]
+
+    market.refresh(TICKERS[:3])  # 새 사이클은 호가 캐시를 비움
+    market.get_orderbook(TICKERS[0])
+    assert exchange.orderbook_requests[-1] == TICKERS[:3]
+
+def test_orderbook_outside_cycle_fetches_single_ticker():
+    exchange = CountingExchange()
+    market = Market(exchange)
+    market.refresh(TICKERS[:3])
+
+    market.get_orderbook('KRW-XRP')
+    assert exchange.orderbook_requests == [['KRW-XRP']]
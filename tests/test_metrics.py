@@ -0,0 +1,89 @@
+import json
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.api.gateway import RequestGateway
+from src.utils.metrics import MetricsExporter, MetricsRegistry, get_metrics
+
+def test_counter_and_gauge_by_labels():
+    registry = MetricsRegistry()
+    orders = registry.counter('orders_total', "주문 수")
+    orders.inc(side='bid')
+    orders.inc(2, side='bid')
+    orders.inc(side='ask')
+    registry.gauge('krw', "원화").set(1000)
+    registry.gauge('krw', "원화").set(500)
+
+    assert registry.counter('orders_total', "주문 수") is orders  # 같은 이름은 같은 지표
+    assert registry.snapshot()['orders_total'] == {'{side="bid"}': 3.0, '{side="ask"}': 1.0}
+    assert registry.snapshot()['krw'] == {'_': 500}
+
+def test_histogram_snapshot_and_prometheus_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram('cycle_seconds', "사이클 시간", buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 2.0):
+        latency.observe(value, mode='sync')
+
+    stats = registry.snapshot()['cycle_seconds']['{mode="sync"}']
+    assert stats['count'] == 4
+    assert stats['mean'] == pytest.approx(0.65)
+    assert stats['p50'] == 0.1
+    assert stats['p99'] is None  # 마지막 구간 초과
+
+    text = registry.render()
+    assert '# TYPE cycle_seconds histogram' in text
+    assert 'cycle_seconds_bucket{mode="sync",le="0.1"} 2' in text
+    assert 'cycle_seconds_bucket{mode="sync",le="1.0"} 3' in text
+    assert 'cycle_seconds_bucket{mode="sync",le="+Inf"} 4' in text
+    assert 'cycle_seconds_count{mode="sync"} 4' in text
+
+def test_histogram_time_records_on_error():
+    registry = MetricsRegistry()
+    latency = registry.histogram('call_seconds', "호출 시간")
+    with pytest.raises(RuntimeError):
+        with latency.time(group='order'):
+            raise RuntimeError("실패")
+    assert registry.snapshot()['call_seconds']['{group="order"}']['count'] == 1
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def test_exporter_serves_metrics_endpoint():
+    registry = MetricsRegistry()
+    registry.counter('trades_total', "거래 수").inc(3)
+    exporter = MetricsExporter(registry, port=free_port())
+    exporter.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as resp:
+            body = resp.read().decode('utf-8')
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/other", timeout=5)
+    finally:
+        exporter.stop()
+    assert 'trades_total 3' in body
+
+def test_exporter_writes_snapshot_on_stop(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter('trades_total', "거래 수").inc()
+    path = tmp_path / 'metrics.json'
+    exporter = MetricsExporter(registry, snapshot_path=str(path), snapshot_interval=3600)
+    exporter.start()
+    assert not path.exists()
+
+    exporter.stop()
+    assert json.loads(path.read_text())['metrics'] == {'trades_total': {'_': 1.0}}
+
+def test_gateway_calls_are_instrumented():
+    gateway = RequestGateway({'test': 1000})
+
+    def count():
+        return get_metrics().snapshot()['upbit_call_seconds'].get('{group="test"}', {}).get('count', 0)
+
+    before = count()
+    gateway.call('test', lambda: None)
+    assert count() == before + 1
@@ -0,0 +1,17 @@
+import pytest
+
+from src.backtest.optimizer import COIN_PARAMS, ParameterSweep, check_params
+from src.strategies.base import TradingStrategy
+
+def test_check_params_accepts_strategy_and_coin_params():
+    check_params(['k', 'atr_period', *COIN_PARAMS], TradingStrategy.VOLATILITY)
+    check_params(['k', 'recent_candles'], TradingStrategy.COMBINED)
+
+def test_check_params_rejects_params_of_other_strategy():
+    with pytest.raises(ValueError, match='k'):
+        check_params(['k', 'take_profit'], TradingStrategy.HEIKIN_ASHI)
+
+def test_sweep_rejects_unknown_param_before_starting_pool():
+    sweep = ParameterSweep(None, {}, TradingStrategy.VOLATILITY, processes=1)
+    with pytest.raises(ValueError, match='recent_candle'):
+        sweep.run({}, [{'recent_candle': 3}])
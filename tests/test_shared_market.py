@@ -0,0 +1,60 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from src.data import shared_market
+from src.data.shared_market import SharedCandleBuffer, SharedMarketData
+
+TICKERS = ['KRW-BTC', 'KRW-ETH']
+
+@pytest.fixture
+def shared():
+    data = SharedMarketData(f"test_{os.getpid()}", TICKERS, [('minute60', 4)], create=True)
+    yield data
+    data.close()
+    data.unlink()
+
+def candles(start, n):
+    ts = np.arange(start, start + n, dtype=np.int64) * 3600
+    return ts, np.arange(n * 5, dtype=np.float64).reshape(n, 5)
+
+def test_prices_round_trip(shared):
+    shared.prices.write({'KRW-BTC': 100.0, 'KRW-XRP': 1.0})
+    prices, updated = shared.prices.read()
+    assert prices[0] == 100.0 and np.isnan(prices[1])
+    assert updated > 0
+
+def test_failed_upsert_leaves_buffer_readable(shared):
+    buffer = shared.buffer('KRW-BTC', 'minute60')
+    buffer.upsert(*candles(0, 2))
+    with pytest.raises(IndexError):
+        buffer.upsert(np.arange(3, dtype=np.int64) + 10, np.zeros((2, 5)))  # 길이 불일치
+    assert buffer._header[0] % 2 == 0
+    ts, _ = buffer.read(2)
+    assert list(ts) == [0, 3600]
+
+def test_interrupted_writer_does_not_hang_readers(shared, monkeypatch):
+    monkeypatch.setattr(shared_market, 'READ_TIMEOUT', 0.05)
+    buffer = shared.buffer('KRW-BTC', 'minute60')
+    buffer.upsert(*candles(0, 2))
+    buffer._header[0] += 1  # 기록 중 종료된 feed
+    shared.prices._seq[0] += 1
+
+    started = time.monotonic()
+    assert buffer.read(2) is None
+    _, updated = shared.prices.read()
+    assert updated == 0.0
+    assert time.monotonic() - started < 1.0
+
+    feed = SharedMarketData(shared.prefix, TICKERS, [('minute60', 4)], writer=True)
+    try:
+        recovered = feed.buffer('KRW-BTC', 'minute60')
+        assert recovered._header[0] % 2 == 0 and recovered.size == 0
+        assert shared.prices._seq[0] % 2 == 0
+        recovered.upsert(*candles(5, 3))
+        ts, _ = buffer.read(4)
+        assert list(ts) == [5 * 3600, 6 * 3600, 7 * 3600]
+    finally:
+        feed.close()
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from src.benchmark.suite import stub_upbit
+from src.exchange.simulated import SimulatedExchange, SimulatedExchangeError, SyntheticQuotes
+from src.exchange.upbit import UpbitExchange
+
+UNITS = [{'ask_price': 101.0, 'ask_size': 10.0, 'bid_price': 99.0, 'bid_size': 10.0},
+         {'ask_price': 102.0, 'ask_size': 10.0, 'bid_price': 98.0, 'bid_size': 10.0}]
+
+def make_exchange(**kwargs):
+    quotes = SyntheticQuotes(volatility=0.0)
+    quotes._prices['KRW-BTC'] = (100.0, time.time())
+    return SimulatedExchange(quotes, initial_krw=100_000, **kwargs), quotes
+
+def test_fill_walks_orderbook_levels():
+    volume, left = SimulatedExchange._fill(UNITS, 'ask', krw=1010 + 510)
+    assert volume == pytest.approx(10 + 5) and left == 0
+
+    proceeds, left = SimulatedExchange._fill(UNITS, 'bid', volume=12)
+    assert proceeds == pytest.approx(10 * 99 + 2 * 98) and left == 0
+
+    proceeds, left = SimulatedExchange._fill(UNITS, 'bid', volume=25)  # 호가 부족분은 마지막 가격
+    assert proceeds == pytest.approx(990 + 980 + 5 * 98) and left == 5
+
+def test_buy_then_sell_updates_balances_and_fees():
+    exchange, _ = make_exchange(fee_rate=0.001)
+    bought = exchange.buy_market_order('KRW-BTC', 10_000)
+    volume = float(bought['executed_volume'])
+
+    assert bought['state'] == 'done' and bought['side'] == 'bid'
+    assert exchange.balances['KRW']['balance'] == pytest.approx(100_000 - 10_010)
+    assert exchange.balances['BTC']['balance'] == pytest.approx(volume)
+    assert exchange.balances['BTC']['avg_buy_price'] == pytest.approx(10_000 / volume)
+
+    sold = exchange.sell_market_order('KRW-BTC', volume)
+    proceeds = float(sold['executed_funds'])
+    assert 'BTC' not in exchange.balances  # 전량 매도하면 잔고 항목 제거
+    assert exchange.balances['KRW']['balance'] == pytest.approx(100_000 - 10_010 + proceeds * 0.999)
+    assert exchange.total_fee == pytest.approx(10 + proceeds * 0.001)
+    assert exchange.get_orders([bought['uuid'], sold['uuid']]) == [bought, sold]
+
+def test_rejected_orders_return_none():
+    exchange, _ = make_exchange()
+    assert exchange.buy_market_order('KRW-BTC', 1000) is None      # 최소 주문 금액 미만
+    assert exchange.buy_market_order('KRW-BTC', 200_000) is None   # 잔고 부족
+    assert exchange.sell_market_order('KRW-BTC', 1.0) is None      # 보유 수량 없음
+    assert exchange.balances['KRW']['balance'] == 100_000
+    assert exchange.orders == {}
+
+def test_injected_errors_follow_pyupbit_failure_modes():
+    exchange, _ = make_exchange(error_rate=1.0)
+    assert exchange.buy_market_order('KRW-BTC', 10_000) is None
+    assert exchange.get_ohlcv('KRW-BTC', 'minute1', 10) is None
+    with pytest.raises(SimulatedExchangeError):
+        exchange.get_current_prices(['KRW-BTC'])
+    assert exchange.request_count == 3
+
+def test_pyupbit_calls_served_by_stub():
+    with stub_upbit() as stub:
+        stub.exchange.quotes._prices['KRW-BTC'] = (100.0, time.time())
+        stub.exchange.quotes.volatility = 0.0
+        upbit = UpbitExchange()
+
+        assert upbit.get_current_prices(['KRW-BTC']) == {'KRW-BTC': pytest.approx(100.0)}
+        assert sum(stub.reset().values()) == 1
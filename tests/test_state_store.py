@@ -0,0 +1,74 @@
+from datetime import date
+
+import pytest
+
+from src.data.state_store import StateStore
+from src.trading.ledger import OrderLedger
+
+def make_ledger():
+    ledger = OrderLedger()
+    ledger.reconcile([{'currency': 'KRW', 'balance': '1000000', 'locked': '0', 'avg_buy_price': '0'},
+                      {'currency': 'BTC', 'balance': '0.5', 'locked': '0', 'avg_buy_price': '90000000'}],
+                     ledger.generation)
+    ledger.record({'uuid': 'b1', 'state': 'wait', 'executed_volume': '0.001',
+                   'executed_funds': '100000', 'paid_fee': '50'}, 'bid', 'KRW-ETH', 200_000)
+    ledger.record({'uuid': 's1', 'state': 'wait', 'executed_volume': '0'}, 'ask', 'KRW-BTC', 0.2)
+    return ledger
+
+def test_ledger_round_trip(tmp_path):
+    ledger = make_ledger()
+    StateStore(str(tmp_path / 'state.db')).save_ledger(ledger)
+
+    restored = OrderLedger()
+    assert StateStore(str(tmp_path / 'state.db')).load_ledger(restored)
+    assert restored.export() == ledger.export()
+    assert restored.snapshot() == ledger.snapshot()
+    assert sorted(restored.open_uuids()) == ['b1', 's1']
+
+def test_restored_orders_keep_filling(tmp_path):
+    ledger = make_ledger()
+    StateStore(str(tmp_path / 'state.db')).save_ledger(ledger)
+    restored = OrderLedger()
+    StateStore(str(tmp_path / 'state.db')).load_ledger(restored)
+
+    for book in (ledger, restored):
+        book.update([{'uuid': 'b1', 'state': 'done', 'executed_volume': '0.002',
+                      'executed_funds': '200000', 'paid_fee': '100'},
+                     {'uuid': 's1', 'state': 'done', 'executed_volume': '0.2',
+                      'executed_funds': '19000000', 'paid_fee': '9500'}])
+    assert restored.export() == ledger.export()
+    assert restored.krw == pytest.approx(1_000_000 - 200_100 + 19_000_000 - 9_500)
+
+def test_empty_store_has_no_ledger(tmp_path):
+    store = StateStore(str(tmp_path / 'state.db'))
+    assert not store.load_ledger(OrderLedger())
+    assert store.load_daily() is None
+    assert store.load_cooldowns() == {}
+
+def test_later_save_replaces_earlier_ledger(tmp_path):
+    store = StateStore(str(tmp_path / 'state.db'))
+    store.save_ledger(make_ledger())
+    empty = OrderLedger()
+    empty.reconcile([{'currency': 'KRW', 'balance': '5', 'locked': '0', 'avg_buy_price': '0'}],
+                    empty.generation)
+    store.save_ledger(empty)
+
+    restored = OrderLedger()
+    StateStore(str(tmp_path / 'state.db')).load_ledger(restored)
+    assert restored.positions == {} and restored.orders == {}
+    assert restored.krw == 5
+
+def test_cooldowns_daily_and_exits_survive_reopen(tmp_path):
+    store = StateStore(str(tmp_path / 'state.db'))
+    store.save_cooldown('KRW-BTC', 100.0)
+    store.save_cooldown('KRW-BTC', 200.0)
+    store.save_daily(date(2026, 1, 2), 3)
+    store.save_exit('KRW-ETH', 'partial_stop', 300.0, -1.5)
+    store.save_exit('KRW-XRP', 'take_profit', 400.0, 2.0)
+    store.delete_exit('KRW-XRP')
+    store.close()
+
+    reopened = StateStore(str(tmp_path / 'state.db'))
+    assert reopened.load_cooldowns() == {'KRW-BTC': 200.0}
+    assert reopened.load_daily() == (date(2026, 1, 2), 3)
+    assert reopened.load_exits() == {'KRW-ETH': ('partial_stop', 300.0, -1.5)}
@@ -0,0 +1,68 @@
+import asyncio
+
+import numpy as np
+
+from src.data.candle_store import KST_OFFSET, CandleStore
+from src.data.fake_ws_server import FakeUpbitServer, synthetic_messages
+from src.data.stream import MarketStream
+from src.trading.market import Market
+
+def trade(code, price, timestamp_ms, volume=1.0):
+    return {'type': 'trade', 'code': code, 'trade_price': price, 'trade_volume': volume,
+            'trade_timestamp': timestamp_ms}
+
+def test_only_changed_prices_are_reported():
+    stream = MarketStream(['KRW-BTC', 'KRW-ETH'])
+    stream.handle({'type': 'ticker', 'code': 'KRW-BTC', 'trade_price': 100.0})
+    stream.handle(trade('KRW-ETH', 10.0, 0))
+    assert stream.pop_changed() == {'KRW-BTC', 'KRW-ETH'}
+
+    stream.handle({'type': 'ticker', 'code': 'KRW-BTC', 'trade_price': 100.0})  # 같은 가격
+    stream.handle(trade('KRW-ETH', 11.0, 0))
+    assert stream.pop_changed() == {'KRW-ETH'}
+    assert stream.prices == {'KRW-BTC': 100.0, 'KRW-ETH': 11.0}
+    assert stream.message_count == 4
+
+def test_trades_and_orderbooks_update_store_and_market():
+    store = CandleStore(capacity=10, refresh_interval=3600, exchange=object())
+    bar = 1_700_000_040  # KST epoch 분 경계
+    store._buffer('KRW-BTC', 'minute1', 10).upsert(np.array([bar]),
+                                                   np.array([[1.0, 1.0, 1.0, 1.0, 0.0]]))
+    market = Market(exchange=object())
+    stream = MarketStream(['KRW-BTC'], candle_store=store, market=market)
+
+    stream.handle(trade('KRW-BTC', 5.0, (bar - KST_OFFSET + 10) * 1000, volume=2.0))
+    stream.handle({'type': 'orderbook', 'code': 'KRW-BTC',
+                   'orderbook_units': [{'ask_price': 5.5, 'bid_price': 4.5}]})
+
+    _, values = store._buffers[('KRW-BTC', 'minute1')].latest(1)
+    assert values[0].tolist() == [1.0, 5.0, 1.0, 5.0, 2.0]
+    assert market.get_current_price('KRW-BTC') == 5.5
+
+def test_stream_receives_subscribed_feed_from_replay_server():
+    messages = synthetic_messages(['KRW-BTC', 'KRW-ETH', 'KRW-XRP'], 300, seed=1)
+    tickers = ['KRW-BTC', 'KRW-ETH']
+    expected = [m for m in messages if m['code'] in tickers]
+
+    async def scenario():
+        server = FakeUpbitServer(messages)
+        stream = MarketStream(tickers, url=await server.start())
+        task = asyncio.create_task(stream.run())
+        try:
+            changed = await asyncio.wait_for(stream.wait_changed(), 5)
+            assert changed <= set(tickers)
+            for _ in range(500):
+                if stream.message_count >= len(expected):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            stream.stop()
+            task.cancel()
+            await server.stop()
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert stream.message_count == len(expected)
+    last = {m['code']: m['trade_price'] for m in expected if m['type'] == 'trade'}
+    assert stream.prices == last
+    assert set(stream.orderbooks) <= set(tickers)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.candle_store import CLOSE
+from src.indicators.streaming import (ATR, EMA, RSI, SMA, Bollinger, Chain, Field, IndicatorFeed,
+                                      Pipeline, RMA, replay)
+
+def candles(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=n)))
+    open_ = np.append(close[0], close[:-1])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, size=n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, size=n))
+    return np.arange(n, dtype=np.int64) * 60, np.column_stack([open_, high, low, close, np.ones(n)])
+
+def seeded_ewm(x, period, alpha):
+    """첫 period개 평균으로 시작하는 지수 평균 (기준 구현)"""
+    out = np.full(len(x), np.nan)
+    out[period - 1] = x[:period].mean()
+    for i in range(period, len(x)):
+        out[i] = out[i - 1] + alpha * (x[i] - out[i - 1])
+    return out
+
+def test_moving_averages_match_reference():
+    _, values = candles(100)
+    close = values[:, CLOSE]
+
+    np.testing.assert_allclose(replay(SMA(10), close), pd.Series(close).rolling(10).mean())
+    np.testing.assert_allclose(replay(EMA(10), close), seeded_ewm(close, 10, 2 / 11))
+    np.testing.assert_allclose(replay(RMA(14), close), seeded_ewm(close, 14, 1 / 14))
+
+def test_atr_and_rsi_match_reference():
+    _, values = candles(100, seed=1)
+    high, low, close = values[:, 1], values[:, 2], values[:, 3]
+    prev = np.append(np.nan, close[:-1])
+    tr = np.nanmax([high - low, np.abs(high - prev), np.abs(low - prev)], axis=0)
+
+    atr = replay(ATR(14), values)
+    np.testing.assert_allclose(atr, seeded_ewm(tr, 14, 1 / 14))
+    assert ATR(14).period == 14
+
+    change = np.diff(close)
+    gain = seeded_ewm(np.maximum(change, 0), 14, 1 / 14)
+    loss = seeded_ewm(np.maximum(-change, 0), 14, 1 / 14)
+    rsi = replay(RSI(14), close)
+    assert np.isnan(rsi[:14]).all()
+    np.testing.assert_allclose(rsi[1:], 100 - 100 / (1 + gain / loss))
+
+def test_bollinger_bands_match_reference():
+    _, values = candles(60, seed=2)
+    close = pd.Series(values[:, CLOSE])
+    bands = replay(Bollinger(20, 2.0), values[:, CLOSE])
+
+    mid, std = close.rolling(20).mean(), close.rolling(20).std(ddof=0)
+    np.testing.assert_allclose(bands[:, 0], mid)
+    np.testing.assert_allclose(bands[:, 1], mid + 2 * std)
+    np.testing.assert_allclose(bands[:, 2], mid - 2 * std)
+
+def test_chain_period_and_readiness():
+    chain = Chain(Field(CLOSE), SMA(5), EMA(3))
+    assert chain.period == 7
+    _, values = candles(10)
+    out = replay(chain, values)
+    assert np.isnan(out[:6]).all() and not np.isnan(out[6:]).any()
+
+def pipeline():
+    return Pipeline(atr=ATR(5), ema=Chain(Field(CLOSE), EMA(4)))
+
+def fresh(timestamps, values):
+    p = pipeline()
+    p.warmup(timestamps, values)
+    return p.values()
+
+def test_feed_incremental_sync_matches_full_warmup():
+    timestamps, values = candles(80, seed=3)
+    feed = IndicatorFeed(pipeline)
+    calls = []
+    feed.factory = lambda: calls.append(1) or pipeline()
+
+    for end in range(30, 81, 7):  # 조회 범위를 옮겨 가며 갱신 (마지막 봉은 진행 중)
+        window = slice(end - 30, end)
+        result = feed.sync('KRW-BTC', timestamps[window], values[window])
+        expected = fresh(timestamps[:end - 1], values[:end - 1])
+        for name, value in result.values().items():
+            assert value == pytest.approx(expected[name])
+
+    assert len(calls) == 1  # 처음 한 번만 전체 초기화
+
+def test_feed_ignores_forming_bar_and_rebuilds_after_gap():
+    timestamps, values = candles(80, seed=4)
+    feed = IndicatorFeed(pipeline)
+    first = feed.sync('KRW-BTC', timestamps[:30], values[:30])
+    before = first.values()
+
+    changed = values[:30].copy()
+    changed[-1] *= 2  # 진행 중인 봉만 바뀜
+    assert feed.sync('KRW-BTC', timestamps[:30], changed).values() == before
+
+    later = feed.sync('KRW-BTC', timestamps[50:80], values[50:80])  # 반영한 봉이 범위 밖
+    assert later is not first
+    assert later.values() == pytest.approx(fresh(timestamps[50:79], values[50:79]))
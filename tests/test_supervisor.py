@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+from src.config.trading_config import CoinConfig
+from src.data.shared_market import SharedCandleStore, SharedMarketData, SharedPrices
+from src.trading.supervisor import SharedMarket, split_shards
+
+TICKERS = ['KRW-BTC', 'KRW-ETH', 'KRW-XRP']
+NEEDS = [('minute60', 8)]
+
+def coins(n):
+    return {f"C{i}": CoinConfig(ticker=f"KRW-C{i}", min_unit=1.0, take_profit=1.5, profit_sell=0.5,
+                                stop_loss=-2.0, partial_stop=-1.2, partial_sell=0.4)
+            for i in range(n)}
+
+def test_split_shards_round_robin():
+    shards = split_shards(coins(5), 2)
+    assert [list(s) for s in shards] == [['C0', 'C2', 'C4'], ['C1', 'C3']]
+    assert len(split_shards(coins(2), 4)) == 2  # 빈 샤드 제외
+
+class PriceExchange:
+    def __init__(self):
+        self.requests = []
+
+    def get_current_prices(self, tickers):
+        self.requests.append(list(tickers))
+        return {t: 1.0 for t in tickers}
+
+@pytest.fixture
+def shared():
+    data = SharedMarketData(f"test_sup_{os.getpid()}", TICKERS, NEEDS, create=True)
+    yield data
+    data.close()
+    data.unlink()
+
+def test_shared_market_reads_feed_prices(shared):
+    shared.prices.write({'KRW-BTC': 100.0, 'KRW-ETH': 10.0})
+    exchange = PriceExchange()
+    market = SharedMarket(exchange, shared.prices, max_age=60)
+
+    prices = market.refresh(['KRW-BTC', 'KRW-ETH', 'KRW-XRP', 'KRW-DOGE'])
+    assert prices == {'KRW-BTC': 100.0, 'KRW-ETH': 10.0, 'KRW-DOGE': 1.0}
+    assert exchange.requests == [['KRW-DOGE']]  # 공유 대상이 아닌 티커만 직접 조회
+
+def test_shared_market_drops_stale_prices(shared, monkeypatch):
+    shared.prices.write({'KRW-BTC': 100.0})
+    market = SharedMarket(PriceExchange(), shared.prices, max_age=60)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 120)  # feed가 2분째 멈춤
+
+    assert market.get_current_prices(['KRW-BTC']) == {}
+
+def _feed(prefix):
+    """다른 프로세스에서 feed 역할로 공유 메모리에 기록"""
+    feed = SharedMarketData(prefix, TICKERS, NEEDS, writer=True)
+    try:
+        feed.prices.write({'KRW-ETH': 2000.0})
+        ts = np.arange(5, dtype=np.int64) * 3600
+        feed.buffer('KRW-ETH', 'minute60').upsert(ts, np.arange(25, dtype=np.float64).reshape(5, 5))
+    finally:
+        feed.close()
+
+def test_worker_reads_what_feed_process_wrote(shared):
+    process = multiprocessing.get_context('spawn').Process(target=_feed, args=(shared.prefix,))
+    process.start()
+    process.join(30)
+    assert process.exitcode == 0
+
+    prices, updated = shared.prices.read()
+    assert prices[TICKERS.index('KRW-ETH')] == 2000.0 and updated > 0
+    timestamps, values = SharedCandleStore(shared).get_candles('KRW-ETH', 'minute60', 3)
+    np.testing.assert_array_equal(timestamps, [7200, 10800, 14400])
+    np.testing.assert_array_equal(values[-1], [20, 21, 22, 23, 24])
+    assert SharedCandleStore(shared).get_candles('KRW-ETH', 'minute1', 3) is None
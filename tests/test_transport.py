@@ -0,0 +1,74 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.api.transport import HttpTransport, LatencyHistogram
+from src.config.trading_config import HttpSettings
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # 연결 유지
+
+    def do_GET(self):
+        body = b'[]'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_requests_reuse_one_pooled_connection(server):
+    transport = HttpTransport(HttpSettings(report_interval=3600))
+    for _ in range(10):
+        assert transport.get(f"{server}/v1/ticker?markets=KRW-BTC").json() == []
+
+    stats = transport.connection_stats()
+    assert stats['connections'] == 1
+    assert stats['requests'] == 10
+    assert transport.histogram.total == 10
+    assert transport.by_path['ticker'].total == 10
+
+def test_configure_replaces_session_and_resets_stats(server):
+    transport = HttpTransport(HttpSettings(report_interval=3600))
+    transport.get(f"{server}/v1/ticker")
+    session = transport.session
+
+    transport.configure(HttpSettings(pool_maxsize=4, report_interval=3600))
+    assert transport.session is not session
+    assert transport.histogram.total == 0
+    transport.get(f"{server}/v1/ticker")
+    assert transport.connection_stats()['connections'] == 1
+
+def test_default_timeout_is_applied(monkeypatch):
+    transport = HttpTransport(HttpSettings(connect_timeout=1.5, read_timeout=4.0))
+    seen = {}
+
+    def request(method, url, **kwargs):
+        seen.update(kwargs)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(transport.session, 'request', request)
+    with pytest.raises(RuntimeError):
+        transport.get('https://api.upbit.com/v1/ticker')
+    assert seen['timeout'] == (1.5, 4.0)
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(bounds=(10, 100))
+    for ms in (1, 2, 3, 50, 500):
+        histogram.add(ms)
+    assert histogram.counts == [3, 1, 1]
+    assert histogram.percentile(0.5) == 10
+    assert histogram.percentile(0.8) == 100
+    assert histogram.percentile(1.0) == float('inf')